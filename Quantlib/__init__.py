@@ -1,7 +1,7 @@
 """
 Main Quantlib package initialization
 """
-from .backtest import run_backtest, PerformanceAnalyzer
+from .backtest import run_backtest, run_many, PerformanceAnalyzer
 from .strategies import (
     SMACrossover,
     RSIReversion, 
@@ -15,6 +15,7 @@ from .data import preprocess_btc_csv, DataProcessor
 
 __all__ = [
     'run_backtest',
+    'run_many',
     'PerformanceAnalyzer',
     'SMACrossover',
     'RSIReversion',
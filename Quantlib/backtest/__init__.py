@@ -1,7 +1,29 @@
 """
 Backtest module initialization
 """
-from .engine import run_backtest
+from .engine import run_backtest, run_many
 from .metrics import PerformanceAnalyzer
+from .report import compute_report, OnlineMetrics
+from .montecarlo import bootstrap_backtest
+from .results_store import ResultStore, run_grid, load_results
+from .optimizer import successive_halving
+from .profiler import BacktestProfiler
+from .portfolio import load_panel, run_portfolio, run_portfolio_backtrader, PricePanel
 
-__all__ = ['run_backtest', 'PerformanceAnalyzer']
\ No newline at end of file
+__all__ = [
+    'run_backtest',
+    'run_many',
+    'PerformanceAnalyzer',
+    'compute_report',
+    'OnlineMetrics',
+    'bootstrap_backtest',
+    'ResultStore',
+    'run_grid',
+    'load_results',
+    'successive_halving',
+    'load_panel',
+    'run_portfolio',
+    'run_portfolio_backtrader',
+    'PricePanel',
+    'BacktestProfiler'
+]
@@ -1,14 +1,23 @@
 import backtrader as bt
 import datetime
+from Quantlib.data.resample import bt_timeframe
 
 class CSVDataLoader:
     @staticmethod
-    def load(filepath):
+    def load(filepath, timeframe='1d'):
+        """
+        Load an OHLCV CSV as a backtrader feed
+
+        Args:
+            filepath: Path to the CSV
+            timeframe: Bar interval of the file, e.g. '1m', '1h', '1d'
+        """
+        bt_frame, compression = bt_timeframe(timeframe)
         return bt.feeds.GenericCSVData(
             dataname=filepath,
             dtformat='%Y-%m-%d %H:%M:%S',
-            timeframe=bt.TimeFrame.Days,
-            compression=1,
+            timeframe=bt_frame,
+            compression=compression,
             datetime=0,
             open=1,
             high=2,
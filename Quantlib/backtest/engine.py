@@ -2,6 +2,9 @@ import backtrader as bt
 import pandas as pd
 import numpy as np
 from .metrics import PerformanceAnalyzer
+from Quantlib.data.validate import is_validated, load_validated
+from .profiler import BacktestProfiler
+from Quantlib.strategies.base_strategy import BaseStrategy
 
 class SignalRecorder(bt.Analyzer):
     def __init__(self):
@@ -100,8 +103,43 @@ class SignalRecorder(bt.Analyzer):
             return pd.DataFrame(columns=['datetime', 'price', 'size', 'pnl', 'commission', 'pnlcomm', 'type', 'signal'])
         return pd.DataFrame(self.trades)
 
+class EquityRecorder(bt.Analyzer):
+    """Record the broker's marked-to-market portfolio value on every bar"""
+
+    def __init__(self):
+        super(EquityRecorder, self).__init__()
+        self.datetimes = []
+        self.values = []
+
+    def next(self):
+        self.datetimes.append(self.strategy.datetime.datetime(0))
+        self.values.append(self.strategy.broker.getvalue())
+
+    def get_analysis(self):
+        index = pd.DatetimeIndex(self.datetimes, name='datetime')
+        return pd.Series(self.values, index=index, dtype=float, name='equity')
+
+class ClosedTradeRecorder(bt.Analyzer):
+    """Record the broker's P&L of every closed round trip"""
+
+    def __init__(self):
+        super(ClosedTradeRecorder, self).__init__()
+        self.trades = []
+
+    def notify_trade(self, trade):
+        if trade.isclosed:
+            self.trades.append({
+                'datetime': self.strategy.datetime.datetime(0),
+                'pnl': trade.pnl,
+                'pnlcomm': trade.pnlcomm,
+                'commission': trade.commission
+            })
+
+    def get_analysis(self):
+        return pd.DataFrame(self.trades, columns=['datetime', 'pnl', 'pnlcomm', 'commission'])
+
 class PerformanceSummary:
-    def __init__(self, metrics):
+    def __init__(self, metrics, equity_curve=None, trades=None):
         self.initial_capital = metrics['initial_capital']
         self.final_capital = metrics['final_capital']
         self.total_return = metrics['total_return']
@@ -112,6 +150,9 @@ class PerformanceSummary:
         self.avg_profit = metrics['avg_profit']
         self.avg_loss = metrics['avg_loss']
         self.total_commission = metrics['total_commission']
+        # Optional per-bar equity and trade log (populated by run_many)
+        self.equity_curve = equity_curve
+        self.trades = trades
     
     def print_all(self):
         print("\n=== Performance Summary ===")
@@ -127,34 +168,65 @@ class PerformanceSummary:
         print(f"Total Commission Paid: ${self.total_commission:.2f}")
         print("========================\n")
 
-def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None):
+def load_price_data(data_path):
     """
-    Run backtest with strategy parameters
+    Load an OHLCV CSV into a DataFrame ready for a backtrader feed
     
     Args:
-        strategy_class: Strategy class to run
-        data_path: Path to data file
-        cash: Initial cash amount
-        plot: Whether to plot results
-        kwargs: Additional strategy parameters including:
-            - trade_size: Position size as fraction of portfolio
-            - commission_scheme: Dictionary with commission settings
-            - slippage_scheme: Dictionary with slippage settings
-            
+        data_path: Path to data file (or an already loaded DataFrame)
+        
+    Datasets cleaned by Quantlib.data.validate_dataset (or frames that
+    still match the fingerprint it stamped) are already normalized and
+    sorted, and are returned without redoing that work.
+    
     Returns:
-        tuple: (df, trades_df, performance_summary) where:
-            - df: DataFrame with backtest results
-            - trades_df: DataFrame with trade details
-            - performance_summary: PerformanceSummary object containing metrics
+        DataFrame with lower-cased columns sorted by a parsed 'datetime' column
     """
-    df = pd.read_csv(data_path)
+    if isinstance(data_path, pd.DataFrame):
+        df = data_path.copy()
+        if is_validated(df):
+            return df
+    else:
+        df = load_validated(data_path)
+        if df is not None:
+            return df
+        df = pd.read_csv(data_path)
     df.columns = [col.strip().lower() for col in df.columns]
-    # print(df.columns)
     
     # Convert datetime column
     df['datetime'] = pd.to_datetime(df['datetime'])
     df = df.sort_values(by="datetime")
+    return df
+
+class _SharedFeedCerebro(bt.Cerebro):
+    """
+    Cerebro whose feeds are preloaded by the first run and reused by later ones
 
+    Later runs go through runstrategies(predata=True), the path Cerebro uses
+    to hand preloaded feeds to optimization workers (optdatas); in-process
+    the feeds only need rewinding between runs. Every run restarts the
+    broker, so each strategy still starts from the initial cash.
+    """
+
+    _preloaded = False
+
+    def runstrategies(self, iterstrat, predata=False):
+        if not (self._dopreload and self._dorunonce):
+            return super().runstrategies(iterstrat, predata)
+        if not self._preloaded:
+            for data in self.datas:
+                data.reset()
+                if self._exactbars < 1:
+                    data.extend(size=self.params.lookahead)
+                data._start()
+                data.preload()
+            self._preloaded = True
+        for data in self.datas:
+            data.home()
+        return super().runstrategies(iterstrat, predata=True)
+
+def _build_cerebro(df, cash, commission_scheme=None, slippage_scheme=None, cerebro_class=bt.Cerebro):
+    """Create a Cerebro with a PandasData feed over df and configured broker"""
     # Create PandasData feed with explicit datetime column
     data = bt.feeds.PandasData(
         dataname=df,
@@ -167,37 +239,75 @@ def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None
         openinterest=-1
     )
     
-    cerebro = bt.Cerebro(stdstats=False)
+    cerebro = cerebro_class(stdstats=False)
     cerebro.adddata(data)
+    _configure_broker(cerebro, cash, commission_scheme, slippage_scheme)
+    return cerebro
+
+def _configure_broker(cerebro, cash, commission_scheme=None, slippage_scheme=None):
+    """Apply commission, slippage and starting cash to a Cerebro's broker"""
+    # Handle broker settings first
+    if commission_scheme:
+        cerebro.broker.setcommission(**commission_scheme)
+    
+    if slippage_scheme:
+        if 'slip_perc' in slippage_scheme:
+            cerebro.broker.set_slippage_perc(slippage_scheme['slip_perc'])
+        if 'slip_fixed' in slippage_scheme:
+            cerebro.broker.set_slippage_fixed(slippage_scheme['slip_fixed'])
     
+    cerebro.broker.set_cash(cash)
+
+def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None, profile=None):
+    """
+    Run backtest with strategy parameters
+    
+    Args:
+        strategy_class: Strategy class to run
+        data_path: Path to data file
+        cash: Initial cash amount
+        plot: Whether to plot results
+        kwargs: Additional strategy parameters including:
+            - trade_size: Position size as fraction of portfolio
+            - commission_scheme: Dictionary with commission settings
+            - slippage_scheme: Dictionary with slippage settings
+        profile: True or a BacktestProfiler to record per-stage wall time and
+            memory; the report is attached as performance_summary.profile
+            
+    Returns:
+        tuple: (df, trades_df, performance_summary) where:
+            - df: DataFrame with backtest results
+            - trades_df: DataFrame with trade details
+            - performance_summary: PerformanceSummary object containing metrics
+    """
+    profiler = profile if isinstance(profile, BacktestProfiler) else BacktestProfiler() if profile else None
+    _begin(profiler, 'load')
+    df = load_price_data(data_path)
+
     # Extract broker settings from kwargs
     if kwargs is None:
         kwargs = {}
-    
-    # Handle broker settings first
-    if 'commission_scheme' in kwargs:
-        comm_scheme = kwargs.pop('commission_scheme')
-        cerebro.broker.setcommission(**comm_scheme)
-    
-    if 'slippage_scheme' in kwargs:
-        slip_scheme = kwargs.pop('slippage_scheme')
-        if 'slip_perc' in slip_scheme:
-            cerebro.broker.set_slippage_perc(slip_scheme['slip_perc'])
-        if 'slip_fixed' in slip_scheme:
-            cerebro.broker.set_slippage_fixed(slip_scheme['slip_fixed'])
-    
+    commission_scheme = kwargs.pop('commission_scheme', None)
+    slippage_scheme = kwargs.pop('slippage_scheme', None)
+
+    _begin(profiler, 'cerebro_setup')
+    cerebro = _build_cerebro(df, cash, commission_scheme, slippage_scheme)
+
     # Add strategy with remaining parameters
+    if profiler is not None and issubclass(strategy_class, BaseStrategy):
+        kwargs = {**kwargs, 'profiler': profiler}
     cerebro.addstrategy(strategy_class, **kwargs)
-    
-    cerebro.broker.set_cash(cash)
     cerebro.addanalyzer(SignalRecorder, _name='signals')
 
+    _begin(profiler, 'cerebro_run')
     result = cerebro.run()
     strat = result[0]
 
+    _begin(profiler, 'analyzer')
     equity = cerebro.broker.get_value()
     trades_df = strat.analyzers.signals.get_analysis()
     trades_df.to_csv('data/trades_df.csv')
+    _begin(profiler, 'equity')
     if len(trades_df) > 0:
         # For buy-and-hold strategies, we need to handle the equity curve differently
         if len(trades_df) == 1:  # Likely a buy-and-hold strategy
@@ -278,6 +388,7 @@ def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None
     # df['signal_price'] = None  # Initialize price column
     # df.loc[df['signal'] != 0, 'signal_price'] = df.loc[df['signal'] != 0, 'close']
 
+    _begin(profiler, 'merge')
     # 先生成 signal 列
     trades_df['signal'] = trades_df['type'].map({'buy': 1, 'sell': -1})
 
@@ -295,6 +406,7 @@ def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None
 
 
     # Calculate performance metrics using PerformanceAnalyzer
+    _begin(profiler, 'metrics')
     if len(trades_df) == 1:  # For buy-and-hold strategy, get the actual final value
         initial_value = cash
         final_value = float(equity)  # Use the broker's final portfolio value
@@ -341,8 +453,146 @@ def run_backtest(strategy_class, data_path, cash=100000, plot=False, kwargs=None
         'total_commission': total_commission
     })
 
+    if profiler is not None:
+        profiler.close()
+        # Feeds are preloaded inside Cerebro.run before the strategy is created
+        profiler.split_stage('cerebro_run', 'strategy_init', 'feed_preload', 'strategy_run')
+        performance_summary.profile = profiler.report()
+
     return df, trades_df, performance_summary
 
+def _begin(profiler, stage):
+    """Start a profiling stage when run_backtest is profiled"""
+    if profiler is not None:
+        profiler.begin(stage)
+
+def _strategy_spec(spec):
+    """Normalize a run_many strategy entry into (strategy_class, params)"""
+    if isinstance(spec, dict):
+        return spec['class'], dict(spec.get('params', {}))
+    if isinstance(spec, (tuple, list)):
+        strategy_class, params = spec
+        return strategy_class, dict(params or {})
+    return spec, {}
+
+def _summarize(equity_curve, trades_df, cash, closed_trades=None):
+    """
+    Build a PerformanceSummary from a per-bar equity curve and trade log
+    
+    Win rate and average profit/loss come from closed_trades (one row per
+    round trip with 'pnlcomm') when given, otherwise from the 'pnlcomm' of
+    the trade log rows. With fills but no closed round trip (a position held
+    to the end) the mark-to-market result counts as the one trade.
+    """
+    final_value = float(equity_curve.iloc[-1]) if len(equity_curve) > 0 else float(cash)
+    total_return = (final_value - cash) / cash
+    
+    analyzer = PerformanceAnalyzer()
+    returns = equity_curve.pct_change().dropna()
+    sharpe_ratio = analyzer.sharpe_ratio(returns)
+    max_drawdown = analyzer.max_drawdown(equity_curve)
+    
+    total_trades = len(trades_df)
+    if closed_trades is not None:
+        pnl = closed_trades['pnlcomm']
+    else:
+        # A single fill is a position held to the end, judged on its mark-to-market result
+        pnl = trades_df['pnlcomm'] if total_trades > 1 else pd.Series(dtype=float)
+    if total_trades > 0:
+        if len(pnl) > 0:
+            winners = pnl[pnl > 0]
+            losers = pnl[pnl < 0]
+            win_rate = len(winners) / len(pnl)
+            avg_won = winners.mean() if len(winners) > 0 else 0
+            avg_lost = losers.mean() if len(losers) > 0 else 0
+        else:
+            result = final_value - cash
+            win_rate = float(result > 0)
+            avg_won = max(result, 0)
+            avg_lost = min(result, 0)
+        total_commission = trades_df['commission'].sum()
+    else:
+        win_rate = 0
+        avg_won = 0
+        avg_lost = 0
+        total_commission = 0
+    
+    return PerformanceSummary(metrics={
+        'initial_capital': cash,
+        'final_capital': final_value,
+        'total_return': total_return,
+        'sharpe_ratio': sharpe_ratio,
+        'max_drawdown': max_drawdown,
+        'total_trades': total_trades,
+        'win_rate': win_rate,
+        'avg_profit': avg_won,
+        'avg_loss': avg_lost,
+        'total_commission': total_commission
+    }, equity_curve=equity_curve, trades=trades_df)
+
+def run_many(strategies, data, cash=100000, commission_scheme=None, slippage_scheme=None):
+    """
+    Run several strategies (or parameter sets) against one preloaded feed
+    
+    The CSV is parsed and sorted once and the backtrader feed is preloaded
+    once; every strategy then runs in-process on that feed with a freshly
+    reset broker.
+    
+    Metrics are taken from the broker: equity is its marked-to-market value
+    on every bar, and win rate and average profit/loss come from the round
+    trips it closed (net of commission). total_trades counts fills, as in
+    run_backtest. The numbers therefore differ from run_backtest, whose
+    equity curve is cash plus SignalRecorder's buy/sell pair P&L stepped in
+    at fill dates: flat between trades, blind to open positions and wrong
+    for strategies that buy several times before selling (it pairs a sell
+    with the last buy only). Use run_many when strategies are compared or
+    optimized against each other.
+    
+    Args:
+        strategies: Dict of name -> strategy spec, where a spec is a strategy
+            class, a (strategy_class, params) tuple or a dict with 'class'
+            and 'params' keys. A list of specs is also accepted and keyed by
+            class name; repeated classes get a _2, _3, ... suffix.
+        data: Path to data file or a DataFrame with OHLCV and 'datetime'
+        cash: Initial cash amount for every strategy
+        commission_scheme: Dictionary with commission settings shared by all runs
+        slippage_scheme: Dictionary with slippage settings shared by all runs
+        
+    Returns:
+        dict: name -> PerformanceSummary with equity_curve and trades attached
+    """
+    if not isinstance(strategies, dict):
+        named = {}
+        for spec in strategies:
+            base = _strategy_spec(spec)[0].__name__
+            name, n = base, 1
+            while name in named:
+                n += 1
+                name = f"{base}_{n}"
+            named[name] = spec
+        strategies = named
+    
+    df = load_price_data(data)
+    cerebro = _build_cerebro(df, cash, commission_scheme, slippage_scheme, cerebro_class=_SharedFeedCerebro)
+    cerebro.addanalyzer(SignalRecorder, _name='signals')
+    cerebro.addanalyzer(EquityRecorder, _name='equity')
+    cerebro.addanalyzer(ClosedTradeRecorder, _name='closed')
+    
+    summaries = {}
+    for name, spec in strategies.items():
+        strategy_class, params = _strategy_spec(spec)
+        
+        # One strategy per run on the shared Cerebro; the feed is preloaded only once
+        cerebro.strats = []
+        cerebro.addstrategy(strategy_class, **params)
+        strat = cerebro.run()[0]
+        equity_curve = strat.analyzers.equity.get_analysis()
+        trades_df = strat.analyzers.signals.get_analysis()
+        closed_trades = strat.analyzers.closed.get_analysis()
+        summaries[name] = _summarize(equity_curve, trades_df, cash, closed_trades)
+    
+    return summaries
+
 def run_buy_and_hold(self, df, cash):
     """Run a buy and hold strategy."""
     trades = []
@@ -3,44 +3,61 @@ import pandas as pd
 
 class PerformanceAnalyzer:
     @staticmethod
-    def compute_equity_curve(trade_history, initial_cash):
+    def compute_equity_curve(trade_history, initial_cash, prices=None):
         """
         Compute equity curve from trade history
         
+        Trade types are matched case-insensitively, so both the 'BUY'/'SELL'
+        convention and SignalRecorder's 'buy'/'sell' are accepted. Sizes are
+        signed by side and accumulated into a position, cash flows (including
+        commission) are accumulated into cash, and equity is cash plus
+        position marked at price.
+        
         Args:
             trade_history: DataFrame with columns ['datetime', 'type', 'price', 'size', 'commission']
             initial_cash: Initial capital
+            prices: Optional Series of close prices indexed by datetime. When
+                given, the curve is marked to market on every bar of this
+                series instead of only at trade rows.
             
         Returns:
             DataFrame with equity curve
         """
         df = trade_history.copy()
-        df['cash'] = initial_cash
-        position = 0
-        cash = initial_cash
-        position_value = 0
-        equity = []
-
-        for i, row in df.iterrows():
-            if row['type'] == 'BUY':
-                cost = row['price'] * row['size'] + row['commission']
-                position += row['size']
-                cash -= cost
-            elif row['type'] == 'SELL' and position > 0:
-                proceeds = row['price'] * row['size'] - row['commission']
-                position -= row['size']
-                cash += proceeds
-            
-            # Calculate current position value
-            position_value = position * row['price'] if position > 0 else 0
-            # Total equity is cash plus position value
-            current_equity = cash + position_value
-            equity.append(current_equity)
-
-        df['equity'] = equity
-        df['position_value'] = position_value
-        df['cash'] = cash
-        return df
+        side = df['type'].astype(str).str.lower().map({'buy': 1.0, 'sell': -1.0}).fillna(0.0).to_numpy()
+        size = df['size'].to_numpy(dtype=float)
+        price = df['price'].to_numpy(dtype=float)
+        commission = df['commission'].to_numpy(dtype=float) if 'commission' in df.columns else np.zeros(len(df))
+        # Rows with an unknown type are not trades and pay no commission
+        commission = np.where(side != 0, commission, 0.0)
+        
+        signed_size = side * size
+        position = np.cumsum(signed_size)
+        cash = initial_cash + np.cumsum(-signed_size * price - commission)
+        
+        if prices is None:
+            df['position'] = position
+            df['cash'] = cash
+            df['position_value'] = position * price
+            df['equity'] = df['cash'] + df['position_value']
+            return df
+        
+        # Collapse trades to one state per timestamp, then carry it onto the price bars
+        state = pd.DataFrame(
+            {'position': position, 'cash': cash},
+            index=pd.to_datetime(df['datetime'])
+        )
+        state = state[~state.index.duplicated(keep='last')].sort_index()
+        bar_index = pd.DatetimeIndex(prices.index)
+        state = state.reindex(state.index.union(bar_index)).ffill().reindex(bar_index)
+        
+        curve = pd.DataFrame(index=prices.index)
+        curve['price'] = prices.to_numpy(dtype=float)
+        curve['position'] = state['position'].fillna(0.0).to_numpy()
+        curve['cash'] = state['cash'].fillna(float(initial_cash)).to_numpy()
+        curve['position_value'] = curve['position'] * curve['price']
+        curve['equity'] = curve['cash'] + curve['position_value']
+        return curve
 
     @staticmethod
     def max_drawdown(equity_curve):
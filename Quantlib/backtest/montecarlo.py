@@ -0,0 +1,176 @@
+"""
+Bootstrap / Monte Carlo robustness analysis for backtest results
+
+Returns (or per-trade PnL) are resampled with a circular moving-block
+bootstrap so that short-range autocorrelation survives resampling. All
+resamples of a batch are drawn as one index matrix and evaluated with
+array operations along axis 1; batches can be spread over processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+METRICS = ['sharpe_ratio', 'max_drawdown', 'final_equity', 'total_return']
+
+
+def _block_indices(rng, n, n_samples, block_size):
+    """Index matrix (n_samples, n) for a circular moving-block bootstrap"""
+    block_size = max(1, min(block_size, n))
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_samples, n_blocks))
+    idx = starts[:, :, None] + np.arange(block_size)
+    return idx.reshape(n_samples, -1)[:, :n] % n
+
+
+def _path_metrics(equity, initial_capital, periods_per_year, risk_free_rate):
+    """Sharpe, max drawdown and final equity for each row of an equity matrix"""
+    paths = np.concatenate([np.full((equity.shape[0], 1), float(initial_capital)), equity], axis=1)
+    returns = paths[:, 1:] / paths[:, :-1] - 1
+
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1) if returns.shape[1] > 1 else np.zeros(len(returns))
+    ann_return = (1 + mean) ** periods_per_year - 1
+    ann_vol = std * np.sqrt(periods_per_year)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(ann_vol != 0, (ann_return - risk_free_rate) / ann_vol, 0.0)
+
+    peak = np.maximum.accumulate(paths, axis=1)
+    max_dd = ((paths - peak) / peak).min(axis=1)
+
+    final = paths[:, -1]
+    return {
+        'sharpe_ratio': sharpe,
+        'max_drawdown': max_dd,
+        'final_equity': final,
+        'total_return': final / initial_capital - 1
+    }
+
+
+def _run_batch(args):
+    """Evaluate one batch of resamples (module-level so it can be pickled)"""
+    values, mode, n_samples, block_size, initial_capital, periods_per_year, risk_free_rate, seed = args
+    rng = np.random.default_rng(seed)
+    idx = _block_indices(rng, len(values), n_samples, block_size)
+    sampled = values[idx]
+    if mode == 'returns':
+        equity = initial_capital * np.cumprod(1 + sampled, axis=1)
+    else:
+        equity = initial_capital + np.cumsum(sampled, axis=1)
+    return _path_metrics(equity, initial_capital, periods_per_year, risk_free_rate)
+
+
+def _bootstrap(values, mode, initial_capital, n_samples=5000, block_size=10, confidence=0.95,
+               periods_per_year=365, risk_free_rate=0.02, n_jobs=1, batch_size=1000, seed=None):
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        raise ValueError("Need at least two observations to bootstrap")
+
+    # Independent child seeds per batch keep results identical for any n_jobs
+    sizes = [batch_size] * (n_samples // batch_size)
+    if n_samples % batch_size:
+        sizes.append(n_samples % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    batches = [
+        (values, mode, size, block_size, initial_capital, periods_per_year, risk_free_rate, s)
+        for size, s in zip(sizes, seeds)
+    ]
+
+    if n_jobs == 1 or len(batches) == 1:
+        results = [_run_batch(b) for b in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+            results = list(pool.map(_run_batch, batches))
+
+    samples = {m: np.concatenate([r[m] for r in results]) for m in METRICS}
+
+    # Observed metrics from the original, unshuffled sequence
+    if mode == 'returns':
+        observed_equity = initial_capital * np.cumprod(1 + values)
+    else:
+        observed_equity = initial_capital + np.cumsum(values)
+    observed = _path_metrics(observed_equity[None, :], initial_capital, periods_per_year, risk_free_rate)
+
+    alpha = (1 - confidence) / 2
+    summary = pd.DataFrame({
+        'observed': [observed[m][0] for m in METRICS],
+        'mean': [samples[m].mean() for m in METRICS],
+        'std': [samples[m].std() for m in METRICS],
+        'lower': [np.quantile(samples[m], alpha) for m in METRICS],
+        'upper': [np.quantile(samples[m], 1 - alpha) for m in METRICS]
+    }, index=METRICS)
+    summary.attrs['samples'] = samples
+    summary.attrs['prob_loss'] = float((samples['final_equity'] < initial_capital).mean())
+    return summary
+
+
+def bootstrap_returns(returns, initial_capital=100000, **kwargs):
+    """
+    Block-bootstrap a series of per-bar returns
+
+    Args:
+        returns: Array-like of per-bar returns
+        initial_capital: Starting equity of every resampled path
+        **kwargs: n_samples, block_size, confidence, periods_per_year,
+            risk_free_rate, n_jobs (-1 for all cores), batch_size, seed
+
+    Returns:
+        DataFrame indexed by metric (sharpe_ratio, max_drawdown, final_equity,
+        total_return) with columns observed, mean, std, lower, upper. The raw
+        resampled metrics are in .attrs['samples'] and the probability of
+        ending below initial capital in .attrs['prob_loss'].
+    """
+    return _bootstrap(returns, 'returns', initial_capital, **kwargs)
+
+
+def bootstrap_trades(pnl, initial_capital=100000, **kwargs):
+    """
+    Block-bootstrap a sequence of per-trade PnL (e.g. trades_df['pnlcomm'])
+
+    Metrics are computed on the trade-by-trade equity path, so the Sharpe
+    ratio is per trade annualized with periods_per_year. Takes the same
+    keyword arguments and returns the same frame as bootstrap_returns.
+    """
+    return _bootstrap(pnl, 'trades', initial_capital, **kwargs)
+
+
+def bootstrap_backtest(df, trades_df=None, method='returns', **kwargs):
+    """
+    Monte Carlo analysis of a run_backtest result
+
+    Args:
+        df: Results DataFrame returned by run_backtest (needs 'equity')
+        trades_df: Trades DataFrame returned by run_backtest, required
+            when method='trades'
+        method: 'returns' to resample bar returns of the equity curve,
+            'trades' to resample the trade PnL sequence
+        **kwargs: Passed to bootstrap_returns / bootstrap_trades
+
+    Returns:
+        DataFrame of confidence intervals, see bootstrap_returns
+    """
+    initial_capital = float(df['equity'].iloc[0])
+    if method == 'returns':
+        returns = df['equity'].pct_change().dropna().to_numpy()
+        return bootstrap_returns(returns, initial_capital=initial_capital, **kwargs)
+    if method == 'trades':
+        if trades_df is None:
+            raise ValueError("trades_df is required for method='trades'")
+        return bootstrap_trades(trades_df['pnlcomm'].to_numpy(), initial_capital=initial_capital, **kwargs)
+    raise ValueError(f"Unknown method: {method}. Use 'returns' or 'trades'")
+
+
+def ci_columns(summary):
+    """
+    Flatten a bootstrap summary into one dict, e.g. for a sweep results row
+
+    Returns:
+        dict like {'sharpe_ratio_mc_lower': ..., 'sharpe_ratio_mc_upper': ..., ...}
+    """
+    row = {}
+    for metric, stats in summary.iterrows():
+        row[f'{metric}_mc_mean'] = float(stats['mean'])
+        row[f'{metric}_mc_lower'] = float(stats['lower'])
+        row[f'{metric}_mc_upper'] = float(stats['upper'])
+    row['mc_prob_loss'] = summary.attrs.get('prob_loss')
+    return row
@@ -0,0 +1,156 @@
+"""
+Successive-halving parameter search for backtest strategies
+
+Instead of enumerating the full Cartesian grid, a random sample of
+configurations is evaluated on a short leading window of the data; only the
+best 1/eta survive to the next rung, which uses an eta-times longer window,
+until the survivors are evaluated on the full history. Trials of a rung run
+in a process pool and every finished trial is appended to a ResultStore
+immediately, so an interrupted search resumes where it stopped.
+"""
+import json
+import math
+import numpy as np
+import pandas as pd
+from .engine import load_price_data
+from .results_store import ResultStore, params_key, run_signature, run_trials, _to_native
+
+
+def sample_configurations(space, n_trials, constraint=None, seed=None, max_attempts=100):
+    """
+    Draw distinct parameter sets from a search space without building the grid
+
+    Args:
+        space: Dict of param name -> sequence of candidate values
+        n_trials: Number of configurations to draw
+        constraint: Optional callable(params) -> bool to reject invalid sets
+        seed: Random seed
+        max_attempts: Give up after n_trials * max_attempts draws
+
+    Returns:
+        list of param dicts
+    """
+    rng = np.random.default_rng(seed)
+    names = list(space)
+    values = [list(space[name]) for name in names]
+    grid_size = math.prod(len(v) for v in values)
+    n_trials = min(n_trials, grid_size)
+
+    seen = set()
+    configs = []
+    attempts = 0
+    while len(configs) < n_trials and attempts < n_trials * max_attempts:
+        attempts += 1
+        params = {name: _to_native(v[rng.integers(len(v))]) for name, v in zip(names, values)}
+        key = json.dumps(params, sort_keys=True)
+        if key in seen or (constraint is not None and not constraint(params)):
+            continue
+        seen.add(key)
+        configs.append(params)
+    return configs
+
+
+class _MemoryStore:
+    """Stand-in for ResultStore when no results directory is given"""
+
+    def append(self, key, params, metrics, info=None, error=None):
+        pass
+
+
+def successive_halving(strategy_class, data_path, space, objective='sharpe_ratio', n_trials=64,
+                       eta=3, min_fraction=0.2, constraint=None, fixed_params=None, cash=100000,
+                       commission_scheme=None, slippage_scheme=None, n_jobs=1, results_dir=None,
+                       seed=None, retry_errors=False):
+    """
+    Optimize strategy parameters with successive halving over data windows
+
+    Args:
+        strategy_class: Strategy class to optimize
+        data_path: Path to data file or a DataFrame with OHLCV and 'datetime'
+        space: Dict of param name -> sequence of candidate values,
+            e.g. {'rsi_period': range(5, 31, 5), 'bb_devfactor': [1.5, 2.0]}
+        objective: PerformanceSummary attribute to maximize
+        n_trials: Configurations sampled for the first rung
+        eta: Keep the best 1/eta of trials per rung and grow the window eta times
+        min_fraction: Fraction of the history (leading bars) used by the first rung
+        constraint: Optional callable(params) -> bool rejecting invalid combinations
+        fixed_params: Strategy params shared by all trials (e.g. trade_size)
+        cash: Initial cash amount
+        commission_scheme: Dictionary with commission settings
+        slippage_scheme: Dictionary with slippage settings
+        n_jobs: Worker processes per rung (-1 for all cores)
+        results_dir: Directory of a ResultStore every finished trial is
+            appended to; trials already in it are not re-run. Without it
+            results are kept in memory only.
+        seed: Random seed for sampling configurations
+        retry_errors: Re-run trials stored as failed in results_dir (failed
+            trials otherwise rank last)
+
+    Raises:
+        ValueError: If eta <= 1, min_fraction is outside (0, 1] or the
+            search space yields no valid configuration
+
+    Returns:
+        tuple: (best_params, results_df) where results_df holds every trial
+            with its rung, data fraction and metrics
+    """
+    if eta <= 1:
+        raise ValueError(f"eta must be greater than 1, got {eta}")
+    if not 0 < min_fraction <= 1:
+        raise ValueError(f"min_fraction must be in (0, 1], got {min_fraction}")
+
+    df = load_price_data(data_path)
+    fixed_params = fixed_params or {}
+    store = ResultStore(results_dir, worker_id='halving') if results_dir else None
+    run = run_signature(strategy_class, df, fixed_params, cash, commission_scheme, slippage_scheme)
+
+    def trial_key(params, fraction):
+        return params_key(params, fraction=round(fraction, 6), run=run)
+
+    configs = sample_configurations(space, n_trials, constraint=constraint, seed=seed)
+    if not configs:
+        raise ValueError("Search space produced no valid configurations")
+
+    fractions = []
+    fraction = min_fraction
+    while fraction < 1.0:
+        fractions.append(fraction)
+        fraction *= eta
+    fractions.append(1.0)
+
+    rows = []
+    for rung, fraction in enumerate(fractions):
+        window = df.iloc[:max(2, int(len(df) * fraction))]
+
+        done = store.metrics_by_key(include_errors=not retry_errors) if store else {}
+        scores = {}
+        tasks = []
+        for params in configs:
+            key = trial_key(params, fraction)
+            if key in done:
+                scores[key] = done[key]
+            else:
+                args = (strategy_class, params, fixed_params, window, cash, commission_scheme, slippage_scheme)
+                tasks.append((key, params, args, {'rung': rung, 'fraction': fraction, 'run': run}))
+
+        if tasks:
+            scores.update(run_trials(store or _MemoryStore(), tasks, n_jobs=n_jobs))
+
+        def score(params):
+            value = scores[trial_key(params, fraction)].get(objective)
+            return -np.inf if value is None or np.isnan(value) else value
+
+        ranked = sorted(configs, key=score, reverse=True)
+        for params in ranked:
+            metrics = scores[trial_key(params, fraction)]
+            rows.append({'rung': rung, 'fraction': fraction, **params, **metrics})
+
+        if rung < len(fractions) - 1:
+            configs = ranked[:max(1, len(ranked) // eta)]
+        else:
+            configs = ranked
+
+    if store:
+        store.close()
+    results_df = pd.DataFrame(rows)
+    return configs[0], results_df
@@ -0,0 +1,319 @@
+"""
+Multi-asset portfolio backtesting on an aligned price panel
+
+load_panel() aligns N symbols onto one shared clock, once, with NumPy: the
+union of all timestamps becomes the index, every field becomes a
+(bars x symbols) array, and missing bars are forward-filled with a single
+index-propagation pass. The panel can then be run through
+
+- run_portfolio(): a vectorized target-weight engine (equity between
+  rebalances is one matrix product per segment), or
+- run_portfolio_backtrader(): backtrader with one feed per symbol on the
+  same clock, for strategies written against bt.Strategy.
+"""
+import backtrader as bt
+import numpy as np
+import pandas as pd
+from .engine import EquityRecorder, _configure_broker, _summarize, load_price_data
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class PricePanel:
+    """
+    Aligned OHLCV arrays of several symbols
+
+    Attributes:
+        index: DatetimeIndex shared by all symbols
+        symbols: List of symbols (column order of every array)
+        fields: Dict of field -> np.ndarray of shape (bars, symbols)
+        present: Boolean array, True where the symbol had a real bar
+    """
+
+    def __init__(self, index, symbols, fields, present):
+        self.index = index
+        self.symbols = list(symbols)
+        self.fields = fields
+        self.present = present
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def close(self):
+        return self.fields['close']
+
+    def frame(self, field='close'):
+        """One field as a DataFrame (bars x symbols)"""
+        return pd.DataFrame(self.fields[field], index=self.index, columns=self.symbols)
+
+    def symbol_frame(self, symbol):
+        """OHLCV of one symbol as a DataFrame with a 'datetime' column"""
+        j = self.symbols.index(symbol)
+        df = pd.DataFrame({field: values[:, j] for field, values in self.fields.items()})
+        df.insert(0, 'datetime', self.index)
+        return df
+
+    def returns(self):
+        """Simple close-to-close returns (first bar and unlisted bars are NaN)"""
+        close = self.close
+        out = np.full_like(close, np.nan)
+        out[1:] = close[1:] / close[:-1] - 1
+        return out
+
+    def slice(self, start=None, end=None):
+        """Panel restricted to timestamps in [start, end]"""
+        i = self.index.searchsorted(pd.Timestamp(start)) if start is not None else 0
+        j = self.index.searchsorted(pd.Timestamp(end), side='right') if end is not None else len(self)
+        return PricePanel(self.index[i:j], self.symbols,
+                          {k: v[i:j] for k, v in self.fields.items()}, self.present[i:j])
+
+    def common(self):
+        """Panel sliced to start at the first bar where every symbol has a price"""
+        listed = ~np.isnan(self.close).any(axis=1)
+        if not listed.any():
+            return self.slice(start=self.index[-1] + pd.Timedelta(1, 'ns'))
+        return self.slice(start=self.index[int(np.argmax(listed))])
+
+
+def _forward_fill(values, present):
+    """Forward-fill rows where present is False, column by column, in one pass"""
+    n = values.shape[0]
+    last = np.where(present, np.arange(n)[:, None], -1)
+    np.maximum.accumulate(last, axis=0, out=last)
+    filled = np.take_along_axis(values, np.maximum(last, 0), axis=0)
+    filled[last < 0] = np.nan
+    return filled
+
+
+def load_panel(sources, fields=FIELDS, fill=True):
+    """
+    Load several symbols into one aligned panel
+
+    Args:
+        sources: Dict of symbol -> CSV path or DataFrame (see load_price_data)
+        fields: Columns to load
+        fill: Fill missing bars: close is carried forward, open/high/low
+            are set to that close and volume to 0 (a flat, empty bar).
+            Bars before a symbol's first listing stay NaN.
+
+    Returns:
+        PricePanel
+    """
+    frames = {}
+    for symbol, source in sources.items():
+        df = load_price_data(source)
+        frames[symbol] = df.drop_duplicates('datetime', keep='last')
+
+    stamps = np.unique(np.concatenate([df['datetime'].to_numpy('datetime64[ns]') for df in frames.values()]))
+    n, m = len(stamps), len(frames)
+    present = np.zeros((n, m), dtype=bool)
+    arrays = {field: np.full((n, m), np.nan) for field in fields}
+    for j, df in enumerate(frames.values()):
+        rows = np.searchsorted(stamps, df['datetime'].to_numpy('datetime64[ns]'))
+        present[rows, j] = True
+        for field in fields:
+            arrays[field][rows, j] = df[field].to_numpy(dtype=float)
+
+    if fill:
+        close = _forward_fill(arrays['close'], present)
+        for field in fields:
+            if field == 'close':
+                arrays[field] = close
+            elif field == 'volume':
+                arrays[field] = np.where(present, arrays[field], np.where(np.isnan(close), np.nan, 0.0))
+            elif field in ('open', 'high', 'low'):
+                arrays[field] = np.where(present, arrays[field], close)
+            else:
+                arrays[field] = _forward_fill(arrays[field], present)
+
+    return PricePanel(pd.DatetimeIndex(stamps, name='datetime'), list(frames), arrays, present)
+
+
+def equal_weight(signals):
+    """
+    Split the book equally across active signals
+
+    Args:
+        signals: DataFrame (bars x symbols) of +1 / -1 / 0
+
+    Returns:
+        DataFrame of weights with gross exposure 1 on bars with any signal
+    """
+    s = signals.fillna(0).to_numpy(dtype=float)
+    active = np.abs(s).sum(axis=1, keepdims=True)
+    w = np.divide(s, active, out=np.zeros_like(s), where=active > 0)
+    return pd.DataFrame(w, index=signals.index, columns=signals.columns)
+
+
+def inverse_volatility(panel, signals=None, window=30):
+    """
+    Weight symbols by the inverse of their rolling return volatility
+
+    Args:
+        panel: PricePanel
+        signals: Optional DataFrame of +1 / -1 / 0 (default: long everything)
+        window: Rolling window for the volatility estimate
+
+    Returns:
+        DataFrame of weights with gross exposure 1 (0 until the window fills)
+    """
+    vol = pd.DataFrame(panel.returns(), index=panel.index, columns=panel.symbols).rolling(window).std().to_numpy()
+    s = np.ones_like(vol) if signals is None else signals.reindex(index=panel.index, columns=panel.symbols).fillna(0).to_numpy(dtype=float)
+    inv = np.divide(1.0, vol, out=np.zeros_like(vol), where=vol > 0)
+    raw = s * inv
+    gross = np.abs(raw).sum(axis=1, keepdims=True)
+    w = np.divide(raw, gross, out=np.zeros_like(raw), where=gross > 0)
+    return pd.DataFrame(w, index=panel.index, columns=panel.symbols)
+
+
+def run_portfolio(panel, weights, cash=100000, commission=0.0, slippage=0.0, rebalance_every=1, lag=1):
+    """
+    Vectorized target-weight portfolio backtest
+
+    On every rebalance bar the book is traded at the close to the target
+    weights (fraction of current equity per symbol); shares are held and
+    drift with prices until the next rebalance. Symbols without a real bar
+    on a rebalance date keep their current holding.
+
+    Args:
+        panel: PricePanel from load_panel
+        weights: DataFrame (bars x symbols) of target weights, or a
+            callable(panel) returning one
+        cash: Initial cash
+        commission: Fraction of traded notional charged as commission
+        slippage: Fraction of price paid on every fill
+        rebalance_every: Rebalance every N bars
+        lag: Bars between a weight's timestamp and its execution; the
+            default 1 trades weights computed on bar t at the close of t+1,
+            so a signal using the close of t is never filled at that same close
+
+    Returns:
+        tuple: (df, trades_df, performance_summary) where df has equity,
+        cash, gross exposure and turnover per bar and df.attrs['positions']
+        holds shares per symbol
+    """
+    if callable(weights):
+        weights = weights(panel)
+    W = weights.reindex(index=panel.index, columns=panel.symbols).shift(lag).fillna(0).to_numpy(dtype=float)
+    close = panel.close
+    price = np.nan_to_num(close)
+    tradable = panel.present & ~np.isnan(close)
+    n, m = close.shape
+
+    shares = np.zeros(m)
+    cost_basis = np.zeros(m)
+    cash_now = float(cash)
+    positions = np.zeros((n, m))
+    cash_path = np.zeros(n)
+    turnover = np.zeros(n)
+    trades = []
+
+    rebalance_bars = np.arange(0, n, rebalance_every)
+    bounds = np.append(rebalance_bars, n)
+    for r, end in zip(bounds[:-1], bounds[1:]):
+        equity = cash_now + shares @ price[r]
+        target = np.where(tradable[r], W[r] * equity / np.where(price[r] > 0, price[r], np.nan), shares)
+        target = np.nan_to_num(target)
+        delta = target - shares
+        traded = np.abs(delta) > 1e-12
+        if traded.any():
+            fill = price[r] * (1 + slippage * np.sign(delta))
+            notional = delta * fill
+            fees = np.abs(notional) * commission
+            cash_now -= notional.sum() + fees.sum()
+            turnover[r] = np.abs(notional).sum()
+
+            # Realized P&L on the reduced part of each position, average-cost basis
+            held, wanted = np.abs(shares), np.abs(target)
+            same_side = (shares == 0) | (np.sign(target) == np.sign(shares))
+            adding = same_side & (wanted > held)
+            closed = np.where(same_side, np.maximum(held - wanted, 0.0), held)
+            pnl = closed * (fill - cost_basis) * np.sign(shares)
+            added_basis = np.divide(held * cost_basis + (wanted - held) * fill, wanted,
+                                    out=np.zeros(m), where=wanted > 0)
+            cost_basis = np.where(adding, added_basis, np.where(same_side, cost_basis, fill))
+            cost_basis[target == 0] = 0.0
+            shares = target
+
+            for j in np.flatnonzero(traded):
+                trades.append({
+                    'datetime': panel.index[r],
+                    'symbol': panel.symbols[j],
+                    'type': 'buy' if delta[j] > 0 else 'sell',
+                    'price': fill[j],
+                    'size': abs(delta[j]),
+                    'pnl': pnl[j],
+                    'commission': fees[j],
+                    'pnlcomm': pnl[j] - fees[j]
+                })
+        positions[r:end] = shares
+        cash_path[r:end] = cash_now
+
+    holdings = positions * price
+    equity_curve = pd.Series(cash_path + holdings.sum(axis=1), index=panel.index, name='equity')
+    df = pd.DataFrame({
+        'equity': equity_curve,
+        'cash': cash_path,
+        'gross_exposure': np.abs(holdings).sum(axis=1) / equity_curve.to_numpy(),
+        'turnover': turnover
+    }, index=panel.index)
+    df.attrs['positions'] = pd.DataFrame(positions, index=panel.index, columns=panel.symbols)
+
+    trades_df = pd.DataFrame(trades, columns=['datetime', 'symbol', 'type', 'price', 'size', 'pnl', 'commission', 'pnlcomm'])
+    return df, trades_df, _summarize(equity_curve, trades_df, cash)
+
+
+class PortfolioTradeRecorder(bt.Analyzer):
+    """Record every completed order with its symbol (feed name)"""
+
+    def __init__(self):
+        super(PortfolioTradeRecorder, self).__init__()
+        self.trades = []
+
+    def notify_order(self, order):
+        if order.status == order.Completed:
+            self.trades.append({
+                'datetime': self.strategy.datetime.datetime(0),
+                'symbol': order.data._name,
+                'type': 'buy' if order.isbuy() else 'sell',
+                'price': order.executed.price,
+                'size': abs(order.executed.size),
+                'pnl': order.executed.pnl,
+                'commission': order.executed.comm,
+                'pnlcomm': order.executed.pnl - order.executed.comm
+            })
+
+    def get_analysis(self):
+        return pd.DataFrame(self.trades, columns=['datetime', 'symbol', 'type', 'price', 'size', 'pnl', 'commission', 'pnlcomm'])
+
+
+def run_portfolio_backtrader(strategy_class, panel, cash=100000, commission_scheme=None, slippage_scheme=None, **params):
+    """
+    Run a backtrader strategy over every symbol of a panel
+
+    Each symbol becomes a PandasData feed named after the symbol, all on the
+    panel's shared clock (starting where every symbol is listed), so
+    self.datas[i] / self.getdatabyname(symbol) stay in lockstep.
+
+    Returns:
+        tuple: (df, trades_df, performance_summary)
+    """
+    panel = panel.common()
+    cerebro = bt.Cerebro(stdstats=False)
+    for symbol in panel.symbols:
+        cerebro.adddata(bt.feeds.PandasData(
+            dataname=panel.symbol_frame(symbol),
+            datetime='datetime', open='open', high='high', low='low', close='close', volume='volume',
+            openinterest=-1
+        ), name=symbol)
+    _configure_broker(cerebro, cash, commission_scheme, slippage_scheme)
+    cerebro.addstrategy(strategy_class, **params)
+    cerebro.addanalyzer(EquityRecorder, _name='equity')
+    cerebro.addanalyzer(PortfolioTradeRecorder, _name='trades')
+
+    strat = cerebro.run()[0]
+    equity_curve = strat.analyzers.equity.get_analysis()
+    trades_df = strat.analyzers.trades.get_analysis()
+    df = equity_curve.to_frame()
+    return df, trades_df, _summarize(equity_curve, trades_df, cash)
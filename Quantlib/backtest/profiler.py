@@ -0,0 +1,187 @@
+"""
+Per-stage profiling of backtest runs
+
+run_backtest(..., profile=BacktestProfiler()) records each stage (CSV parse,
+Cerebro setup, feed preload, strategy loop, analyzer, equity
+reconstruction, merge/apply, metrics) with profiler.begin() and, with
+time_next=True, times every strategy next() call through a hook that
+BaseStrategy installs only when a profiler is passed in. The report is
+plain JSON so parameter sweeps can collect one per run and aggregate them.
+"""
+import json
+import os
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss_mb():
+    """Peak resident set size of the process so far (None where unavailable)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss / (1024 * 1024) if platform.system() == 'Darwin' else rss / 1024
+
+
+class BacktestProfiler:
+    """
+    Collects wall time and memory per stage and optional next() timings
+
+    Args:
+        time_next: Time every strategy next() call
+        trace_memory: Track Python/NumPy allocations per stage with
+            tracemalloc (accurate, but slows the run down noticeably);
+            otherwise only the process peak RSS is recorded
+        meta: Extra fields for the report (strategy, dataset, params, ...)
+    """
+
+    def __init__(self, time_next: bool = False, trace_memory: bool = False, meta: Optional[Dict[str, Any]] = None):
+        self.time_next = time_next
+        self.trace_memory = trace_memory
+        self.meta = dict(meta or {})
+        self.stages: List[Dict[str, Any]] = []
+        self.next_times: List[float] = []
+        self.marks: Dict[str, float] = {}
+        self._started_tracing = False
+        self._current = None
+        self._mem_before = 0
+
+    def begin(self, name: str):
+        """Start a stage, ending the current one first"""
+        self.end()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self._mem_before = tracemalloc.get_traced_memory()[0]
+        self._current = name
+        self.marks[f'{name}:start'] = time.perf_counter()
+
+    def end(self):
+        """End the current stage, if any, and record it"""
+        if self._current is None:
+            return
+        name, self._current = self._current, None
+        end = self.marks[f'{name}:end'] = time.perf_counter()
+        record = {'stage': name, 'seconds': end - self.marks[f'{name}:start'], 'max_rss_mb': _max_rss_mb()}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record['alloc_peak_mb'] = (peak - self._mem_before) / 2 ** 20
+            record['alloc_delta_mb'] = (current - self._mem_before) / 2 ** 20
+        self.stages.append(record)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time (and measure memory of) the enclosed block as one stage"""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def mark(self, name: str):
+        """Timestamp an event inside a stage (e.g. the strategy starting)"""
+        self.marks[name] = time.perf_counter()
+
+    def split_stage(self, name: str, at: str, first: str, second: str):
+        """
+        Replace a recorded stage by two, split at a mark taken inside it
+
+        Used for Cerebro.run, which preloads the feeds and then runs the
+        strategy inside one call. Memory fields of both halves are those of
+        the whole stage.
+        """
+        start, end = self.marks.get(f'{name}:start'), self.marks.get(f'{name}:end')
+        if start is None or end is None or not start <= self.marks.get(at, -1) <= end:
+            return
+        for i, record in enumerate(self.stages):
+            if record['stage'] == name:
+                self.stages[i:i + 1] = [{**record, 'stage': first, 'seconds': self.marks[at] - start},
+                                        {**record, 'stage': second, 'seconds': end - self.marks[at]}]
+                return
+
+    def record_next(self, seconds: float):
+        self.next_times.append(seconds)
+
+    def close(self):
+        """End the current stage and stop tracemalloc if this profiler started it"""
+        self.end()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict with 'stages' (list of per-stage records), 'total_seconds',
+            'next' (call count and timing percentiles in microseconds, when
+            timed) and 'meta'
+        """
+        report = {
+            'stages': self.stages,
+            'total_seconds': sum(record['seconds'] for record in self.stages),
+            'max_rss_mb': _max_rss_mb(),
+            'meta': {'python': platform.python_version(), 'pid': os.getpid(), **self.meta},
+        }
+        if self.next_times:
+            us = np.asarray(self.next_times) * 1e6
+            report['next'] = {
+                'calls': len(us),
+                'total_seconds': float(us.sum() / 1e6),
+                'mean_us': float(us.mean()),
+                'p50_us': float(np.percentile(us, 50)),
+                'p95_us': float(np.percentile(us, 95)),
+                'p99_us': float(np.percentile(us, 99)),
+                'max_us': float(us.max()),
+            }
+        return report
+
+    def to_json(self, path: str):
+        """Write the report as JSON"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2, default=str)
+        return path
+
+    def summary(self) -> pd.DataFrame:
+        """Stages as a DataFrame with each stage's share of the total time"""
+        df = pd.DataFrame(self.stages).set_index('stage')
+        df['share'] = df['seconds'] / df['seconds'].sum()
+        return df
+
+    @staticmethod
+    def aggregate(reports) -> pd.DataFrame:
+        """
+        Combine many reports (dicts or JSON paths) from a sweep
+
+        Returns:
+            DataFrame indexed by stage with runs, mean, p50, p95 and max seconds
+        """
+        rows = []
+        for report in reports:
+            if isinstance(report, str):
+                with open(report) as f:
+                    report = json.load(f)
+            rows.extend(report['stages'])
+            if 'next' in report:
+                rows.append({'stage': 'next()', 'seconds': report['next']['total_seconds']})
+        df = pd.DataFrame(rows)
+        grouped = df.groupby('stage', sort=False)['seconds']
+        return pd.DataFrame({
+            'runs': grouped.count(),
+            'mean': grouped.mean(),
+            'p50': grouped.median(),
+            'p95': grouped.quantile(0.95),
+            'max': grouped.max(),
+        })
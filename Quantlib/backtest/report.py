@@ -0,0 +1,315 @@
+"""
+Extended performance report computed directly on NumPy arrays
+
+compute_report() derives every metric from a single set of array passes over
+the equity curve (returns, running peak and drawdown are computed once and
+shared). OnlineMetrics produces the same report incrementally, one bar at a
+time, so live trading can keep it current without recomputing history.
+"""
+from collections import deque
+import numpy as np
+import pandas as pd
+
+
+def _annualized_sharpe(mean, std, periods_per_year, risk_free_rate):
+    """Sharpe ratio using the same convention as PerformanceAnalyzer.sharpe_ratio"""
+    ann_return = (1 + mean) ** periods_per_year - 1
+    ann_vol = std * np.sqrt(periods_per_year)
+    return (ann_return - risk_free_rate) / ann_vol if ann_vol != 0 else 0.0
+
+
+def _annualized_sortino(mean, downside_dev, periods_per_year, risk_free_rate):
+    """Sortino ratio: Sharpe numerator over annualized downside deviation"""
+    ann_return = (1 + mean) ** periods_per_year - 1
+    ann_down = downside_dev * np.sqrt(periods_per_year)
+    return (ann_return - risk_free_rate) / ann_down if ann_down != 0 else 0.0
+
+
+def _cagr(initial, final, n_periods, periods_per_year):
+    if initial <= 0 or n_periods <= 0:
+        return 0.0
+    years = n_periods / periods_per_year
+    return (final / initial) ** (1 / years) - 1 if final > 0 else -1.0
+
+
+def trade_stats(pnl):
+    """
+    Trade-level statistics from an array of per-trade PnL (after commission)
+
+    Args:
+        pnl: Array-like of realized trade PnL, e.g. trades_df['pnlcomm']
+
+    Returns:
+        dict with win_rate, profit_factor, avg_win, avg_loss, largest_win,
+        largest_loss and expectancy
+    """
+    pnl = np.asarray(pnl, dtype=float)
+    pnl = pnl[~np.isnan(pnl)]
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    decided = len(wins) + len(losses)
+    gross_profit = wins.sum()
+    gross_loss = -losses.sum()
+    return {
+        'num_trades': len(pnl),
+        'win_rate': len(wins) / decided if decided else 0.0,
+        'profit_factor': gross_profit / gross_loss if gross_loss else (float('inf') if gross_profit else 0.0),
+        'avg_win': wins.mean() if len(wins) else 0.0,
+        'avg_loss': losses.mean() if len(losses) else 0.0,
+        'largest_win': wins.max() if len(wins) else 0.0,
+        'largest_loss': losses.min() if len(losses) else 0.0,
+        'expectancy': pnl.mean() if len(pnl) else 0.0
+    }
+
+
+def rolling_sharpe(returns, window, periods_per_year=365, risk_free_rate=0.02):
+    """
+    Rolling annualized Sharpe ratio from cumulative sums (O(n), no Python loop)
+
+    Returns:
+        np.ndarray aligned with returns, NaN for the first window - 1 entries
+    """
+    returns = np.asarray(returns, dtype=float)
+    out = np.full(len(returns), np.nan)
+    if window < 2 or len(returns) < window:
+        return out
+    csum = np.concatenate(([0.0], np.cumsum(returns)))
+    csq = np.concatenate(([0.0], np.cumsum(returns * returns)))
+    win_sum = csum[window:] - csum[:-window]
+    win_sq = csq[window:] - csq[:-window]
+    mean = win_sum / window
+    var = np.maximum(win_sq - window * mean * mean, 0.0) / (window - 1)
+    std = np.sqrt(var)
+    ann_return = (1 + mean) ** periods_per_year - 1
+    ann_vol = std * np.sqrt(periods_per_year)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(ann_vol != 0, (ann_return - risk_free_rate) / ann_vol, 0.0)
+    out[window - 1:] = sharpe
+    return out
+
+
+def compute_report(equity, positions=None, prices=None, trades=None,
+                   periods_per_year=365, risk_free_rate=0.02, rolling_window=30):
+    """
+    Compute a full performance report from an equity curve
+
+    Args:
+        equity: Series or array of portfolio values, one per bar
+        positions: Optional array of position sizes per bar, used for
+            exposure time and turnover
+        prices: Optional array of prices per bar; turnover is measured in
+            traded notional when given, otherwise in units of position
+        trades: Optional DataFrame with a 'pnlcomm' column (or array of
+            per-trade PnL) for trade-level statistics
+        periods_per_year: Bars per year, 365 for daily crypto bars
+        risk_free_rate: Annual risk-free rate
+        rolling_window: Window length (in bars) for rolling Sharpe
+
+    Returns:
+        dict of scalar metrics plus 'rolling_sharpe' (Series or array
+        aligned with equity)
+    """
+    index = equity.index if isinstance(equity, pd.Series) else None
+    values = np.asarray(equity, dtype=float)
+    n = len(values)
+    if n == 0:
+        raise ValueError("Equity curve is empty")
+
+    initial = values[0]
+    final = values[-1]
+
+    # Per-bar returns (shared by Sharpe, Sortino and rolling Sharpe)
+    returns = values[1:] / values[:-1] - 1 if n > 1 else np.empty(0)
+    mean = returns.mean() if len(returns) else 0.0
+    std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+    daily_rf = (1 + risk_free_rate) ** (1 / periods_per_year) - 1
+    downside = np.minimum(returns - daily_rf, 0.0)
+    downside_dev = np.sqrt(np.mean(downside * downside)) if len(returns) else 0.0
+
+    # Running peak and drawdown (shared by max drawdown, duration, ulcer)
+    peak = np.maximum.accumulate(values)
+    drawdown = (values - peak) / peak
+    max_dd = drawdown.min()
+    underwater = drawdown < 0
+    if underwater.any():
+        # Length of the longest run of consecutive underwater bars
+        edges = np.diff(np.concatenate(([0], underwater.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        max_dd_duration = int((ends - starts).max())
+    else:
+        max_dd_duration = 0
+    ulcer_index = np.sqrt(np.mean((drawdown * 100) ** 2))
+
+    cagr = _cagr(initial, final, n - 1, periods_per_year)
+
+    report = {
+        'initial_capital': initial,
+        'final_capital': final,
+        'total_return': (final - initial) / initial,
+        'cagr': cagr,
+        'volatility': std * np.sqrt(periods_per_year),
+        'sharpe_ratio': _annualized_sharpe(mean, std, periods_per_year, risk_free_rate),
+        'sortino_ratio': _annualized_sortino(mean, downside_dev, periods_per_year, risk_free_rate),
+        'max_drawdown': max_dd,
+        'calmar_ratio': cagr / abs(max_dd) if max_dd != 0 else 0.0,
+        'max_drawdown_duration': max_dd_duration,
+        'ulcer_index': ulcer_index,
+        'exposure_time': 0.0,
+        'turnover': 0.0
+    }
+
+    if positions is not None:
+        positions = np.asarray(positions, dtype=float)
+        traded = np.abs(np.diff(np.concatenate(([0.0], positions))))
+        if prices is not None:
+            traded = traded * np.asarray(prices, dtype=float)
+        report['exposure_time'] = np.count_nonzero(positions) / n
+        report['turnover'] = traded.sum() / values.mean()
+
+    if trades is not None:
+        pnl = trades['pnlcomm'] if isinstance(trades, pd.DataFrame) else trades
+        report.update(trade_stats(pnl))
+
+    rolling = np.concatenate(([np.nan], rolling_sharpe(returns, rolling_window, periods_per_year, risk_free_rate)))
+    report['rolling_sharpe'] = pd.Series(rolling, index=index) if index is not None else rolling
+    return report
+
+
+class OnlineMetrics:
+    """
+    Incrementally updated version of compute_report for live trading
+
+    Each update() is O(1): returns statistics use Welford's algorithm,
+    drawdown state tracks the running peak, and the rolling Sharpe window
+    keeps running sums over a bounded deque.
+    """
+
+    def __init__(self, periods_per_year=365, risk_free_rate=0.02, rolling_window=30):
+        self.periods_per_year = periods_per_year
+        self.risk_free_rate = risk_free_rate
+        self.rolling_window = rolling_window
+        self._daily_rf = (1 + risk_free_rate) ** (1 / periods_per_year) - 1
+
+        self.n_bars = 0
+        self.initial = None
+        self.last_equity = None
+        self.last_position = 0.0
+
+        # Return statistics (Welford)
+        self._n_returns = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+
+        # Drawdown state
+        self.peak = None
+        self.max_drawdown = 0.0
+        self._dd_run = 0
+        self.max_drawdown_duration = 0
+        self._dd_sq = 0.0
+
+        # Exposure and turnover
+        self._exposed_bars = 0
+        self._traded = 0.0
+        self._equity_sum = 0.0
+
+        # Rolling window
+        self._window = deque()
+        self._win_sum = 0.0
+        self._win_sq = 0.0
+
+        # Trades
+        self._pnl = []
+
+    def update(self, equity, position=0.0, price=None):
+        """
+        Add one bar
+
+        Args:
+            equity: Portfolio value at the close of the bar
+            position: Position size held at the close of the bar
+            price: Price used to value the position change (optional)
+        """
+        equity = float(equity)
+        if self.initial is None:
+            self.initial = equity
+            self.peak = equity
+        else:
+            r = equity / self.last_equity - 1
+            self._n_returns += 1
+            delta = r - self._mean
+            self._mean += delta / self._n_returns
+            self._m2 += delta * (r - self._mean)
+            down = min(r - self._daily_rf, 0.0)
+            self._downside_sq += down * down
+
+            self._window.append(r)
+            self._win_sum += r
+            self._win_sq += r * r
+            if len(self._window) > self.rolling_window:
+                old = self._window.popleft()
+                self._win_sum -= old
+                self._win_sq -= old * old
+
+        self.peak = max(self.peak, equity)
+        dd = (equity - self.peak) / self.peak
+        self.max_drawdown = min(self.max_drawdown, dd)
+        self._dd_sq += (dd * 100) ** 2
+        if dd < 0:
+            self._dd_run += 1
+            self.max_drawdown_duration = max(self.max_drawdown_duration, self._dd_run)
+        else:
+            self._dd_run = 0
+
+        position = float(position)
+        traded = abs(position - self.last_position)
+        self._traded += traded * price if price is not None else traded
+        if position != 0:
+            self._exposed_bars += 1
+
+        self.n_bars += 1
+        self._equity_sum += equity
+        self.last_equity = equity
+        self.last_position = position
+
+    def add_trade(self, pnlcomm):
+        """Record the realized PnL (after commission) of a closed trade"""
+        self._pnl.append(float(pnlcomm))
+
+    @property
+    def rolling_sharpe(self):
+        """Sharpe ratio over the most recent rolling_window returns"""
+        k = len(self._window)
+        if k < self.rolling_window or k < 2:
+            return np.nan
+        mean = self._win_sum / k
+        std = np.sqrt(max(self._win_sq - k * mean * mean, 0.0) / (k - 1))
+        return _annualized_sharpe(mean, std, self.periods_per_year, self.risk_free_rate)
+
+    def report(self):
+        """Current metrics, with the same keys as compute_report"""
+        if self.n_bars == 0:
+            raise ValueError("No bars have been added")
+        std = np.sqrt(self._m2 / (self._n_returns - 1)) if self._n_returns > 1 else 0.0
+        downside_dev = np.sqrt(self._downside_sq / self._n_returns) if self._n_returns else 0.0
+        cagr = _cagr(self.initial, self.last_equity, self.n_bars - 1, self.periods_per_year)
+        report = {
+            'initial_capital': self.initial,
+            'final_capital': self.last_equity,
+            'total_return': (self.last_equity - self.initial) / self.initial,
+            'cagr': cagr,
+            'volatility': std * np.sqrt(self.periods_per_year),
+            'sharpe_ratio': _annualized_sharpe(self._mean, std, self.periods_per_year, self.risk_free_rate),
+            'sortino_ratio': _annualized_sortino(self._mean, downside_dev, self.periods_per_year, self.risk_free_rate),
+            'max_drawdown': self.max_drawdown,
+            'calmar_ratio': cagr / abs(self.max_drawdown) if self.max_drawdown != 0 else 0.0,
+            'max_drawdown_duration': self.max_drawdown_duration,
+            'ulcer_index': np.sqrt(self._dd_sq / self.n_bars),
+            'exposure_time': self._exposed_bars / self.n_bars,
+            'turnover': self._traded / (self._equity_sum / self.n_bars),
+            'rolling_sharpe': self.rolling_sharpe
+        }
+        if self._pnl:
+            report.update(trade_stats(self._pnl))
+        return report
@@ -0,0 +1,308 @@
+"""
+Checkpointed, resumable optimization runs
+
+Each worker appends finished trials to its own SQLite shard inside a shared
+results directory, committing after every trial. A restarted run reads the
+keys of every shard in the directory and skips trials that are already
+done, so a crash only loses the trials that were in flight. Because each
+worker writes only its own file, several processes or machines that share
+the directory can split one grid without locking each other out.
+
+A trial that raises is stored as an error row and counts as done, so one
+bad combination does not abort a sweep; pass retry_errors=True to run the
+failed trials again. Trial keys include a digest of the run setup (strategy,
+data, fixed params, cash, fees), so a directory reused with different data
+or settings does not skip trials that were never run under them.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from itertools import product
+import glob
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import time
+import pandas as pd
+from .engine import load_price_data, run_many
+from Quantlib.data.validate import fingerprint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    key TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    info TEXT,
+    worker TEXT,
+    finished_at REAL,
+    error TEXT
+)
+"""
+
+
+def _to_native(value):
+    """Convert numpy scalars to plain Python values so they serialize to JSON"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def params_key(params, **extra):
+    """Stable identifier of a trial from its params (and e.g. its data window)"""
+    return json.dumps({'params': params, **extra}, sort_keys=True, default=_to_native)
+
+
+def run_signature(strategy_class, df, fixed_params=None, cash=100000, commission_scheme=None,
+                  slippage_scheme=None):
+    """
+    Short digest of everything besides the params that a trial's result depends on
+
+    Passed to params_key as run=... so trials of a different strategy,
+    dataset or broker setup stored in the same directory are not mistaken
+    for finished ones.
+    """
+    setup = {
+        'strategy': f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+        'data': fingerprint(df),
+        'fixed_params': fixed_params or {},
+        'cash': cash,
+        'commission_scheme': commission_scheme,
+        'slippage_scheme': slippage_scheme
+    }
+    return hashlib.sha1(json.dumps(setup, sort_keys=True, default=_to_native).encode()).hexdigest()[:16]
+
+
+def _shards(directory):
+    return sorted(glob.glob(os.path.join(directory, "trials_*.sqlite")))
+
+
+def _read(directory, query, params=()):
+    """Run a read query against every shard in directory and concatenate rows"""
+    rows = []
+    for shard in _shards(directory):
+        conn = sqlite3.connect(shard)
+        try:
+            rows.extend(conn.execute(query, params).fetchall())
+        except sqlite3.OperationalError:
+            # Shard created but schema not committed yet by its worker
+            pass
+        finally:
+            conn.close()
+    return rows
+
+
+class ResultStore:
+    """Append-only trial store made of one SQLite shard per worker"""
+
+    def __init__(self, directory, worker_id=None):
+        """
+        Args:
+            directory: Results directory shared by all workers of a run
+            worker_id: Name of this worker's shard (default: host-pid)
+        """
+        self.directory = directory
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"trials_{self.worker_id}.sqlite")
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def completed_keys(self, include_errors=True):
+        """Keys of all finished trials across every shard (failed ones too unless include_errors=False)"""
+        query = "SELECT key FROM trials" if include_errors else "SELECT key FROM trials WHERE error IS NULL"
+        return {row[0] for row in _read(self.directory, query)}
+
+    def get(self, key):
+        """Finished trial record for key, or None"""
+        rows = _read(self.directory, "SELECT key, params, metrics, info, error FROM trials WHERE key = ?", (key,))
+        if not rows:
+            return None
+        key, params, metrics, info, error = rows[0]
+        return {
+            'key': key,
+            'params': json.loads(params),
+            'metrics': json.loads(metrics),
+            'info': json.loads(info) if info else {},
+            'error': error
+        }
+
+    def metrics_by_key(self, include_errors=True):
+        """Dict of key -> metrics for all finished trials across every shard (empty for failed ones)"""
+        query = "SELECT key, metrics FROM trials" + ("" if include_errors else " WHERE error IS NULL")
+        return {key: json.loads(metrics) for key, metrics in _read(self.directory, query)}
+
+    def append(self, key, params, metrics, info=None, error=None):
+        """Persist one finished (or failed, with its error message) trial, committed immediately"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                json.dumps(params, default=_to_native),
+                json.dumps(metrics, default=_to_native),
+                json.dumps(info or {}, default=_to_native),
+                self.worker_id,
+                time.time(),
+                error
+            )
+        )
+        self._conn.commit()
+
+    def to_frame(self):
+        """All finished trials as one DataFrame of params, info and metrics columns"""
+        return load_results(self.directory)
+
+    def close(self):
+        self._conn.close()
+
+
+def evaluate_trial(args):
+    """Run one backtest trial and return its metrics (picklable for process pools)"""
+    strategy_class, params, fixed_params, df, cash, commission_scheme, slippage_scheme = args
+    summary = run_many(
+        {'trial': (strategy_class, {**fixed_params, **params})},
+        df,
+        cash=cash,
+        commission_scheme=commission_scheme,
+        slippage_scheme=slippage_scheme
+    )['trial']
+    return {
+        'total_return': summary.total_return,
+        'sharpe_ratio': summary.sharpe_ratio,
+        'max_drawdown': summary.max_drawdown,
+        'total_trades': summary.total_trades,
+        'win_rate': summary.win_rate
+    }
+
+
+def run_trials(store, tasks, n_jobs=1, progress=None):
+    """
+    Evaluate (key, params, task_args, info) tuples, appending each as it finishes
+
+    A trial that raises is stored with its error and empty metrics, and the
+    remaining trials still run.
+
+    Args:
+        store: ResultStore receiving the results
+        tasks: Iterable of (key, params, evaluate_trial args, info dict)
+        n_jobs: Worker processes (-1 for all cores)
+        progress: Optional callable(n_done, n_total) invoked after each trial
+
+    Returns:
+        dict of key -> metrics for the evaluated tasks (empty dict for failed ones)
+    """
+    tasks = list(tasks)
+    results = {}
+
+    def record(i, key, params, info, outcome):
+        metrics, error = outcome
+        if error is not None:
+            print(f"⚠️ Trial {params} failed: {error}")
+        store.append(key, params, metrics, info, error=error)
+        results[key] = metrics
+        if progress:
+            progress(i, len(tasks))
+
+    if n_jobs == 1:
+        for i, (key, params, args, info) in enumerate(tasks, 1):
+            try:
+                outcome = evaluate_trial(args), None
+            except Exception as e:
+                outcome = {}, f"{type(e).__name__}: {e}"
+            record(i, key, params, info, outcome)
+        return results
+
+    with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+        futures = {pool.submit(evaluate_trial, args): (key, params, info) for key, params, args, info in tasks}
+        for i, future in enumerate(as_completed(futures), 1):
+            key, params, info = futures[future]
+            try:
+                outcome = future.result(), None
+            except BrokenProcessPool:
+                # The pool died, not the trial; leave the rest to a restarted run
+                raise
+            except Exception as e:
+                outcome = {}, f"{type(e).__name__}: {e}"
+            record(i, key, params, info, outcome)
+    return results
+
+
+def run_grid(strategy_class, data_path, grid, results_dir, constraint=None, fixed_params=None,
+             cash=100000, commission_scheme=None, slippage_scheme=None, worker_index=0,
+             n_workers=1, n_jobs=1, worker_id=None, progress=None, retry_errors=False):
+    """
+    Run a parameter grid with per-trial checkpointing
+
+    The grid is enumerated in a fixed order and trial i belongs to worker
+    i % n_workers, so launching the same call with worker_index 0..n-1 (on
+    one machine or several sharing results_dir) splits the grid without
+    coordination. Trials of the same run setup found in any shard of
+    results_dir are skipped.
+
+    Args:
+        strategy_class: Strategy class to run
+        data_path: Path to data file or a DataFrame with OHLCV and 'datetime'
+        grid: Dict of param name -> sequence of values
+        results_dir: Shared directory holding the SQLite shards
+        constraint: Optional callable(params) -> bool to skip invalid combinations
+        fixed_params: Strategy params shared by all trials (e.g. trade_size)
+        cash: Initial cash amount
+        commission_scheme: Dictionary with commission settings
+        slippage_scheme: Dictionary with slippage settings
+        worker_index: Index of this worker in [0, n_workers)
+        n_workers: Total number of workers splitting the grid
+        n_jobs: Local worker processes (-1 for all cores)
+        worker_id: Shard name for this worker (default: host-worker_index,
+            so a restarted worker keeps appending to the same shard)
+        progress: Optional callable(n_done, n_total)
+        retry_errors: Run trials that failed in an earlier run again
+
+    Returns:
+        DataFrame with every finished trial of this run setup in results_dir
+        (all workers); failed trials have their message in 'error'
+    """
+    fixed_params = fixed_params or {}
+    df = load_price_data(data_path)
+    run = run_signature(strategy_class, df, fixed_params, cash, commission_scheme, slippage_scheme)
+    store = ResultStore(results_dir, worker_id=worker_id or f"{socket.gethostname()}-{worker_index}")
+    try:
+        done = store.completed_keys(include_errors=not retry_errors)
+        names = list(grid)
+
+        tasks = []
+        for i, values in enumerate(product(*(grid[name] for name in names))):
+            if i % n_workers != worker_index:
+                continue
+            params = {name: _to_native(v) for name, v in zip(names, values)}
+            if constraint is not None and not constraint(params):
+                continue
+            key = params_key(params, run=run)
+            if key in done:
+                continue
+            args = (strategy_class, params, fixed_params, df, cash, commission_scheme, slippage_scheme)
+            tasks.append((key, params, args, {'run': run}))
+
+        run_trials(store, tasks, n_jobs=n_jobs, progress=progress)
+        results = store.to_frame()
+        return results[results['run'] == run].reset_index(drop=True) if 'run' in results else results
+    finally:
+        store.close()
+
+
+def load_results(results_dir):
+    """Load every finished trial from a results directory as a DataFrame"""
+    rows = []
+    for key, params, metrics, info, worker, finished_at, error in _read(
+        results_dir, "SELECT key, params, metrics, info, worker, finished_at, error FROM trials"
+    ):
+        rows.append({
+            **json.loads(params),
+            **(json.loads(info) if info else {}),
+            **json.loads(metrics),
+            'worker': worker,
+            'finished_at': finished_at,
+            'error': error
+        })
+    df = pd.DataFrame(rows)
+    if len(df) > 0:
+        df = df.sort_values('finished_at').reset_index(drop=True)
+    return df
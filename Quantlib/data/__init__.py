@@ -2,5 +2,17 @@
 Data processing module initialization
 """
 from .processor import DataProcessor, preprocess_btc_csv, calculate_sma, calculate_rsi
+from .tail_reader import TailCSVReader
+from .column_store import ColumnStore
+from .resample import (parse_timeframe, timeframe_label, bt_timeframe, resample_ohlcv, load_bars,
+                       align_higher_timeframe, add_timeframe_features)
+from .trades import read_trades, BarBuilder, build_bars
+from .validate import validate_ohlcv, validate_dataset, load_validated, is_validated
+from .synthetic import generate_ohlcv, generate_universe, write_dataset, write_universe
 
-__all__ = ['DataProcessor', 'preprocess_btc_csv', 'calculate_sma', 'calculate_rsi']
\ No newline at end of file
+__all__ = ['DataProcessor', 'preprocess_btc_csv', 'calculate_sma', 'calculate_rsi', 'TailCSVReader', 'ColumnStore',
+           'parse_timeframe', 'timeframe_label', 'bt_timeframe', 'resample_ohlcv', 'load_bars',
+           'align_higher_timeframe', 'add_timeframe_features',
+           'read_trades', 'BarBuilder', 'build_bars',
+           'validate_ohlcv', 'validate_dataset', 'load_validated', 'is_validated',
+           'generate_ohlcv', 'generate_universe', 'write_dataset', 'write_universe']
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Minimal columnar store for bar data
+
+Each dataset is a directory of parts; each part stores every column as its
+own .npy file, so reads can pick columns and memory-map them without
+parsing. Appending writes a new part, which lets streaming writers (bar
+builders, chunked feature generation) persist results incrementally with
+bounded memory. Only NumPy is required.
+
+    store/
+        btc_1m@1h/
+            meta.json
+            part-00000/datetime.npy, open.npy, ...
+"""
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+
+class ColumnStore:
+    """
+    Directory-backed store of DataFrames as per-column .npy files
+
+    Args:
+        root: Store directory (created on first write)
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def _meta_path(self, name):
+        return os.path.join(self._path(name), 'meta.json')
+
+    def exists(self, name):
+        return os.path.exists(self._meta_path(name))
+
+    def meta(self, name):
+        """Metadata dict of a dataset (columns, parts, rows and user attributes)"""
+        with open(self._meta_path(name)) as f:
+            return json.load(f)
+
+    def _write_meta(self, name, meta):
+        tmp = self._meta_path(name) + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, self._meta_path(name))
+
+    def write(self, name, df, attrs=None):
+        """Replace a dataset with df (index is stored as a column if named)"""
+        self.delete(name)
+        return self.append(name, df, attrs=attrs)
+
+    def append(self, name, df, attrs=None):
+        """
+        Add df as a new part of a dataset
+
+        Args:
+            name: Dataset name
+            df: DataFrame with the same columns as the existing parts
+            attrs: Optional JSON-serializable dict merged into the metadata
+
+        Returns:
+            Number of rows in the dataset after the append
+        """
+        if df.index.name is not None:
+            df = df.reset_index()
+        os.makedirs(self._path(name), exist_ok=True)
+        meta = self.meta(name) if self.exists(name) else {'columns': list(df.columns), 'parts': [], 'rows': 0, 'attrs': {}}
+        if list(df.columns) != meta['columns']:
+            raise ValueError(f"Columns {list(df.columns)} do not match dataset columns {meta['columns']}")
+
+        part = f"part-{len(meta['parts']):05d}"
+        part_dir = os.path.join(self._path(name), part)
+        os.makedirs(part_dir, exist_ok=True)
+        for col in df.columns:
+            values = df[col].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(os.path.join(part_dir, f'{col}.npy'), values, allow_pickle=False)
+
+        meta['parts'].append(part)
+        meta['rows'] += len(df)
+        if attrs:
+            meta['attrs'].update(attrs)
+        self._write_meta(name, meta)
+        return meta['rows']
+
+    def read(self, name, columns=None, index='datetime', mmap=True):
+        """
+        Load a dataset
+
+        Args:
+            name: Dataset name
+            columns: Subset of columns to load (default: all)
+            index: Column to use as the index if present (None keeps a RangeIndex)
+            mmap: Memory-map the .npy files instead of reading them eagerly
+
+        Returns:
+            DataFrame
+        """
+        meta = self.meta(name)
+        columns = list(columns) if columns is not None else meta['columns']
+        load_cols = columns + ([index] if index in meta['columns'] and index not in columns else [])
+        data = {}
+        for col in load_cols:
+            arrays = [np.load(os.path.join(self._path(name), part, f'{col}.npy'),
+                              mmap_mode='r' if mmap else None, allow_pickle=False)
+                      for part in meta['parts']]
+            data[col] = np.concatenate(arrays) if len(arrays) != 1 else np.asarray(arrays[0])
+        df = pd.DataFrame(data, columns=load_cols)
+        if index in df.columns:
+            df = df.set_index(index)
+        return df
+
+    def delete(self, name):
+        if os.path.exists(self._path(name)):
+            shutil.rmtree(self._path(name))
@@ -1,37 +1,172 @@
+import os
+import time
+import functools
 import pandas as pd
 import numpy as np
 import backtrader as bt
-from typing import List, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Optional
+
+def _registration_key(func: Callable, kwargs: dict):
+    """
+    Identity of a registration: same function with the same arguments
+    
+    Returns None when an argument is unhashable (e.g. a list), in which case
+    the registration is not deduplicated.
+    """
+    args = ()
+    if isinstance(func, functools.partial):
+        func, args, kwargs = func.func, func.args, {**func.keywords, **kwargs}
+    key = (func, args, tuple(sorted(kwargs.items(), key=lambda kv: kv[0])))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 class DataProcessor:
-    def __init__(self):
+    """
+    Apply registered indicator functions to a price frame
+    
+    By default indicators run in registration order and each one sees the
+    columns of those registered before it. Indicators registered with an
+    explicit depends_on (an empty list for none) only wait for those
+    indicators, so independent ones run together in a thread pool
+    (pandas/NumPy rolling kernels release the GIL for most of their work)
+    and their outputs are joined to the frame with a single concat. A stage
+    with one indicator (every stage on the default path) adds its columns
+    in place, as an in-place insert is cheaper than copying the frame.
+    Identical registrations (same function and arguments under different
+    names) in the same stage are computed once.
+    
+    Args:
+        n_jobs: Worker threads (None = one per indicator up to the CPU count,
+                1 = sequential)
+    """
+    def __init__(self, n_jobs: Optional[int] = None):
         self.indicators = {}  # Dictionary of name: calculation_function
+        self.kwargs = {}      # Dictionary of name: keyword arguments for the function
+        self.depends_on = {}  # Dictionary of name: indicator names it reads (None = all registered before it)
+        self.n_jobs = n_jobs
+        self.timings = {}     # Seconds per indicator from the last process_data call
+        
+    def add_indicator(self, name: str, calculation_func: Callable, depends_on: Optional[List[str]] = None, **kwargs):
+        """
+        Add a new indicator calculation function
         
-    def add_indicator(self, name: str, calculation_func: Callable):
-        """Add a new indicator calculation function"""
+        Args:
+            name: Output column (or column prefix for DataFrame results)
+            calculation_func: Callable(df, **kwargs) returning a Series, array or DataFrame
+            depends_on: Indicator names whose output columns the function reads;
+                [] for an indicator that only needs the input columns. None
+                (default) runs it after every indicator registered before it.
+            **kwargs: Extra arguments for calculation_func
+        """
         self.indicators[name] = calculation_func
+        self.kwargs[name] = kwargs
+        self.depends_on[name] = None if depends_on is None else list(depends_on)
         
     def remove_indicator(self, name: str):
         """Remove an indicator by name"""
         self.indicators.pop(name, None)
+        self.kwargs.pop(name, None)
+        self.depends_on.pop(name, None)
+    
+    def _stages(self):
+        """Indicator names grouped so every dependency is in an earlier stage"""
+        remaining, earlier = {}, []
+        for name, deps in self.depends_on.items():
+            remaining[name] = list(earlier) if deps is None else deps
+            earlier.append(name)
+        done, stages = set(), []
+        while remaining:
+            ready = [name for name, deps in remaining.items()
+                     if all(dep in done or dep not in self.indicators for dep in deps)]
+            if not ready:
+                raise ValueError(f"Circular indicator dependencies: {sorted(remaining)}")
+            stages.append(ready)
+            done.update(ready)
+            for name in ready:
+                del remaining[name]
+        return stages
+    
+    def _run(self, name, df):
+        """Run one indicator, returning (result or None on error, seconds)"""
+        start = time.perf_counter()
+        try:
+            result = self.indicators[name](df, **self.kwargs[name])
+        except Exception as e:
+            print(f"Error calculating indicator {name}: {e}")
+            result = None
+        return result, time.perf_counter() - start
+    
+    @staticmethod
+    def _as_columns(name, result, index):
+        """
+        Output of an indicator as a DataFrame of named columns
+        
+        Raises ValueError for an array whose length does not match the frame.
+        """
+        if isinstance(result, pd.DataFrame):
+            # Prefix columns with indicator name to avoid conflicts
+            return result.add_prefix(f"{name}_")
+        if isinstance(result, pd.Series):
+            # Aligned on the frame's index, like column assignment
+            return result.rename(name).reindex(index).to_frame()
+        if isinstance(result, np.ndarray):
+            return pd.DataFrame({name: result}, index=index)
+        return None
         
     def process_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process data with registered indicators"""
         processed = df.copy()
+        self.timings = {}
+        
+        for stage in self._stages():
+            # Compute each distinct (function, arguments) once; unhashable ones are keyed by name
+            keys = {}
+            for name in stage:
+                key = _registration_key(self.indicators[name], self.kwargs[name])
+                keys[name] = name if key is None else key
+            unique = {}
+            for name, key in keys.items():
+                unique.setdefault(key, name)
+            
+            names = list(unique.values())
+            workers = self.n_jobs or min(len(names), os.cpu_count() or 1)
+            if workers > 1 and len(names) > 1:
+                # Own shallow copy per thread, so columns one indicator adds are not seen by another
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(lambda n: self._run(n, processed.copy(deep=False)), names))
+            else:
+                results = [self._run(name, processed) for name in names]
+            computed = dict(zip(unique, results))
+            
+            outputs = []
+            for name, key in keys.items():
+                result, elapsed = computed[key]
+                # Duplicates reuse the first registration's result at no cost
+                self.timings[name] = elapsed if unique[key] == name else 0.0
+                try:
+                    columns = self._as_columns(name, result, processed.index)
+                except Exception as e:
+                    print(f"Error calculating indicator {name}: {e}")
+                    continue
+                if columns is not None:
+                    outputs.append(columns)
+            if len(outputs) == 1 and outputs[0].index.equals(processed.index):
+                for col, values in outputs[0].items():
+                    processed[col] = values
+            elif outputs:
+                replaced = [col for out in outputs for col in out.columns if col in processed.columns]
+                processed = pd.concat([processed.drop(columns=replaced)] + outputs, axis=1)
         
-        for name, func in self.indicators.items():
-            try:
-                result = func(processed)
-                if isinstance(result, (pd.Series, np.ndarray)):
-                    processed[name] = result
-                elif isinstance(result, pd.DataFrame):
-                    # Prefix columns with indicator name to avoid conflicts
-                    result = result.add_prefix(f"{name}_")
-                    processed = pd.concat([processed, result], axis=1)
-            except Exception as e:
-                print(f"Error calculating indicator {name}: {e}")
-                
         return processed
+    
+    def timing_report(self) -> pd.DataFrame:
+        """Per-indicator seconds from the last process_data call, slowest first"""
+        report = pd.DataFrame({'seconds': pd.Series(self.timings, dtype=float)})
+        return report.sort_values('seconds', ascending=False)
 
 def preprocess_btc_csv(csv_path: str) -> pd.DataFrame:
     """Load and preprocess BTC price data from CSV"""
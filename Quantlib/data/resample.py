@@ -0,0 +1,261 @@
+"""
+OHLCV resampling and multi-timeframe features
+
+Bars are bucketed by integer division of their timestamps, so aggregating
+1-minute data to any fixed timeframe is one pass of NumPy reduceat calls.
+Derived bars are cached in a ColumnStore next to the source file and
+rebuilt when the source changes.
+
+Higher-timeframe features are aligned on bar close times: a base bar only
+sees higher-timeframe bars that had closed by the time the base bar closed,
+so there is no lookahead.
+"""
+import os
+import re
+from typing import Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+from .column_store import ColumnStore
+
+_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+# Epoch (1970-01-01) is a Thursday; weekly bars start on Monday like Binance's
+_WEEK_ORIGIN = pd.Timestamp('1970-01-05')
+
+
+def parse_timeframe(timeframe) -> pd.Timedelta:
+    """
+    Convert a Binance-style interval ('1m', '15m', '4h', '1d', '1w') or a
+    Timedelta into a Timedelta
+    """
+    if isinstance(timeframe, pd.Timedelta):
+        return timeframe
+    match = re.fullmatch(r'(\d+)([smhdw])', str(timeframe).strip())
+    if not match:
+        raise ValueError(f"Unsupported timeframe: {timeframe} (use e.g. '1m', '4h', '1d', '1w')")
+    return pd.Timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def timeframe_label(timeframe) -> str:
+    """Binance-style interval string for a Timedelta, e.g. 4 hours -> '4h'"""
+    step = parse_timeframe(timeframe)
+    for unit in ('w', 'd', 'h', 'm', 's'):
+        size = pd.Timedelta(**{_UNITS[unit]: 1})
+        if step % size == pd.Timedelta(0):
+            return f'{step // size}{unit}'
+    raise ValueError(f"Unsupported timeframe: {timeframe} (not a whole number of seconds)")
+
+
+def bt_timeframe(timeframe):
+    """
+    backtrader (timeframe, compression) for an interval string
+
+    Returns:
+        tuple: e.g. (bt.TimeFrame.Minutes, 240) for '4h'
+    """
+    import backtrader as bt
+    step = parse_timeframe(timeframe)
+    if step % pd.Timedelta(weeks=1) == pd.Timedelta(0):
+        return bt.TimeFrame.Weeks, step // pd.Timedelta(weeks=1)
+    if step % pd.Timedelta(days=1) == pd.Timedelta(0):
+        return bt.TimeFrame.Days, step // pd.Timedelta(days=1)
+    if step % pd.Timedelta(minutes=1) == pd.Timedelta(0):
+        return bt.TimeFrame.Minutes, step // pd.Timedelta(minutes=1)
+    return bt.TimeFrame.Seconds, step // pd.Timedelta(seconds=1)
+
+
+def _as_bars(df):
+    """Lower-cased columns with a sorted 'datetime' column"""
+    df = df.copy()
+    df.columns = [col.strip().lower() for col in df.columns]
+    if 'datetime' not in df.columns:
+        df = df.reset_index().rename(columns={'index': 'datetime'})
+    df['datetime'] = pd.to_datetime(df['datetime'])
+    if not df['datetime'].is_monotonic_increasing:
+        df = df.sort_values('datetime', kind='stable')
+    return df.reset_index(drop=True)
+
+
+def infer_timeframe(df) -> pd.Timedelta:
+    """Most common spacing between consecutive bars"""
+    times = pd.to_datetime(df['datetime'] if 'datetime' in df.columns else df.index)
+    diffs = np.diff(times.to_numpy().astype('datetime64[ns]').astype(np.int64))
+    diffs = diffs[diffs > 0]
+    if not len(diffs):
+        raise ValueError("Need at least two distinct timestamps to infer the timeframe")
+    values, counts = np.unique(diffs, return_counts=True)
+    return pd.Timedelta(int(values[counts.argmax()]), unit='ns')
+
+
+def resample_ohlcv(df: pd.DataFrame, timeframe, drop_partial: bool = False,
+                   base_timeframe=None) -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars to a coarser fixed timeframe
+
+    Open is the first open, high the max, low the min, close the last close;
+    every column whose name contains 'volume' (and 'trades', if present) is
+    summed. Other columns are dropped.
+
+    Args:
+        df: Bars with a 'datetime' column (or DatetimeIndex) and OHLCV columns
+        timeframe: Target interval, e.g. '1h', '4h', '1d'
+        drop_partial: Drop the last bar if its period is not complete yet
+        base_timeframe: Interval of the input bars (inferred if None)
+
+    Returns:
+        DataFrame with 'datetime' (bar open time), OHLCV columns,
+        'close_time' (bar open + timeframe) and 'bars' (input bars per bar)
+    """
+    bars = _as_bars(df)
+    step = parse_timeframe(timeframe)
+    origin = _WEEK_ORIGIN if step % pd.Timedelta(weeks=1) == pd.Timedelta(0) else pd.Timestamp(0)
+
+    times = bars['datetime'].to_numpy().astype('datetime64[ns]').astype(np.int64)
+    bucket = (times - origin.value) // step.value
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bars)] - 1
+
+    out = {
+        'datetime': pd.to_datetime(bucket[starts] * step.value + origin.value),
+        'open': bars['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(bars['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(bars['low'].to_numpy(), starts),
+        'close': bars['close'].to_numpy()[ends],
+    }
+    for col in bars.columns:
+        if 'volume' in col or col == 'trades':
+            out[col] = np.add.reduceat(bars[col].to_numpy(dtype=float), starts)
+    out['bars'] = ends - starts + 1
+    result = pd.DataFrame(out)
+    result['close_time'] = result['datetime'] + step
+
+    if drop_partial and len(result):
+        base = parse_timeframe(base_timeframe) if base_timeframe is not None else infer_timeframe(bars)
+        last_close = bars['datetime'].iloc[-1] + base
+        if last_close < result['close_time'].iloc[-1]:
+            result = result.iloc[:-1]
+    return result
+
+
+def _cache_key(source, timeframe):
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return f"{stem}@{timeframe}"
+
+
+def load_bars(source: str, timeframe, cache: bool = True, store_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load bars of a CSV resampled to timeframe, using the cached copy when valid
+
+    The cache lives in a ColumnStore at <source dir>/.bars (or store_dir) and
+    is keyed by file name and timeframe; it is rebuilt when the source's
+    size or modification time changes.
+
+    Args:
+        source: Path to a fine-grained OHLCV CSV (e.g. 1-minute bars)
+        timeframe: Target interval, e.g. '1h'
+        cache: Read and write the cache
+        store_dir: Cache directory (default: .bars next to the source)
+
+    Returns:
+        Resampled DataFrame as returned by resample_ohlcv
+    """
+    stat = os.stat(source)
+    signature = {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns}
+    store = ColumnStore(store_dir or os.path.join(os.path.dirname(os.path.abspath(source)), '.bars'))
+    key = _cache_key(source, timeframe)
+
+    if cache and store.exists(key):
+        attrs = store.meta(key)['attrs']
+        if all(attrs.get(k) == v for k, v in signature.items()):
+            return store.read(key, index=None, mmap=False)
+
+    bars = resample_ohlcv(pd.read_csv(source), timeframe)
+    if cache:
+        try:
+            store.write(key, bars, attrs={**signature, 'timeframe': str(timeframe)})
+        except OSError as e:
+            print(f"⚠️ Could not cache resampled bars for {source}: {e}")
+    return bars
+
+
+def align_higher_timeframe(df: pd.DataFrame, htf: pd.DataFrame, columns=None,
+                           base_timeframe=None, prefix: Optional[str] = None) -> pd.DataFrame:
+    """
+    Attach higher-timeframe columns to base bars without lookahead
+
+    Each base bar gets the values of the latest higher-timeframe bar whose
+    close_time is at or before the base bar's own close time.
+
+    Args:
+        df: Base bars with a 'datetime' column (bar open time)
+        htf: Higher-timeframe frame with 'close_time' and the value columns
+        columns: Columns of htf to attach (default: all but datetime/close_time)
+        base_timeframe: Interval of the base bars (inferred if None)
+        prefix: Prefix for the attached column names (default: '<timeframe>_'
+            with the timeframe taken from htf's close_time - datetime, e.g. '1d_')
+
+    Returns:
+        Copy of df with the attached columns (NaN before the first closed bar)
+
+    Raises:
+        ValueError: If an attached column name already exists in df
+    """
+    bars = _as_bars(df)
+    base = parse_timeframe(base_timeframe) if base_timeframe is not None else infer_timeframe(bars)
+    if columns is None:
+        columns = [c for c in htf.columns if c not in ('datetime', 'close_time')]
+    if prefix is None:
+        prefix = ''
+        if 'datetime' in htf.columns and len(htf):
+            prefix = f"{timeframe_label(htf['close_time'].iloc[0] - pd.Timestamp(htf['datetime'].iloc[0]))}_"
+    clashes = [f'{prefix}{c}' for c in columns if f'{prefix}{c}' in bars.columns]
+    if clashes:
+        raise ValueError(f"Higher-timeframe columns {clashes} already exist in df; pass a prefix")
+    right = htf[['close_time'] + list(columns)].dropna(subset=list(columns), how='all')
+    right = right.rename(columns={'close_time': '_htf_close_time', **{c: f'{prefix}{c}' for c in columns}})
+
+    left = bars.assign(_close_time=bars['datetime'] + base)
+    merged = pd.merge_asof(left, right.sort_values('_htf_close_time'), left_on='_close_time',
+                           right_on='_htf_close_time', direction='backward', allow_exact_matches=True)
+    return merged.drop(columns=['_close_time', '_htf_close_time'])
+
+
+def add_timeframe_features(df: pd.DataFrame, timeframe, feature_fn: Optional[Callable] = None,
+                           feature_config: Optional[Dict] = None, base_timeframe=None,
+                           prefix: Optional[str] = None) -> pd.DataFrame:
+    """
+    Compute features on a higher timeframe and attach them to base bars
+
+    Only completed higher-timeframe bars are used, e.g. daily RSI on an
+    hourly frame is yesterday's value until today's daily bar closes.
+
+    Args:
+        df: Base bars (e.g. hourly) with a 'datetime' column
+        timeframe: Higher interval, e.g. '1d'
+        feature_fn: Callable(htf_bars) -> DataFrame/Series of features
+            (default: generate_features with feature_config)
+        feature_config: Passed to generate_features when feature_fn is None
+        base_timeframe: Interval of the base bars (inferred if None)
+        prefix: Column prefix (default: '<timeframe>_')
+
+    Returns:
+        Copy of df with the higher-timeframe feature columns
+    """
+    bars = _as_bars(df)
+    base = parse_timeframe(base_timeframe) if base_timeframe is not None else infer_timeframe(bars)
+    # Partial last bar would leak the still-open period into its features
+    htf = resample_ohlcv(bars, timeframe, drop_partial=True, base_timeframe=base)
+
+    if feature_fn is None:
+        from Quantlib.forecast.features import generate_features
+        features = generate_features(htf.drop(columns=['close_time', 'bars']), feature_config)
+        features = features.drop(columns=[c for c in htf.columns if c in features.columns and c != 'datetime'])
+        features = features.merge(htf[['datetime', 'close_time']], on='datetime')
+    else:
+        result = feature_fn(htf)
+        result = result.to_frame() if isinstance(result, pd.Series) else result
+        features = pd.concat([htf[['close_time']], result.set_axis(htf.index)], axis=1)
+
+    columns = [c for c in features.columns if c not in ('datetime', 'close_time')]
+    return align_higher_timeframe(bars, features, columns, base_timeframe=base,
+                                  prefix=f'{timeframe}_' if prefix is None else prefix)
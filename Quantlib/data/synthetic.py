@@ -0,0 +1,214 @@
+"""
+Synthetic OHLCV data for scale testing
+
+Log prices follow a geometric Brownian motion whose drift and volatility
+switch between Markov regimes, with compound Poisson jumps on top. Highs
+and lows are drawn from the exact distribution of a Brownian bridge's
+extremes between each bar's open and close, so they are consistent with
+the bar without simulating intrabar paths. Volume is lognormal, scales
+with the size of the move and follows an intraday U-shape on sub-daily
+bars. Everything is vectorized NumPy and seeded.
+"""
+import os
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from .column_store import ColumnStore
+from .resample import parse_timeframe
+
+_YEAR = pd.Timedelta(days=365)
+
+# Default regimes: calm bull, choppy sideways, volatile bear (annualized)
+DEFAULT_REGIMES = [
+    {'mu': 0.40, 'sigma': 0.45},
+    {'mu': 0.00, 'sigma': 0.60},
+    {'mu': -0.50, 'sigma': 1.00},
+]
+
+
+def _regime_path(n_bars, n_regimes, transition, mean_duration, rng):
+    """Regime index per bar from a Markov chain over regime segments"""
+    if n_regimes == 1:
+        return np.zeros(n_bars, dtype=np.int8)
+    if transition is None:
+        transition = np.full((n_regimes, n_regimes), 1.0 / (n_regimes - 1))
+        np.fill_diagonal(transition, 0.0)
+    transition = np.asarray(transition, dtype=float)
+    transition = transition / transition.sum(axis=1, keepdims=True)
+    cumulative = transition.cumsum(axis=1)
+
+    # Segment lengths are geometric, so the per-bar process is Markov
+    n_segments = int(n_bars / mean_duration * 2) + 16
+    lengths = rng.geometric(1.0 / mean_duration, n_segments)
+    while lengths.sum() < n_bars:
+        lengths = np.r_[lengths, rng.geometric(1.0 / mean_duration, n_segments)]
+    draws = rng.random(len(lengths))
+    states = np.empty(len(lengths), dtype=np.int8)
+    states[0] = rng.integers(n_regimes)
+    for i in range(1, len(lengths)):  # One step per segment, not per bar
+        states[i] = np.searchsorted(cumulative[states[i - 1]], draws[i], side='right')
+    return np.repeat(states, lengths)[:n_bars]
+
+
+def generate_ohlcv(n_bars: int, timeframe='1m', start='2020-01-01', price: float = 30000.0,
+                   regimes: Optional[List[Dict[str, float]]] = None, transition=None,
+                   mean_regime_duration: Optional[float] = None, jump_intensity: float = 20.0,
+                   jump_mean: float = 0.0, jump_std: float = 0.03, volume: float = 100.0,
+                   volume_sigma: float = 0.5, volume_beta: float = 0.5, seed: Optional[int] = None,
+                   shocks: Optional[np.ndarray] = None, include_regime: bool = False) -> pd.DataFrame:
+    """
+    Generate one OHLCV series
+
+    Args:
+        n_bars: Number of bars
+        timeframe: Bar interval, e.g. '1m', '1h', '1d'
+        start: First bar's open time
+        price: Initial price
+        regimes: List of {'mu', 'sigma'} dicts (annualized drift and volatility);
+            a single-entry list gives plain GBM. Default: DEFAULT_REGIMES
+        transition: Regime transition matrix (rows: from, columns: to); the
+            diagonal is ignored as the segment lengths model persistence.
+            Default: uniform over the other regimes
+        mean_regime_duration: Mean bars per regime segment (default: 30 days)
+        jump_intensity: Expected jumps per year (0 disables jumps)
+        jump_mean, jump_std: Normal log-size of each jump
+        volume: Median volume per bar
+        volume_sigma: Lognormal noise of volume
+        volume_beta: Extra volume per standard deviation of the bar's move
+        seed: Random seed
+        shocks: Optional standard normal shocks of length n_bars (used by
+            generate_universe to correlate symbols)
+        include_regime: Add the regime index as a column
+
+    Returns:
+        DataFrame with datetime, open, high, low, close, volume in the
+        column order CSVDataLoader and load_price_data expect
+    """
+    rng = np.random.default_rng(seed)
+    step = parse_timeframe(timeframe)
+    dt = step / _YEAR
+    regimes = regimes or DEFAULT_REGIMES
+    mean_duration = mean_regime_duration or max(pd.Timedelta(days=30) / step, 1.0)
+
+    state = _regime_path(n_bars, len(regimes), transition, mean_duration, rng)
+    mu = np.array([r['mu'] for r in regimes])[state]
+    sigma = np.array([r['sigma'] for r in regimes])[state]
+    bar_sigma = sigma * np.sqrt(dt)
+
+    z = rng.standard_normal(n_bars) if shocks is None else np.asarray(shocks)
+    log_ret = (mu - 0.5 * sigma ** 2) * dt + bar_sigma * z
+    if jump_intensity > 0:
+        n_jumps = rng.poisson(jump_intensity * dt, n_bars)
+        hit = np.flatnonzero(n_jumps)
+        # Sum of k normal jumps is normal with k times the mean and variance
+        log_ret[hit] += rng.normal(jump_mean * n_jumps[hit], jump_std * np.sqrt(n_jumps[hit]))
+
+    log_close = np.log(price) + np.cumsum(log_ret)
+    log_open = np.r_[np.log(price), log_close[:-1]]
+
+    # Extremes of a Brownian bridge from open to close with the bar's variance
+    diff_sq = (log_close - log_open) ** 2
+    var = bar_sigma ** 2
+    u_high = rng.random(n_bars)
+    u_low = rng.random(n_bars)
+    log_high = 0.5 * (log_open + log_close + np.sqrt(diff_sq - 2 * var * np.log1p(-u_high)))
+    log_low = 0.5 * (log_open + log_close - np.sqrt(diff_sq - 2 * var * np.log1p(-u_low)))
+
+    times = pd.date_range(start, periods=n_bars, freq=step)
+    move = np.abs(log_ret) / np.maximum(bar_sigma, 1e-12)
+    vol = volume * np.exp(volume_sigma * rng.standard_normal(n_bars) - 0.5 * volume_sigma ** 2)
+    vol *= 1.0 + volume_beta * move
+    if step < pd.Timedelta(days=1):
+        # Busier at the start and end of the (UTC) day
+        day_fraction = (times.hour.to_numpy() * 3600 + times.minute.to_numpy() * 60) / 86400
+        vol *= 0.6 + 0.8 * (2 * day_fraction - 1) ** 2
+
+    df = pd.DataFrame({
+        'datetime': times,
+        'open': np.exp(log_open),
+        'high': np.exp(log_high),
+        'low': np.exp(log_low),
+        'close': np.exp(log_close),
+        'volume': vol,
+    })
+    if include_regime:
+        df['regime'] = state
+    return df
+
+
+def generate_universe(symbols, n_bars: int, correlation: float = 0.5, seed: Optional[int] = None,
+                      prices: Optional[Sequence[float]] = None, **kwargs) -> Dict[str, pd.DataFrame]:
+    """
+    Generate correlated series for several symbols on a shared time index
+
+    Every symbol's shocks load on one common market factor, so pairwise
+    shock correlation is `correlation`. Regimes, jumps and volume are drawn
+    independently per symbol.
+
+    Args:
+        symbols: Symbol names, or an int for SYM000, SYM001, ...
+        n_bars: Bars per symbol
+        correlation: Shock correlation between symbols, in [0, 1]
+        seed: Random seed (each symbol gets its own derived stream)
+        prices: Initial price per symbol (default: spread between 10 and 1000)
+        **kwargs: Passed to generate_ohlcv
+
+    Returns:
+        dict: symbol -> DataFrame (directly usable as load_panel sources)
+    """
+    if isinstance(symbols, int):
+        symbols = [f'SYM{i:03d}' for i in range(symbols)]
+    seeds = np.random.SeedSequence(seed).spawn(len(symbols) + 1)
+    market = np.random.default_rng(seeds[0]).standard_normal(n_bars)
+    if prices is None:
+        prices = np.geomspace(10, 1000, len(symbols))
+
+    universe = {}
+    for symbol, sym_seed, price in zip(symbols, seeds[1:], prices):
+        rng = np.random.default_rng(sym_seed)
+        shocks = np.sqrt(correlation) * market + np.sqrt(1 - correlation) * rng.standard_normal(n_bars)
+        universe[symbol] = generate_ohlcv(n_bars, price=price, seed=rng.integers(2 ** 63),
+                                          shocks=shocks, **kwargs)
+    return universe
+
+
+def write_dataset(df: pd.DataFrame, path: str, name: Optional[str] = None) -> str:
+    """
+    Write generated bars in a loader format
+
+    Args:
+        df: Output of generate_ohlcv
+        path: '.csv' file (datetime formatted for CSVDataLoader, columns in
+            its positional order) or a ColumnStore directory
+        name: Dataset name in the ColumnStore (default: 'synthetic')
+
+    Returns:
+        The CSV path or the dataset name
+    """
+    if path.endswith('.csv'):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        df.to_csv(path, index=False, date_format='%Y-%m-%d %H:%M:%S')
+        return path
+    name = name or 'synthetic'
+    ColumnStore(path).write(name, df)
+    return name
+
+
+def write_universe(universe: Dict[str, pd.DataFrame], directory: str, fmt: str = 'csv') -> Dict[str, str]:
+    """
+    Write every symbol of a generated universe
+
+    Args:
+        universe: Output of generate_universe
+        directory: Target directory
+        fmt: 'csv' (one <symbol>.csv per symbol) or 'store' (one ColumnStore
+            dataset per symbol in directory)
+
+    Returns:
+        dict: symbol -> CSV path (fmt='csv') or dataset name (fmt='store')
+    """
+    if fmt not in ('csv', 'store'):
+        raise ValueError(f"Unknown format: {fmt}")
+    return {symbol: write_dataset(df, os.path.join(directory, f'{symbol}.csv') if fmt == 'csv' else directory,
+                                  name=symbol)
+            for symbol, df in universe.items()}
@@ -0,0 +1,119 @@
+"""
+Incremental tail-follow reader for append-only CSV bar files
+"""
+import csv
+import os
+from collections import deque
+import pandas as pd
+
+
+def _parse_value(value):
+    """Convert a CSV field to float when it is numeric"""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class TailCSVReader:
+    """
+    Follow a CSV file that is appended to, parsing only the new lines
+
+    The reader remembers the byte offset of the last complete line it parsed,
+    so each poll() costs O(new rows) regardless of file size. A partially
+    written last line is left for the next poll. If the file is replaced
+    (different inode) or truncated, it is reopened from the start.
+
+    Args:
+        path: CSV file with a header row
+        maxlen: Number of recent bars kept in the ring buffer for warm-up
+        warmup: Load the last maxlen rows of the existing file on first poll;
+            otherwise start following from the current end of file
+    """
+
+    def __init__(self, path, maxlen=500, warmup=True):
+        self.path = path
+        self.maxlen = maxlen
+        self.warmup = warmup
+        self.buffer = deque(maxlen=maxlen)
+        self.header = None
+        self.offset = None
+        self._data_start = 0
+        self._inode = None
+
+    def _read_header(self, f):
+        f.seek(0)
+        line = f.readline()
+        self.header = next(csv.reader([line.decode('utf-8')]))
+        self.header = [col.strip() for col in self.header]
+        self._data_start = f.tell()
+
+    def _tail_offset(self, f, size):
+        """Byte offset where the last maxlen lines of the file start"""
+        block = 65536
+        pos = size
+        newlines = 0
+        # A trailing newline terminates the last line and is not a separator
+        f.seek(max(size - 1, 0))
+        skip_last = f.read(1) == b'\n'
+        while pos > self._data_start:
+            step = min(block, pos - self._data_start)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            end = len(chunk) - 1 if skip_last and pos + step == size else len(chunk)
+            for i in range(end - 1, -1, -1):
+                if chunk[i] == 0x0A:
+                    newlines += 1
+                    if newlines == self.maxlen:
+                        return pos + i + 1
+        return self._data_start
+
+    def _open(self, f, st):
+        self._inode = st.st_ino
+        self._read_header(f)
+        if self.offset is None and not self.warmup:
+            self.offset = st.st_size
+        elif self.offset is None:
+            self.offset = self._tail_offset(f, st.st_size)
+        else:
+            # Rotated or truncated: the new file is read from its first row
+            self.offset = self._data_start
+
+    def poll(self):
+        """
+        Parse rows appended since the previous poll
+
+        Returns:
+            list of row dicts (also appended to the ring buffer)
+        """
+        st = os.stat(self.path)
+        with open(self.path, 'rb') as f:
+            if self._inode is None or st.st_ino != self._inode or st.st_size < (self.offset or 0):
+                self._open(f, st)
+
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+
+        end = data.rfind(b'\n')
+        if end < 0:
+            return []
+        complete = data[:end + 1]
+        self.offset += len(complete)
+
+        rows = []
+        for fields in csv.reader(complete.decode('utf-8').splitlines()):
+            if not fields:
+                continue
+            row = {col: _parse_value(value) for col, value in zip(self.header, fields)}
+            rows.append(row)
+            self.buffer.append(row)
+        return rows
+
+    def latest(self):
+        """Most recent row, or None if nothing has been read yet"""
+        return self.buffer[-1] if self.buffer else None
+
+    def frame(self):
+        """Ring buffer contents as a DataFrame (oldest first)"""
+        return pd.DataFrame(list(self.buffer), columns=self.header)
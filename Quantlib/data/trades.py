@@ -0,0 +1,235 @@
+"""
+Trade print ingestion and bar building
+
+Reads aggTrades-style files (Binance data dumps, with or without a header)
+in chunks and builds time, volume or dollar bars. Each chunk is aggregated
+with NumPy reduceat; only the still-open bar is carried to the next chunk,
+so memory is bounded by the chunk size however long the history is.
+
+Volume and dollar bars are cut where the running total crosses a multiple
+of the bar size. A trade is never split, so a bar ends with the trade that
+crosses its threshold and slightly overshoots it; a single trade crossing
+several thresholds closes one bar.
+"""
+import glob
+import os
+from typing import Iterator, Optional
+import numpy as np
+import pandas as pd
+from .column_store import ColumnStore
+from .resample import parse_timeframe
+
+# Column order of Binance aggTrades dumps (spot files add is_best_match)
+AGG_TRADE_COLUMNS = ['agg_trade_id', 'price', 'quantity', 'first_trade_id',
+                     'last_trade_id', 'transact_time', 'is_buyer_maker']
+
+BAR_COLUMNS = ['datetime', 'close_time', 'open', 'high', 'low', 'close', 'volume',
+               'dollar_volume', 'buy_volume', 'trades', 'vwap']
+
+_SUMS = ('volume', 'dollar_volume', 'buy_volume', 'trades')
+
+
+def _has_header(path):
+    with open(path) as f:
+        first = f.readline().split(',')[0].strip()
+    return not first.lstrip('-').isdigit()
+
+
+def _expand_sources(source):
+    if isinstance(source, (list, tuple)):
+        return list(source)
+    paths = sorted(glob.glob(source))
+    if not paths:
+        raise FileNotFoundError(f"No trade files match {source}")
+    return paths
+
+
+def read_trades(source, chunk_size: int = 1_000_000) -> Iterator[pd.DataFrame]:
+    """
+    Stream trade prints as chunks of (time, price, quantity, is_buyer_maker)
+
+    Args:
+        source: aggTrades CSV path, glob pattern or list of paths (read in order)
+        chunk_size: Rows per chunk
+
+    Yields:
+        DataFrames with a datetime64 'time' column; transact_time in
+        milliseconds or microseconds (newer spot dumps) is detected per file
+    """
+    for path in _expand_sources(source):
+        header = _has_header(path)
+        reader = pd.read_csv(
+            path, chunksize=chunk_size,
+            header=0 if header else None,
+            names=None if header else AGG_TRADE_COLUMNS,
+            usecols=['price', 'quantity', 'transact_time', 'is_buyer_maker'],
+            dtype={'price': 'float64', 'quantity': 'float64', 'transact_time': 'int64'},
+        )
+        unit = None
+        for chunk in reader:
+            if unit is None and len(chunk):
+                unit = 'us' if chunk['transact_time'].iloc[0] > 10 ** 14 else 'ms'
+            maker = chunk['is_buyer_maker']
+            if maker.dtype != bool:
+                maker = maker.astype(str).str.lower().eq('true')
+            yield pd.DataFrame({
+                'time': pd.to_datetime(chunk['transact_time'].to_numpy(), unit=unit),
+                'price': chunk['price'].to_numpy(),
+                'quantity': chunk['quantity'].to_numpy(),
+                'is_buyer_maker': maker.to_numpy(),
+            })
+
+
+def _aggregate(keys, times, price, qty, buy):
+    """Partial bars for each run of equal keys (keys must be non-decreasing)"""
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    dollar = price * qty
+    return {
+        'key': keys[starts],
+        'datetime': times[starts],
+        'close_time': times[ends],
+        'open': price[starts],
+        'high': np.maximum.reduceat(price, starts),
+        'low': np.minimum.reduceat(price, starts),
+        'close': price[ends],
+        'volume': np.add.reduceat(qty, starts),
+        'dollar_volume': np.add.reduceat(dollar, starts),
+        'buy_volume': np.add.reduceat(np.where(buy, qty, 0.0), starts),
+        'trades': ends - starts + 1,
+    }
+
+
+class BarBuilder:
+    """
+    Streaming builder of time, volume or dollar bars from trade chunks
+
+    Args:
+        kind: 'time', 'volume' (base asset quantity) or 'dollar' (quote value)
+        size: Bar interval for time bars (e.g. '1m', '1h'), otherwise the
+            volume or dollar amount per bar
+    """
+
+    def __init__(self, kind: str = 'time', size='1m'):
+        if kind not in ('time', 'volume', 'dollar'):
+            raise ValueError(f"Unknown bar type: {kind}")
+        self.kind = kind
+        self.size = size
+        self.step = parse_timeframe(size).value if kind == 'time' else float(size)
+        if self.step <= 0:
+            raise ValueError("Bar size must be positive")
+        self._open = None    # Partial bar carried over from the previous chunk (dict of scalars)
+        self._filled = 0.0   # Volume/dollars already in the open bar
+
+    def _keys(self, times, price, qty):
+        """Bar key per trade and the key of the first bar still open after the chunk"""
+        if self.kind == 'time':
+            keys = times.astype('datetime64[ns]').astype(np.int64) // self.step
+            return keys, None
+        amount = qty if self.kind == 'volume' else price * qty
+        cum = self._filled + np.cumsum(amount)
+        keys = np.floor((cum - amount) / self.step).astype(np.int64)
+        # Last bar is complete once the running total reached its threshold
+        next_key = keys[-1] if cum[-1] < (keys[-1] + 1) * self.step else int(cum[-1] // self.step)
+        self._filled = cum[-1] - next_key * self.step
+        return keys, next_key
+
+    def update(self, trades: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add a chunk of trades (in time order)
+
+        Returns:
+            DataFrame of the bars completed by this chunk
+        """
+        if trades.empty:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+        times = trades['time'].to_numpy()
+        price = trades['price'].to_numpy(dtype=float)
+        qty = trades['quantity'].to_numpy(dtype=float)
+        buy = ~trades['is_buyer_maker'].to_numpy(dtype=bool)  # Taker buys
+
+        keys, next_key = self._keys(times, price, qty)
+        bars = _aggregate(keys, times, price, qty, buy)
+        if self.kind != 'time' and self._open is not None:
+            # Keys restart at 0 every chunk; key 0 continues the carried bar
+            self._open['key'] = 0
+
+        if self._open is not None and bars['key'][0] == self._open['key']:
+            first = {col: values[0] for col, values in bars.items()}
+            merged = {
+                **self._open,
+                'close_time': first['close_time'],
+                'high': max(self._open['high'], first['high']),
+                'low': min(self._open['low'], first['low']),
+                'close': first['close'],
+                **{col: self._open[col] + first[col] for col in _SUMS},
+            }
+            for col in bars:
+                bars[col] = bars[col].copy()
+                bars[col][0] = merged[col]
+        elif self._open is not None:
+            bars = {col: np.r_[np.asarray([self._open[col]], dtype=bars[col].dtype), bars[col]] for col in bars}
+
+        # Hold back the last bar unless its threshold was reached
+        done = len(bars['key']) - 1 if next_key is None or next_key == bars['key'][-1] else len(bars['key'])
+        self._open = {col: values[-1] for col, values in bars.items()} if done < len(bars['key']) else None
+        return self._frame({col: values[:done] for col, values in bars.items()})
+
+    def flush(self) -> pd.DataFrame:
+        """Emit the partial bar still open (call once at the end of the stream)"""
+        bars = {col: np.asarray([value]) for col, value in self._open.items()} if self._open else None
+        self._open = None
+        self._filled = 0.0
+        return self._frame(bars) if bars else pd.DataFrame(columns=BAR_COLUMNS)
+
+    def _frame(self, bars):
+        df = pd.DataFrame({col: bars[col] for col in BAR_COLUMNS if col in bars})
+        if self.kind == 'time':
+            # Time bars are labelled by their period, not by their first and last trade
+            start = pd.to_datetime(bars['key'] * self.step)
+            df['datetime'] = start
+            df['close_time'] = start + pd.Timedelta(self.step, unit='ns')
+        df['vwap'] = df['dollar_volume'] / df['volume']
+        return df[BAR_COLUMNS]
+
+
+def build_bars(source, kind: str = 'time', size='1m', store_dir: Optional[str] = None,
+               name: Optional[str] = None, chunk_size: int = 1_000_000):
+    """
+    Build bars from trade files, chunk by chunk
+
+    Args:
+        source: aggTrades CSV path, glob pattern or list of paths
+        kind: 'time', 'volume' or 'dollar'
+        size: Interval for time bars, amount per bar otherwise
+        store_dir: ColumnStore directory to append the bars to as they are
+            completed (None returns them as one DataFrame instead)
+        name: Dataset name (default: '<first file>@<kind>_<size>')
+        chunk_size: Trades per chunk
+
+    Returns:
+        Number of bars written when store_dir is given, otherwise the bars
+    """
+    builder = BarBuilder(kind, size)
+    store = ColumnStore(store_dir) if store_dir else None
+    if store is not None:
+        stem = os.path.splitext(os.path.basename(_expand_sources(source)[0]))[0]
+        name = name or f"{stem}@{kind}_{size}"
+        store.delete(name)
+
+    def emit(bars):
+        if bars.empty:
+            return 0
+        if store is not None:
+            store.append(name, bars, attrs={'kind': kind, 'size': str(size)})
+        else:
+            frames.append(bars)
+        return len(bars)
+
+    frames = []
+    count = sum(emit(builder.update(trades)) for trades in read_trades(source, chunk_size))
+    count += emit(builder.flush())
+
+    if store is not None:
+        return count
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=BAR_COLUMNS)
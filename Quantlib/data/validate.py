@@ -0,0 +1,185 @@
+"""
+Ingest-time validation and normalization of OHLCV datasets
+
+validate_dataset runs once per source file. It normalizes column names and
+dtypes, sorts, drops duplicate timestamps, repairs inconsistent OHLC rows
+and reports gaps. It then stores the cleaned frame, stamped with a content
+fingerprint, in a ColumnStore next to the source. Loaders call
+load_validated and get the already clean frame back without repeating any
+of that work, until the source file changes.
+"""
+import hashlib
+import os
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .column_store import ColumnStore
+from .resample import infer_timeframe
+
+# Bump when the cleaning rules change so stamped datasets are rebuilt
+VALIDATOR_VERSION = 1
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip and lower-case column names ('Volume' -> 'volume', 'Volume USD' -> 'volume usd')"""
+    df.columns = [str(col).strip().lower() for col in df.columns]
+    return df
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Short content hash of the timestamps and OHLCV values"""
+    digest = hashlib.sha256()
+    digest.update(df['datetime'].to_numpy().astype('datetime64[ns]').astype(np.int64).tobytes())
+    for col in PRICE_COLUMNS + (['volume'] if 'volume' in df.columns else []):
+        digest.update(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def is_validated(df: pd.DataFrame) -> bool:
+    """
+    Whether df is a clean frame as produced by validate_ohlcv and unchanged since
+
+    Checks the stamped fingerprint against the current contents, lower-cased
+    column names and a datetime64 'datetime' column in ascending order, so a
+    frame edited or re-sorted after validation (attrs survive both) is not
+    trusted.
+    """
+    stamp = df.attrs.get('fingerprint')
+    if not stamp or 'datetime' not in df.columns:
+        return False
+    if any(not isinstance(col, str) or col != col.strip().lower() for col in df.columns):
+        return False
+    times = df['datetime']
+    if not pd.api.types.is_datetime64_any_dtype(times) or not times.is_monotonic_increasing:
+        return False
+    try:
+        return fingerprint(df) == stamp
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def validate_ohlcv(df: pd.DataFrame, repair: bool = True, max_gaps: int = 20) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Clean an OHLCV frame and report what was wrong with it
+
+    Args:
+        df: Raw frame with a datetime column and OHLC(V) columns in any case
+        repair: Widen high/low to contain open/close and clip negative volume
+        max_gaps: Number of gaps listed in the report (all are counted)
+
+    Returns:
+        tuple: (clean_df, report) where clean_df is sorted by a unique
+        datetime64 'datetime' column with float64 OHLCV, a RangeIndex and
+        attrs['fingerprint'] set
+    """
+    df = normalize_columns(df.copy())
+    missing = [col for col in ['datetime'] + PRICE_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    report = {'rows_in': len(df)}
+    df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
+    for col in PRICE_COLUMNS + [c for c in df.columns if 'volume' in c]:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float64)
+
+    bad = df['datetime'].isna() | df[PRICE_COLUMNS].isna().any(axis=1)
+    report['invalid_rows'] = int(bad.sum())
+    df = df[~bad]
+
+    if not df['datetime'].is_monotonic_increasing:
+        df = df.sort_values('datetime', kind='stable')
+    dup = df['datetime'].duplicated(keep='last')
+    report['duplicates'] = int(dup.sum())
+    df = df[~dup].reset_index(drop=True)
+
+    body_high = df[['open', 'close']].max(axis=1)
+    body_low = df[['open', 'close']].min(axis=1)
+    broken = (df['high'] < body_high) | (df['low'] > body_low) | (df['high'] < df['low'])
+    report['inconsistent_ohlc'] = int(broken.sum())
+    negative_volume = df['volume'] < 0 if 'volume' in df.columns else pd.Series(False, index=df.index)
+    report['negative_volume'] = int(negative_volume.sum())
+    if repair:
+        df['high'] = np.maximum(df['high'], np.maximum(body_high, df['low']))
+        df['low'] = np.minimum(df['low'], body_low)
+        if 'volume' in df.columns:
+            df['volume'] = df['volume'].clip(lower=0)
+
+    report['gaps'] = 0
+    report['missing_bars'] = 0
+    report['gap_list'] = []
+    if len(df) > 1:
+        step = infer_timeframe(df)
+        report['timeframe'] = str(step)
+        diffs = df['datetime'].diff()
+        gap_rows = np.flatnonzero((diffs > step).to_numpy())
+        report['gaps'] = len(gap_rows)
+        report['missing_bars'] = int(((diffs.iloc[gap_rows] // step) - 1).sum())
+        report['gap_list'] = [(str(df['datetime'].iloc[i - 1]), str(df['datetime'].iloc[i]))
+                              for i in gap_rows[:max_gaps]]
+
+    report['rows_out'] = len(df)
+    report['fingerprint'] = fingerprint(df)
+    df.attrs['fingerprint'] = report['fingerprint']
+    return df, report
+
+
+def _store_for(path, store_dir):
+    return ColumnStore(store_dir or os.path.join(os.path.dirname(os.path.abspath(path)), '.bars'))
+
+
+def _clean_key(path):
+    return f"{os.path.splitext(os.path.basename(path))[0]}@clean"
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns, 'version': VALIDATOR_VERSION}
+
+
+def validate_dataset(path: str, repair: bool = True, store_dir: Optional[str] = None,
+                     verbose: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Validate a CSV once and store the cleaned, fingerprinted result
+
+    Args:
+        path: Source CSV
+        repair: Passed to validate_ohlcv
+        store_dir: ColumnStore directory (default: .bars next to the source)
+        verbose: Print a summary of the problems found
+
+    Returns:
+        tuple: (clean_df, report)
+    """
+    df, report = validate_ohlcv(pd.read_csv(path), repair=repair)
+    store = _store_for(path, store_dir)
+    store.write(_clean_key(path), df, attrs={**_signature(path), 'report': report})
+
+    if verbose:
+        problems = {k: report[k] for k in ('invalid_rows', 'duplicates', 'inconsistent_ohlc',
+                                           'negative_volume', 'gaps') if report[k]}
+        if problems:
+            print(f"⚠️ {path}: {problems} (missing bars: {report['missing_bars']})")
+        print(f"Validated {path}: {report['rows_out']} rows, fingerprint {report['fingerprint']}")
+    return df, report
+
+
+def load_validated(path: str, store_dir: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Cleaned frame stored by validate_dataset, if it is still current
+
+    Returns:
+        DataFrame with attrs['fingerprint'] set, or None when the source was
+        never validated or has changed since
+    """
+    store = _store_for(path, store_dir)
+    key = _clean_key(path)
+    if not store.exists(key):
+        return None
+    attrs = store.meta(key)['attrs']
+    if any(attrs.get(k) != v for k, v in _signature(path).items()):
+        return None
+    df = store.read(key, index=None, mmap=False)
+    df.attrs['fingerprint'] = attrs['report']['fingerprint']
+    return df
@@ -4,12 +4,31 @@ Trade execution module initialization
 from .binance_broker import BinanceBroker
 from .trade_executor import TradeExecutor, LiveExecutor
 from .live_ml_strategy import LiveMLStrategy
+from .live_runtime import LiveRuntime, ReplaySource, PollingCSVSource, WebsocketKlineSource
 from .symbol_config import round_quantity
+from .async_broker import AsyncBinanceBroker, SyncBroker, BinanceAPIError
+from .paper_broker import PaperBroker
+from .exchange_info import ExchangeInfoCache
+from .order_manager import OrderManager
+from .multi_symbol import MultiSymbolRuntime, MultiplexKlineSource, MultiReplaySource
 
 __all__ = [
     'BinanceBroker',
     'TradeExecutor',
     'LiveExecutor',
     'LiveMLStrategy',
-    'round_quantity'
-]
\ No newline at end of file
+    'LiveRuntime',
+    'ReplaySource',
+    'PollingCSVSource',
+    'WebsocketKlineSource',
+    'round_quantity',
+    'AsyncBinanceBroker',
+    'SyncBroker',
+    'BinanceAPIError',
+    'PaperBroker',
+    'ExchangeInfoCache',
+    'OrderManager',
+    'MultiSymbolRuntime',
+    'MultiplexKlineSource',
+    'MultiReplaySource'
+]
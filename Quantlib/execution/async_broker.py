@@ -0,0 +1,324 @@
+"""
+Async Binance broker with a pooled HTTP session and rate-limit tracking
+
+All requests share one aiohttp session (keep-alive connection pool), so an
+order costs one round trip on an already open connection. Request weight is
+tracked locally and re-synchronised from the X-MBX-USED-WEIGHT-1M response
+header; when the next request would exceed the budget the call waits for
+the window to roll over instead of getting the key banned. An HTTP 429 pauses
+every request until its Retry-After and is retried at most max_retries
+times; an HTTP 418 (IP ban) is raised straight away.
+
+The broker's methods are coroutines. Synchronous callers (OrderManager,
+LiveExecutor, LiveMLStrategy) use it through SyncBroker, which runs it on
+an event loop in a background thread.
+"""
+import asyncio
+import hashlib
+import hmac
+import inspect
+import threading
+import time
+from urllib.parse import urlencode
+import aiohttp
+from .binance_broker import BrokerInterface
+
+SPOT_URL = "https://api.binance.com"
+FUTURES_URL = "https://fapi.binance.com"
+SPOT_TESTNET_URL = "https://testnet.binance.vision"
+FUTURES_TESTNET_URL = "https://testnet.binancefuture.com"
+
+# Request weights of the endpoints used below (Binance API docs)
+ENDPOINT_WEIGHTS = {
+    "/api/v3/order": 1,
+    "/api/v3/account": 20,
+    "/api/v3/exchangeInfo": 20,
+    "/fapi/v1/order": 1,
+    "/fapi/v1/batchOrders": 5,
+    "/fapi/v1/leverage": 1,
+    "/fapi/v1/exchangeInfo": 1,
+    "/fapi/v2/balance": 5,
+    "/fapi/v2/account": 5,
+    "/fapi/v2/positionRisk": 5,
+}
+
+
+class BinanceAPIError(Exception):
+    """Error response returned by the exchange"""
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.payload = payload
+        super().__init__(f"HTTP {status}: {payload}")
+
+
+class WeightRateLimiter:
+    """
+    Track request weight used in the current one-minute window
+
+    Args:
+        limit: Weight allowed per minute (1200 spot, 2400 futures)
+        safety: Fraction of the limit to use before waiting
+    """
+
+    def __init__(self, limit=1200, safety=0.9, window=60.0):
+        self.limit = limit
+        self.budget = limit * safety
+        self.window = window
+        self.used = 0
+        self.window_start = time.time() // window * window
+        self.blocked_until = 0.0
+
+    def _roll(self, now):
+        start = now // self.window * self.window
+        if start != self.window_start:
+            self.window_start = start
+            self.used = 0
+
+    async def acquire(self, weight):
+        """Reserve weight, sleeping through a back-off or until the next window if the budget is spent"""
+        while True:
+            # No await between the check and the reservation, so callers on the loop cannot interleave
+            now = time.time()
+            self._roll(now)
+            if now < self.blocked_until:
+                wait = self.blocked_until - now
+            elif self.used + weight > self.budget:
+                wait = self.window_start + self.window - now
+            else:
+                self.used += weight
+                return
+            await asyncio.sleep(wait)
+
+    def update(self, used_weight):
+        """Re-synchronise with the exchange's view of the used weight"""
+        self._roll(time.time())
+        self.used = max(self.used, int(used_weight))
+
+    def backoff(self, seconds):
+        """Exchange asked us to back off (HTTP 429/418): hold every acquire() for seconds"""
+        self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+
+class AsyncBinanceBroker(BrokerInterface):
+    """
+    Async BrokerInterface implementation (methods are coroutines)
+
+    Args:
+        api_key, api_secret: Binance credentials
+        use_futures: Trade USDⓈ-M futures instead of spot
+        testnet: Use the testnet endpoints
+        base_url: Override the REST endpoint (e.g. a local mock exchange)
+        pool_size: Maximum number of pooled connections
+        timeout: Request timeout in seconds
+        max_retries: Times a request rejected with HTTP 429 is retried before
+            BinanceAPIError is raised
+    """
+
+    def __init__(self, api_key, api_secret, use_futures=False, testnet=False, base_url=None,
+                 pool_size=20, timeout=10, recv_window=5000, max_retries=3):
+        self.api_key = api_key
+        self.api_secret = api_secret.encode()
+        self.use_futures = use_futures
+        if base_url is None:
+            if use_futures:
+                base_url = FUTURES_TESTNET_URL if testnet else FUTURES_URL
+            else:
+                base_url = SPOT_TESTNET_URL if testnet else SPOT_URL
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.recv_window = recv_window
+        self.max_retries = max_retries
+        self.rate_limiter = WeightRateLimiter(limit=2400 if use_futures else 1200)
+        self._session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"X-MBX-APIKEY": self.api_key}
+            )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _sign(self, params):
+        params = {k: v for k, v in params.items() if v is not None}
+        params["timestamp"] = int(time.time() * 1000)
+        params["recvWindow"] = self.recv_window
+        query = urlencode(params)
+        signature = hmac.new(self.api_secret, query.encode(), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def _request(self, method, path, params=None, signed=True):
+        await self.open()
+        params = params or {}
+        attempt = 0
+        while True:
+            # A retry is a new request: it uses weight again and needs a fresh timestamp/signature
+            await self.rate_limiter.acquire(ENDPOINT_WEIGHTS.get(path, 1))
+            query = self._sign(params) if signed else urlencode({k: v for k, v in params.items() if v is not None})
+            url = f"{self.base_url}{path}?{query}" if query else f"{self.base_url}{path}"
+            async with self._session.request(method, url) as resp:
+                used = resp.headers.get("X-MBX-USED-WEIGHT-1M") or resp.headers.get("X-MBX-USED-WEIGHT-1m")
+                if used is not None:
+                    self.rate_limiter.update(used)
+                if resp.status in (418, 429):
+                    self.rate_limiter.backoff(float(resp.headers.get("Retry-After", 1)))
+                    if resp.status == 429 and attempt < self.max_retries:
+                        attempt += 1
+                        continue
+                payload = await resp.json(content_type=None)
+                if resp.status >= 400:
+                    raise BinanceAPIError(resp.status, payload)
+                return payload
+
+    def _order_path(self, is_futures):
+        return "/fapi/v1/order" if is_futures else "/api/v3/order"
+
+    async def _order(self, side, symbol, quantity, price=None, is_futures=None):
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        params = {
+            "symbol": symbol,
+            "side": side,
+            "type": "MARKET" if price is None else "LIMIT",
+            "quantity": quantity,
+        }
+        if price is not None:
+            params.update(price=price, timeInForce="GTC")
+        return await self._request("POST", self._order_path(is_futures), params)
+
+    async def buy(self, symbol, quantity, price=None, is_futures=None):
+        return await self._order("BUY", symbol, quantity, price, is_futures)
+
+    async def sell(self, symbol, quantity, price=None, is_futures=None):
+        return await self._order("SELL", symbol, quantity, price, is_futures)
+
+    async def submit_orders(self, orders):
+        """
+        Submit several orders concurrently over the pooled session
+
+        Args:
+            orders: Iterable of dicts with side ('BUY'/'SELL'), symbol,
+                quantity and optional price / is_futures
+
+        Returns:
+            list of responses (or exceptions) in the same order
+        """
+        return await asyncio.gather(*[
+            self._order(o["side"], o["symbol"], o["quantity"], o.get("price"), o.get("is_futures"))
+            for o in orders
+        ], return_exceptions=True)
+
+    async def get_balance(self, asset="USDT", is_futures=None):
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        if is_futures:
+            for b in await self._request("GET", "/fapi/v2/balance"):
+                if b["asset"] == asset:
+                    return b["balance"]
+            return None
+        account = await self._request("GET", "/api/v3/account")
+        for b in account["balances"]:
+            if b["asset"] == asset:
+                return b
+        return None
+
+    async def get_position(self, symbol):
+        for pos in await self._request("GET", "/fapi/v2/positionRisk", {"symbol": symbol}):
+            if float(pos["positionAmt"]) != 0:
+                return pos
+        return None
+
+    async def get_account_info(self, is_futures=None):
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        return await self._request("GET", "/fapi/v2/account" if is_futures else "/api/v3/account")
+
+    async def set_leverage(self, symbol, leverage):
+        return await self._request("POST", "/fapi/v1/leverage", {"symbol": symbol, "leverage": leverage})
+
+    async def get_exchange_info(self, is_futures=None):
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        path = "/fapi/v1/exchangeInfo" if is_futures else "/api/v3/exchangeInfo"
+        return await self._request("GET", path, signed=False)
+
+
+class SyncBroker(BrokerInterface):
+    """
+    Blocking facade over an AsyncBinanceBroker
+
+    The async broker runs on its own event loop in a daemon thread. Each
+    call is submitted to that loop and waited for, so one pooled session
+    serves every call, and callers can be plain threads, e.g. LiveRuntime's
+    order executor.
+
+    Args:
+        broker: AsyncBinanceBroker (or another broker whose methods are coroutines)
+    """
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.use_futures = getattr(broker, "use_futures", False)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-broker", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self):
+        """Close the broker's session and stop the background loop"""
+        if self._loop.is_closed():
+            return
+        self._call(self.broker.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def buy(self, symbol, quantity, price=None, is_futures=None):
+        return self._call(self.broker.buy(symbol, quantity, price, is_futures))
+
+    def sell(self, symbol, quantity, price=None, is_futures=None):
+        return self._call(self.broker.sell(symbol, quantity, price, is_futures))
+
+    def submit_orders(self, orders):
+        return self._call(self.broker.submit_orders(orders))
+
+    def get_balance(self, asset="USDT", is_futures=None):
+        return self._call(self.broker.get_balance(asset, is_futures))
+
+    def get_position(self, symbol):
+        return self._call(self.broker.get_position(symbol))
+
+    def get_account_info(self, is_futures=None):
+        return self._call(self.broker.get_account_info(is_futures))
+
+    def set_leverage(self, symbol, leverage):
+        return self._call(self.broker.set_leverage(symbol, leverage))
+
+    def get_exchange_info(self, is_futures=None):
+        return self._call(self.broker.get_exchange_info(is_futures))
+
+
+def as_sync_broker(broker):
+    """broker itself if its methods are plain functions, otherwise a SyncBroker around it"""
+    if inspect.iscoroutinefunction(getattr(broker, "buy", None)):
+        return SyncBroker(broker)
+    return broker
@@ -1,5 +1,6 @@
 from binance.client import Client
 from abc import ABC, abstractmethod
+from .exchange_info import ExchangeInfoCache
 
 class BrokerInterface(ABC):
     @abstractmethod
@@ -20,11 +21,32 @@ class BrokerInterface(ABC):
     @abstractmethod
     def set_leverage(self, symbol, leverage): pass
 
+    def submit_orders(self, orders):
+        """
+        Submit several orders; brokers with a batch endpoint override this
+
+        Args:
+            orders: Iterable of dicts with side ('BUY'/'SELL'), symbol,
+                quantity and optional price / is_futures
+
+        Returns:
+            list of responses (or exceptions) in the same order
+        """
+        results = []
+        for o in orders:
+            place = self.buy if o["side"] == "BUY" else self.sell
+            try:
+                results.append(place(o["symbol"], o["quantity"], o.get("price"), o.get("is_futures")))
+            except Exception as e:
+                results.append(e)
+        return results
+
 
 class BinanceBroker(BrokerInterface):
     def __init__(self, api_key, api_secret, use_futures=False, testnet=False):
         self.use_futures = use_futures
         self.client = Client(api_key, api_secret)
+        self._exchange_info = {}
 
         if testnet:
             self.client.API_URL = 'https://testnet.binance.vision/api'
@@ -81,11 +103,42 @@ class BinanceBroker(BrokerInterface):
     def set_leverage(self, symbol, leverage):
         return self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
 
+    def submit_orders(self, orders):
+        """Futures orders go out in batches of 5 through /fapi/v1/batchOrders; spot has no batch endpoint"""
+        orders = list(orders)
+        results = [None] * len(orders)
+        batch = [i for i, o in enumerate(orders) if (o.get("is_futures") if o.get("is_futures") is not None else self.use_futures)]
+        batched = set(batch)
+        spot = [i for i in range(len(orders)) if i not in batched]
+
+        for start in range(0, len(batch), 5):
+            chunk = batch[start:start + 5]
+            payload = []
+            for i in chunk:
+                o = orders[i]
+                order = {"symbol": o["symbol"], "side": o["side"], "quantity": str(o["quantity"])}
+                if o.get("price") is None:
+                    order["type"] = "MARKET"
+                else:
+                    order.update(type="LIMIT", price=str(o["price"]), timeInForce="GTC")
+                payload.append(order)
+            try:
+                responses = self.client.futures_place_batch_order(batchOrders=payload)
+            except Exception as e:
+                responses = [e] * len(chunk)
+            for i, r in zip(chunk, responses):
+                results[i] = r
+
+        for i, r in zip(spot, super().submit_orders([orders[i] for i in spot])):
+            results[i] = r
+        return results
+
+    def get_exchange_info(self, is_futures=None):
+        """Symbol filters cache for spot or futures, downloaded at most once per TTL"""
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        if is_futures not in self._exchange_info:
+            self._exchange_info[is_futures] = ExchangeInfoCache(self.client, is_futures=is_futures)
+        return self._exchange_info[is_futures].load()
+
     def get_available_symbols(self, is_futures=False):
-        if is_futures or self.use_futures:
-            exchange_info = self.client.futures_exchange_info()
-            return [s["symbol"] for s in exchange_info["symbols"] if s["contractType"] == "PERPETUAL"]
-        else:
-            exchange_info = self.client.get_exchange_info()
-            return [s["symbol"] for s in exchange_info["symbols"] if s["status"] == "TRADING"]
-    
\ No newline at end of file
+        return self.get_exchange_info(is_futures or self.use_futures).symbols()
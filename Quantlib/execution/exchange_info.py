@@ -0,0 +1,215 @@
+"""
+Cached Binance exchange metadata and vectorized order rounding
+
+The full exchangeInfo payload is large and slow to download, but the symbol
+filters in it change rarely. ExchangeInfoCache downloads it once, keeps only
+the per-symbol filters (step size, min quantity, tick size, min notional),
+persists them to a JSON file with a TTL and serves O(1) lookups. The filters
+are also held as NumPy arrays so quantities and prices for a whole batch of
+orders can be rounded in one vectorized call.
+"""
+import json
+import os
+import time
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from .symbol_config import SYMBOL_CONFIG
+
+
+def _decimals(step):
+    """Number of decimals implied by a step such as '0.00100000' -> 3"""
+    exponent = Decimal(str(step)).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def parse_symbol_filters(exchange_info):
+    """
+    Extract the trading filters of every symbol in an exchangeInfo payload
+
+    Returns:
+        dict of symbol -> {step_size, min_qty, tick_size, min_notional,
+        precision, price_precision, status, contract_type}
+    """
+    filters = {}
+    for s in exchange_info["symbols"]:
+        f = {flt["filterType"]: flt for flt in s.get("filters", [])}
+        lot = f.get("LOT_SIZE", {})
+        price = f.get("PRICE_FILTER", {})
+        notional = f.get("MIN_NOTIONAL") or f.get("NOTIONAL") or {}
+        step = float(lot.get("stepSize", 0) or 0)
+        tick = float(price.get("tickSize", 0) or 0)
+        filters[s["symbol"]] = {
+            "step_size": step,
+            "min_qty": float(lot.get("minQty", 0) or 0),
+            "tick_size": tick,
+            "min_notional": float(notional.get("minNotional", notional.get("notional", 0)) or 0),
+            "precision": _decimals(lot["stepSize"]) if step else 6,
+            "price_precision": _decimals(price["tickSize"]) if tick else 8,
+            "status": s.get("status"),
+            "contract_type": s.get("contractType")
+        }
+    return filters
+
+
+class ExchangeInfoCache:
+    """
+    Symbol filters loaded once and persisted to disk with a TTL
+
+    Args:
+        client: python-binance Client used to refresh (None = disk/SYMBOL_CONFIG only)
+        is_futures: Load USDⓈ-M futures instead of spot metadata
+        path: JSON cache file (default data/exchange_info_<spot|futures>.json)
+        ttl: Seconds before the cached metadata is refreshed from the exchange
+    """
+
+    def __init__(self, client=None, is_futures=False, path=None, ttl=24 * 3600):
+        self.client = client
+        self.is_futures = is_futures
+        self.path = path or os.path.join("data", f"exchange_info_{'futures' if is_futures else 'spot'}.json")
+        self.ttl = ttl
+        self.filters = {}
+        self.fetched_at = 0.0  # When the exchange produced the filters (0 = SYMBOL_CONFIG)
+        self.checked_at = 0.0  # When this instance last loaded them
+        self._index = pd.Index([])
+        self._rows = {}
+
+    # ------------------------------------------------------------------ loading
+    @property
+    def expired(self):
+        """True once the in-memory filters were loaded more than ttl seconds ago"""
+        return time.time() - self.checked_at > self.ttl
+
+    def load(self, force=False):
+        """
+        Make sure filters are loaded and fresh
+
+        Order of preference: in-memory (within TTL), cache file (within TTL),
+        exchange download, stale cache file, SYMBOL_CONFIG. Whatever is loaded
+        is then served from memory for ttl seconds, so stale or offline
+        filters are not re-read on every lookup.
+        """
+        if self.filters and not self.expired and not force:
+            return self
+        stale = None
+        if not force and os.path.exists(self.path):
+            with open(self.path) as f:
+                cached = json.load(f)
+            if time.time() - cached["fetched_at"] <= self.ttl:
+                return self._set(cached["filters"], cached["fetched_at"])
+            stale = cached
+
+        if self.client is not None:
+            try:
+                info = self.client.futures_exchange_info() if self.is_futures else self.client.get_exchange_info()
+                self._set(parse_symbol_filters(info), time.time())
+                self.save()
+                return self
+            except Exception as e:
+                print("⚠️ Exchange info download failed:", e)
+
+        if stale is not None:
+            return self._set(stale["filters"], stale["fetched_at"])
+        if not self.filters:
+            # Offline fallback: the hardcoded lot sizes, without price/notional filters
+            self._set({s: {"tick_size": 0.0, "min_notional": 0.0, "price_precision": 8, "status": "TRADING",
+                           "contract_type": "PERPETUAL", **cfg} for s, cfg in SYMBOL_CONFIG.items()}, 0.0)
+        return self
+
+    def save(self):
+        """Write the filters to the cache file atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"fetched_at": self.fetched_at, "filters": self.filters}, f)
+        os.replace(tmp, self.path)
+
+    def _set(self, filters, fetched_at):
+        self.filters = filters
+        self.fetched_at = fetched_at
+        self.checked_at = time.time()
+        self._index = pd.Index(list(filters))
+        self._rows = {symbol: i for i, symbol in enumerate(self._index)}
+        table = pd.DataFrame.from_dict(filters, orient="index").reindex(self._index)
+        # Arrays aligned with _index; one extra NaN row serves unknown symbols
+        self._step = np.append(table["step_size"].to_numpy(float), np.nan)
+        self._min_qty = np.append(table["min_qty"].to_numpy(float), np.nan)
+        self._tick = np.append(table["tick_size"].to_numpy(float), np.nan)
+        self._min_notional = np.append(table["min_notional"].to_numpy(float), np.nan)
+        self._precision = np.append(table["precision"].to_numpy(float), 6)
+        self._price_precision = np.append(table["price_precision"].to_numpy(float), 8)
+        return self
+
+    # ------------------------------------------------------------------ lookups
+    def get(self, symbol):
+        """Filters of one symbol, or None if unknown"""
+        return self.load().filters.get(symbol)
+
+    def __contains__(self, symbol):
+        return symbol in self.load().filters
+
+    def symbols(self):
+        """Tradable symbols (perpetual contracts for futures, TRADING status for spot)"""
+        self.load()
+        if self.is_futures:
+            return [s for s, f in self.filters.items() if f.get("contract_type") == "PERPETUAL"]
+        return [s for s, f in self.filters.items() if f.get("status") == "TRADING"]
+
+    def _positions(self, symbols):
+        self.load()
+        symbols = np.atleast_1d(np.asarray(symbols, dtype=object))
+        unknown = len(self._index)  # -> NaN row
+        # Dict lookups: a pandas get_indexer call costs more than a typical order batch
+        return np.fromiter((self._rows.get(s, unknown) for s in symbols), dtype=np.intp, count=len(symbols))
+
+    # ------------------------------------------------------------------ rounding
+    def round_quantities(self, symbols, quantities, prices=None):
+        """
+        Floor quantities to each symbol's step size, vectorized
+
+        Args:
+            symbols: Array-like of symbols (one per order)
+            quantities: Array-like of unsigned quantities
+            prices: Optional array-like of prices for the min notional check
+
+        Returns:
+            np.ndarray of valid quantities; orders below min_qty or min
+            notional become 0, unknown symbols become NaN
+        """
+        idx = self._positions(symbols)
+        qty = np.asarray(quantities, dtype=float)
+        step = self._step[idx]
+        has_step = step > 0
+        safe_step = np.where(has_step, step, 1.0)
+        # The epsilon keeps exact multiples (0.3 / 0.1 = 2.9999...) from flooring down a step
+        floored = np.where(has_step, np.floor(qty / safe_step + 1e-9) * safe_step, qty)
+        out = floored.copy()
+        for p in np.unique(self._precision[idx]):
+            mask = self._precision[idx] == p
+            out[mask] = np.round(floored[mask], int(p))
+        out[out < self._min_qty[idx]] = 0.0
+        if prices is not None:
+            out[out * np.asarray(prices, dtype=float) < self._min_notional[idx]] = 0.0
+        out[np.isnan(step)] = np.nan
+        return out
+
+    def round_prices(self, symbols, prices):
+        """
+        Round prices to each symbol's tick size, vectorized
+
+        Returns:
+            np.ndarray of prices on the tick grid (unchanged where no tick size is known)
+        """
+        idx = self._positions(symbols)
+        px = np.asarray(prices, dtype=float)
+        tick = self._tick[idx]
+        has_tick = tick > 0
+        safe_tick = np.where(has_tick, tick, 1.0)
+        rounded = np.where(has_tick, np.round(px / safe_tick) * safe_tick, px)
+        out = rounded.copy()
+        for p in np.unique(self._price_precision[idx]):
+            mask = self._price_precision[idx] == p
+            out[mask] = np.round(rounded[mask], int(p))
+        return out
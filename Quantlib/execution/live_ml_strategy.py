@@ -9,12 +9,33 @@ class LiveMLStrategy:
         self.qty = qty
         self.features = features
 
-    def on_new_tick(self, data_row):
+    def predict(self, data_row):
+        """Model signal for one row of features (1 = long, 0 = flat)"""
         x = {f: data_row[f] for f in self.features}
         signal = self.model.predict(x)
-        quantity = round_quantity(self.symbol, self.qty)
+        # Models return one prediction per row; a single row gives a length-1 array
+        if hasattr(signal, '__len__'):
+            signal = signal[0]
+        return signal
+
+    def on_signal(self, signal):
+        """Place the order for a model signal"""
+        # OrderManager carries the exchange filters; other executors use the shared cache
+        quantity = round_quantity(self.symbol, self.qty, getattr(self.executor, "exchange_info", None))
+
+        if hasattr(self.executor, "set_target"):
+            # Target-position executors (OrderManager): long qty on 1, flat on 0,
+            # so repeated signals do not send repeated orders
+            if signal == 1:
+                return self.executor.set_target(self.symbol, quantity)
+            elif signal == 0:
+                return self.executor.set_target(self.symbol, 0.0)
+            return None
 
         if signal == 1:
-            self.executor.buy(self.symbol, quantity)
+            return self.executor.buy(self.symbol, quantity)
         elif signal == 0:
-            self.executor.sell(self.symbol, quantity)
\ No newline at end of file
+            return self.executor.sell(self.symbol, quantity)
+
+    def on_new_tick(self, data_row):
+        self.on_signal(self.predict(data_row))
@@ -0,0 +1,295 @@
+"""
+Asyncio live trading runtime
+
+Bars flow through three decoupled stages connected by bounded queues:
+
+    source -> [features] -> [prediction] -> [orders]
+
+A full queue makes the upstream stage wait (backpressure). Every bar reaches
+the feature stage, whose rolling state must not skip bars; with
+drop_stale=True a full prediction or order queue instead replaces its oldest
+item, since only the latest feature row or signal matters downstream. Blocking work (model inference, REST order calls) runs
+in a thread pool so the event loop keeps receiving bars. Every bar is
+stamped on arrival and the runtime records per-stage and tick-to-order
+latencies; the order latencies only count signals that sent orders.
+"""
+import asyncio
+import inspect
+import time
+from collections import defaultdict, deque
+import numpy as np
+import pandas as pd
+from Quantlib.data.tail_reader import TailCSVReader
+
+_STOP = object()
+
+
+class LatencyRecorder:
+    """Bounded per-stage latency samples with percentile summaries"""
+
+    def __init__(self, maxlen=100000):
+        self.samples = defaultdict(lambda: deque(maxlen=maxlen))
+
+    def record(self, stage, seconds):
+        self.samples[stage].append(seconds)
+
+    def summary(self):
+        """
+        Returns:
+            DataFrame indexed by stage with count, mean, p50, p95, p99 and max in milliseconds
+        """
+        rows = {}
+        for stage, values in self.samples.items():
+            arr = np.fromiter(values, dtype=float) * 1000
+            if len(arr) == 0:
+                continue
+            rows[stage] = {
+                'count': len(arr),
+                'mean_ms': arr.mean(),
+                'p50_ms': np.percentile(arr, 50),
+                'p95_ms': np.percentile(arr, 95),
+                'p99_ms': np.percentile(arr, 99),
+                'max_ms': arr.max()
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+
+class ReplaySource:
+    """
+    Replay historical bars as a live stream (stand-in for the exchange feed)
+
+    Args:
+        data: DataFrame of bars or path to a CSV file
+        interval: Seconds to wait between bars (0 replays as fast as possible)
+    """
+
+    def __init__(self, data, interval=0.0):
+        self.data = pd.read_csv(data) if isinstance(data, str) else data
+        self.interval = interval
+
+    async def __aiter__(self):
+        for row in self.data.to_dict('records'):
+            yield row
+            await asyncio.sleep(self.interval)
+
+
+class PollingCSVSource:
+    """
+    Poll an append-only CSV file and emit the bars added since the last poll
+
+    Only appended lines are parsed (see TailCSVReader), so a poll costs
+    O(new rows). The first poll loads up to maxlen recent bars into
+    reader.buffer for feature warm-up and emits only the latest one.
+    """
+
+    def __init__(self, path, interval=60, maxlen=500):
+        self.reader = TailCSVReader(path, maxlen=maxlen)
+        self.interval = interval
+
+    async def __aiter__(self):
+        first = True
+        while True:
+            try:
+                rows = self.reader.poll()
+                for row in (rows[-1:] if first else rows):
+                    yield row
+                first = False
+            except Exception as e:
+                print("⚠️ Polling error:", e)
+            await asyncio.sleep(self.interval)
+
+
+class WebsocketKlineSource:
+    """
+    Binance kline websocket bridged into asyncio
+
+    The ThreadedWebsocketManager callback runs on its own thread; messages are
+    handed to the event loop with call_soon_threadsafe, so no thread ever
+    spins waiting for data.
+
+    Args:
+        api_key, api_secret: Binance credentials
+        symbol: Trading symbol, e.g. "BTCUSDT"
+        interval: Kline interval, e.g. '1m'
+        closed_only: Only emit klines whose bar has closed
+    """
+
+    def __init__(self, api_key, api_secret, symbol, interval='1m', closed_only=True):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.symbol = symbol
+        self.interval = interval
+        self.closed_only = closed_only
+
+    @staticmethod
+    def kline_to_bar(k):
+        """Convert a kline payload ('k' field of the message) into a bar dict"""
+        return {
+            "datetime": k["t"],
+            "open": float(k["o"]),
+            "high": float(k["h"]),
+            "low": float(k["l"]),
+            "close": float(k["c"]),
+            "volume": float(k["v"]),
+            "closed": k["x"]
+        }
+
+    async def __aiter__(self):
+        from binance import ThreadedWebsocketManager
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        def handle_socket(msg):
+            try:
+                k = msg['k']
+            except (KeyError, TypeError):
+                print("⚠️ WebSocket error:", msg)
+                return
+            if self.closed_only and not k["x"]:
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, self.kline_to_bar(k))
+
+        twm = ThreadedWebsocketManager(api_key=self.api_key, api_secret=self.api_secret)
+        twm.start()
+        twm.start_kline_socket(callback=handle_socket, symbol=self.symbol.lower(), interval=self.interval)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            twm.stop()
+
+
+class LiveRuntime:
+    """
+    Run a live strategy as an asyncio pipeline
+
+    Args:
+        source: Async iterable of bar dicts (ReplaySource, PollingCSVSource,
+            WebsocketKlineSource, ...)
+        strategy: Object with predict(row) and on_signal(signal), e.g. LiveMLStrategy;
+            on_signal may be a coroutine function (awaited on the event loop) and
+            returns something truthy (e.g. the order responses) when it sent orders
+        feature_fn: Optional callable(bar) -> feature row, or None while warming up
+        queue_size: Capacity of each inter-stage queue
+        drop_stale: When the prediction or order queue is full, drop its oldest
+            item instead of waiting (raw bars are never dropped)
+        predict_executor: concurrent.futures executor for predict() (None = loop default)
+        order_executor: concurrent.futures executor for on_signal() (None = loop default)
+    """
+
+    def __init__(self, source, strategy, feature_fn=None, queue_size=100, drop_stale=False,
+                 predict_executor=None, order_executor=None):
+        self.source = source
+        self.strategy = strategy
+        self.feature_fn = feature_fn
+        self.queue_size = queue_size
+        self.drop_stale = drop_stale
+        self.predict_executor = predict_executor
+        self.order_executor = order_executor
+        self.latency = LatencyRecorder()
+        self.bars_received = 0
+        self.bars_dropped = 0  # Feature rows and signals superseded by newer ones
+        self.signals_handled = 0
+        self.signals_ordered = 0  # Signals for which on_signal sent orders
+        self.errors = 0  # Bars skipped because a stage raised
+        self._stop_event = None
+
+    async def _put(self, queue, item):
+        if self.drop_stale and queue.full():
+            queue.get_nowait()
+            self.bars_dropped += 1
+        await queue.put(item)
+
+    async def _ingest(self, out_q, max_bars):
+        try:
+            async for bar in self.source:
+                t_recv = time.perf_counter()
+                self.bars_received += 1
+                await out_q.put((t_recv, bar))
+                if self._stop_event.is_set() or (max_bars is not None and self.bars_received >= max_bars):
+                    break
+        finally:
+            await out_q.put(_STOP)
+
+    async def _feature_stage(self, in_q, out_q):
+        while True:
+            item = await in_q.get()
+            if item is _STOP:
+                await out_q.put(_STOP)
+                return
+            t_recv, bar = item
+            t0 = time.perf_counter()
+            try:
+                row = self.feature_fn(bar) if self.feature_fn else bar
+            except Exception as e:
+                print("⚠️ Feature error:", e)
+                self.errors += 1
+                continue
+            self.latency.record('features', time.perf_counter() - t0)
+            if row is not None:
+                await self._put(out_q, (t_recv, row))
+
+    async def _predict_stage(self, in_q, out_q):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await in_q.get()
+            if item is _STOP:
+                await out_q.put(_STOP)
+                return
+            t_recv, row = item
+            t0 = time.perf_counter()
+            try:
+                signal = await loop.run_in_executor(self.predict_executor, self.strategy.predict, row)
+            except Exception as e:
+                print("⚠️ Prediction error:", e)
+                self.errors += 1
+                continue
+            self.latency.record('predict', time.perf_counter() - t0)
+            await self._put(out_q, (t_recv, signal))
+
+    async def _order_stage(self, in_q):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await in_q.get()
+            if item is _STOP:
+                return
+            t_recv, signal = item
+            t0 = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(self.strategy.on_signal):
+                    # Async brokers (AsyncBinanceBroker) run on the event loop itself
+                    sent = await self.strategy.on_signal(signal)
+                else:
+                    sent = await loop.run_in_executor(self.order_executor, self.strategy.on_signal, signal)
+            except Exception as e:
+                print("⚠️ Order error:", e)
+                self.errors += 1
+                continue
+            t1 = time.perf_counter()
+            self.signals_handled += 1
+            if not sent:
+                # Coalesced or no-op signal: nothing reached the exchange
+                continue
+            self.signals_ordered += 1
+            self.latency.record('order', t1 - t0)
+            self.latency.record('tick_to_order', t1 - t_recv)
+
+    async def run(self, max_bars=None):
+        """Process bars until the source is exhausted, max_bars is reached or stop() is called"""
+        self._stop_event = asyncio.Event()
+        feature_q = asyncio.Queue(self.queue_size)
+        predict_q = asyncio.Queue(self.queue_size)
+        order_q = asyncio.Queue(self.queue_size)
+        await asyncio.gather(
+            self._ingest(feature_q, max_bars),
+            self._feature_stage(feature_q, predict_q),
+            self._predict_stage(predict_q, order_q),
+            self._order_stage(order_q)
+        )
+        return self.latency.summary()
+
+    def stop(self):
+        """Request the runtime to stop after the current bar"""
+        if self._stop_event is not None:
+            self._stop_event.set()
@@ -0,0 +1,144 @@
+"""
+Local mock of the Binance REST endpoints used by AsyncBinanceBroker
+
+Runs an aiohttp server on 127.0.0.1 that fills market orders at a settable
+price, keeps balances and positions in memory, checks request signatures
+and reports used weight the way the real exchange does. Nothing touches the
+network, so broker code can be exercised and load-tested offline:
+
+    async with MockExchange(prices={"BTCUSDT": 50000}) as exchange:
+        async with AsyncBinanceBroker("key", "secret", base_url=exchange.url) as broker:
+            await broker.buy("BTCUSDT", 0.01)
+"""
+import asyncio
+import hashlib
+import hmac
+import itertools
+import time
+from aiohttp import web
+from .async_broker import ENDPOINT_WEIGHTS
+
+
+class MockExchange:
+    """
+    In-process mock exchange
+
+    Args:
+        prices: Dict of symbol -> fill price
+        api_secret: Secret used to verify request signatures (None skips checks)
+        balance: Starting quote balance (USDT)
+        latency: Artificial processing delay per request in seconds
+        weight_limit: Used weight per minute after which requests get HTTP 429
+    """
+
+    def __init__(self, prices=None, api_secret="secret", balance=100000.0, latency=0.0, weight_limit=2400):
+        self.prices = dict(prices or {})
+        self.api_secret = api_secret.encode() if api_secret else None
+        self.balance = balance
+        self.latency = latency
+        self.weight_limit = weight_limit
+        self.positions = {}
+        self.leverage = {}
+        self.orders = []
+        self.used_weight = 0
+        self._window = int(time.time() // 60)
+        self._order_ids = itertools.count(1)
+        self._runner = None
+        self.url = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application(middlewares=[self._middleware])
+        for path in ("/api/v3/order", "/fapi/v1/order"):
+            app.router.add_post(path, self._order)
+        app.router.add_post("/fapi/v1/leverage", self._set_leverage)
+        app.router.add_get("/fapi/v2/balance", self._futures_balance)
+        app.router.add_get("/fapi/v2/positionRisk", self._position_risk)
+        app.router.add_get("/fapi/v2/account", self._account)
+        app.router.add_get("/api/v3/account", self._account)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        window = int(time.time() // 60)
+        if window != self._window:
+            self._window = window
+            self.used_weight = 0
+        self.used_weight += ENDPOINT_WEIGHTS.get(request.path, 1)
+        headers = {"X-MBX-USED-WEIGHT-1M": str(self.used_weight)}
+        if self.used_weight > self.weight_limit:
+            return web.json_response({"code": -1003, "msg": "Too many requests"}, status=429,
+                                     headers={**headers, "Retry-After": "1"})
+
+        if self.api_secret is not None and "signature" in request.query:
+            query, _, signature = request.query_string.rpartition("&signature=")
+            expected = hmac.new(self.api_secret, query.encode(), hashlib.sha256).hexdigest()
+            if signature != expected:
+                return web.json_response({"code": -1022, "msg": "Signature invalid"}, status=400, headers=headers)
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def _order(self, request):
+        q = request.query
+        symbol = q["symbol"]
+        if symbol not in self.prices:
+            return web.json_response({"code": -1121, "msg": "Invalid symbol."}, status=400)
+        qty = float(q["quantity"])
+        price = float(q.get("price") or self.prices[symbol])
+        signed = qty if q["side"] == "BUY" else -qty
+        self.positions[symbol] = self.positions.get(symbol, 0.0) + signed
+        self.balance -= signed * price
+        order = {
+            "orderId": next(self._order_ids),
+            "symbol": symbol,
+            "side": q["side"],
+            "type": q["type"],
+            "status": "FILLED",
+            "origQty": q["quantity"],
+            "executedQty": q["quantity"],
+            "avgPrice": str(price),
+            "updateTime": int(time.time() * 1000),
+        }
+        self.orders.append(order)
+        return web.json_response(order)
+
+    async def _set_leverage(self, request):
+        symbol = request.query["symbol"]
+        self.leverage[symbol] = int(request.query["leverage"])
+        return web.json_response({"symbol": symbol, "leverage": self.leverage[symbol]})
+
+    async def _futures_balance(self, request):
+        return web.json_response([{"asset": "USDT", "balance": str(self.balance)}])
+
+    async def _position_risk(self, request):
+        symbols = [request.query["symbol"]] if "symbol" in request.query else list(self.positions)
+        return web.json_response([
+            {"symbol": s, "positionAmt": str(self.positions.get(s, 0.0)), "markPrice": str(self.prices.get(s, 0.0))}
+            for s in symbols
+        ])
+
+    async def _account(self, request):
+        return web.json_response({
+            "balances": [{"asset": "USDT", "free": str(self.balance), "locked": "0"}],
+            "positions": [{"symbol": s, "positionAmt": str(p)} for s, p in self.positions.items()],
+        })
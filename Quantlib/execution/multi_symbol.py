@@ -0,0 +1,212 @@
+"""
+Multi-symbol live runtime
+
+One multiplexed source delivers (symbol, bar) pairs for every symbol; a
+router hands each bar to that symbol's own LiveRuntime pipeline. Every
+symbol gets its own single-worker prediction executor, and order placement
+uses a separate shared pool. Bars always reach each symbol's feature stage;
+with drop_stale=True a slow model skips to the latest feature row instead of
+backing up its feature queue, so it only delays its own symbol while the
+others keep trading.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from .live_runtime import LiveRuntime, WebsocketKlineSource
+
+_STOP = object()
+
+
+class MultiplexKlineSource:
+    """
+    Kline streams of several symbols over one Binance multiplexed websocket
+
+    Args:
+        api_key, api_secret: Binance credentials
+        symbols: List of trading symbols
+        interval: Kline interval, e.g. '1m'
+        closed_only: Only emit klines whose bar has closed
+
+    Yields:
+        (symbol, bar) tuples
+    """
+
+    def __init__(self, api_key, api_secret, symbols, interval='1m', closed_only=True):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.symbols = list(symbols)
+        self.interval = interval
+        self.closed_only = closed_only
+
+    async def __aiter__(self):
+        from binance import ThreadedWebsocketManager
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        def handle_socket(msg):
+            try:
+                data = msg['data']
+                k = data['k']
+            except (KeyError, TypeError):
+                print("⚠️ WebSocket error:", msg)
+                return
+            if self.closed_only and not k["x"]:
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, (data['s'], WebsocketKlineSource.kline_to_bar(k)))
+
+        streams = [f"{s.lower()}@kline_{self.interval}" for s in self.symbols]
+        twm = ThreadedWebsocketManager(api_key=self.api_key, api_secret=self.api_secret)
+        twm.start()
+        twm.start_multiplex_socket(callback=handle_socket, streams=streams)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            twm.stop()
+
+
+class MultiReplaySource:
+    """
+    Replay historical bars of several symbols interleaved in time order
+
+    Args:
+        frames: Dict of symbol -> DataFrame of bars
+        time_column: Column used to interleave the symbols
+        interval: Seconds to wait between timestamps (0 replays as fast as possible)
+
+    Yields:
+        (symbol, bar) tuples
+    """
+
+    def __init__(self, frames, time_column='datetime', interval=0.0):
+        self.frames = frames
+        self.time_column = time_column
+        self.interval = interval
+
+    async def __aiter__(self):
+        panel = pd.concat([df.assign(_symbol=symbol) for symbol, df in self.frames.items()])
+        panel = panel.sort_values(self.time_column, kind='stable')
+        previous = None
+        for row in panel.to_dict('records'):
+            symbol = row.pop('_symbol')
+            if previous is not None and row[self.time_column] != previous:
+                await asyncio.sleep(self.interval)
+            previous = row[self.time_column]
+            yield symbol, row
+
+
+class _QueueSource:
+    """Async iterable over one symbol's routed bars"""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    async def __aiter__(self):
+        while True:
+            bar = await self.queue.get()
+            if bar is _STOP:
+                return
+            yield bar
+
+
+class MultiSymbolRuntime:
+    """
+    Run one live pipeline per symbol behind a shared multiplexed source
+
+    Args:
+        source: Async iterable of (symbol, bar) pairs (MultiplexKlineSource, MultiReplaySource)
+        strategies: Dict of symbol -> strategy (predict(row) / on_signal(signal))
+        feature_fns: Optional dict of symbol -> feature callable (e.g. LiveFeatureEngine);
+            symbols without one get raw bars
+        predict_executor: Optional shared executor for predictions, e.g. a
+            ProcessPoolExecutor when strategies are picklable; by default each
+            symbol gets its own single-thread executor
+        order_workers: Threads in the shared order placement pool
+        queue_size: Capacity of each symbol's queues
+        drop_stale: Let a symbol that falls behind drop its oldest queued
+            prediction or signal (see LiveRuntime); bars always reach the
+            symbol's feature stage, so a slow symbol holds up the router
+    """
+
+    def __init__(self, source, strategies, feature_fns=None, predict_executor=None,
+                 order_workers=None, queue_size=100, drop_stale=False):
+        self.source = source
+        self.strategies = strategies
+        self.feature_fns = feature_fns or {}
+        self.predict_executor = predict_executor
+        self.order_workers = order_workers or len(strategies)
+        self.queue_size = queue_size
+        self.drop_stale = drop_stale
+        self.runtimes = {}
+        self.bars_unrouted = 0
+        self._stop_event = None
+
+    async def _route(self, queues, max_bars):
+        routed = 0
+        try:
+            async for symbol, bar in self.source:
+                queue = queues.get(symbol)
+                if queue is None:
+                    self.bars_unrouted += 1
+                    continue
+                # Feature engines keep rolling state, so bars are never dropped here
+                await queue.put(bar)
+                routed += 1
+                if self._stop_event.is_set() or (max_bars is not None and routed >= max_bars):
+                    break
+        finally:
+            for queue in queues.values():
+                await queue.put(_STOP)
+
+    async def run(self, max_bars=None):
+        """
+        Process bars until the source is exhausted, max_bars bars have been
+        routed in total or stop() is called
+
+        Returns:
+            Latency summary (see summary())
+        """
+        self._stop_event = asyncio.Event()
+        own_executors = []
+        order_executor = ThreadPoolExecutor(max_workers=self.order_workers, thread_name_prefix='orders')
+        queues = {}
+        for symbol, strategy in self.strategies.items():
+            predict_executor = self.predict_executor
+            if predict_executor is None:
+                predict_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'predict-{symbol}')
+                own_executors.append(predict_executor)
+            queues[symbol] = asyncio.Queue(self.queue_size)
+            self.runtimes[symbol] = LiveRuntime(
+                _QueueSource(queues[symbol]), strategy,
+                feature_fn=self.feature_fns.get(symbol),
+                queue_size=self.queue_size,
+                drop_stale=self.drop_stale,
+                predict_executor=predict_executor,
+                order_executor=order_executor
+            )
+        try:
+            await asyncio.gather(
+                self._route(queues, max_bars),
+                *[runtime.run() for runtime in self.runtimes.values()]
+            )
+        finally:
+            for executor in own_executors + [order_executor]:
+                executor.shutdown(wait=False)
+        return self.summary()
+
+    def summary(self):
+        """
+        Returns:
+            DataFrame of per-stage latencies indexed by (symbol, stage), in milliseconds
+        """
+        frames = {symbol: runtime.latency.summary() for symbol, runtime in self.runtimes.items()}
+        frames = {symbol: df for symbol, df in frames.items() if not df.empty}
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, names=['symbol', 'stage'])
+
+    def stop(self):
+        """Request every pipeline to stop after the current bar"""
+        if self._stop_event is not None:
+            self._stop_event.set()
@@ -0,0 +1,176 @@
+"""
+Target-position order manager
+
+Strategies state the position they want; the manager compares it to a local
+position cache and only sends the difference. Signals that do not change
+the target cost nothing, several target changes before a flush collapse
+into one order per symbol, and the orders of one flush go to the broker as
+a single batch (broker.submit_orders). Positions are read from the exchange
+once and then updated from fills, so no get_position call is made per tick.
+
+One manager may be shared by pipelines that call it from several threads:
+targets set while a flush is in flight are sent together by the next flush.
+"""
+import threading
+import time
+import numpy as np
+from .async_broker import as_sync_broker
+from .exchange_info import ExchangeInfoCache
+from .trade_executor import TradeExecutor
+
+
+def _position_amount(position):
+    """Signed quantity from a get_position() result (None, dict or number)"""
+    if position is None:
+        return 0.0
+    if isinstance(position, dict):
+        return float(position.get("positionAmt", 0.0))
+    return float(position)
+
+
+def _failed(response):
+    """Batch endpoints return error dicts in place of orders that were rejected"""
+    return isinstance(response, Exception) or (isinstance(response, dict) and "code" in response and "orderId" not in response)
+
+
+class OrderManager(TradeExecutor):
+    """
+    TradeExecutor that trades towards target positions
+
+    Args:
+        broker: BrokerInterface implementation (BinanceBroker, PaperBroker, ...);
+            async brokers (AsyncBinanceBroker) are wrapped in a SyncBroker
+        exchange_info: ExchangeInfoCache used for lot-size rounding
+            (default: one built from broker.client, falling back to SYMBOL_CONFIG)
+        auto_flush: Send orders as soon as a target changes; otherwise call flush()
+        resync_interval: Seconds after which positions are re-read from the
+            exchange to correct drift (None = only on first use)
+    """
+
+    def __init__(self, broker, exchange_info=None, auto_flush=True, resync_interval=None):
+        self.broker = as_sync_broker(broker)
+        self.exchange_info = exchange_info or ExchangeInfoCache(
+            getattr(broker, "client", None), is_futures=getattr(broker, "use_futures", False)
+        )
+        self.auto_flush = auto_flush
+        self.resync_interval = resync_interval
+        self.positions = {}
+        self.targets = {}
+        self.orders_sent = 0
+        self.orders_coalesced = 0
+        self.last_errors = []
+        self._synced_at = {}
+        self._lock = threading.RLock()  # Guards positions and targets
+        self._flush_lock = threading.Lock()  # One flush at a time
+
+    # ------------------------------------------------------------------ positions
+    def sync(self, symbols=None):
+        """Refresh the position cache from the exchange"""
+        with self._lock:
+            for symbol in symbols if symbols is not None else list(self.positions):
+                self.positions[symbol] = _position_amount(self.broker.get_position(symbol))
+                self._synced_at[symbol] = time.time()
+
+    def _ensure_synced(self, symbol):
+        synced = self._synced_at.get(symbol)
+        if synced is None or (self.resync_interval is not None and time.time() - synced > self.resync_interval):
+            self.sync([symbol])
+
+    def get_position(self, symbol):
+        """Cached signed position (exchange is only queried on first use / resync)"""
+        with self._lock:
+            self._ensure_synced(symbol)
+            return self.positions[symbol]
+
+    def get_balance(self, asset="USDT"):
+        return self.broker.get_balance(asset=asset)
+
+    # ------------------------------------------------------------------ targets
+    def set_target(self, symbol, quantity):
+        """Desired signed position for one symbol"""
+        return self.set_targets({symbol: quantity})
+
+    def set_targets(self, targets):
+        """
+        Desired signed positions for several symbols at once
+
+        Returns:
+            list of order responses sent by this call (empty if nothing changed
+            or auto_flush is off)
+        """
+        with self._lock:
+            for symbol, quantity in targets.items():
+                if self.targets.get(symbol) == float(quantity):
+                    # Same target as before: the signal is redundant
+                    self.orders_coalesced += 1
+                self.targets[symbol] = float(quantity)
+        return self.flush() if self.auto_flush else []
+
+    def buy(self, symbol, quantity):
+        """Raise the target by quantity"""
+        with self._lock:
+            self._ensure_synced(symbol)
+            target = self.targets.get(symbol, self.positions[symbol]) + quantity
+        return self.set_target(symbol, target)
+
+    def sell(self, symbol, quantity):
+        """Lower the target by quantity"""
+        with self._lock:
+            self._ensure_synced(symbol)
+            target = self.targets.get(symbol, self.positions[symbol]) - quantity
+        return self.set_target(symbol, target)
+
+    def _pending(self):
+        """Symbol -> unrounded difference between target and cached position"""
+        pending = {}
+        for symbol, target in self.targets.items():
+            self._ensure_synced(symbol)
+            delta = target - self.positions[symbol]
+            if delta != 0:
+                pending[symbol] = delta
+        return pending
+
+    def flush(self):
+        """
+        Send one order per symbol whose target differs from its position
+
+        Differences smaller than the symbol's lot size are skipped rather than
+        sent and rejected. A call made while another flush is in flight waits
+        for it and then sends every target changed in the meantime.
+
+        Returns:
+            list of order responses
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending()
+            if not pending:
+                return []
+            symbols = list(pending)
+            deltas = np.array([pending[s] for s in symbols])
+            quantities = self.exchange_info.round_quantities(symbols, np.abs(deltas))
+            # Symbols unknown to the metadata are sent unrounded
+            quantities = np.where(np.isnan(quantities), np.abs(deltas), quantities)
+
+            orders = [
+                {"symbol": s, "side": "BUY" if d > 0 else "SELL", "quantity": float(q)}
+                for s, d, q in zip(symbols, deltas, quantities) if q > 0
+            ]
+            if not orders:
+                return []
+
+            responses = self.broker.submit_orders(orders)
+            with self._lock:
+                self.last_errors = []
+                for order, response in zip(orders, responses):
+                    if _failed(response):
+                        print(f"⚠️ Order failed for {order['symbol']}:", response)
+                        self.last_errors.append((order, response))
+                        continue
+                    filled = float(response.get("executedQty", order["quantity"])) if isinstance(response, dict) else order["quantity"]
+                    if isinstance(response, dict) and response.get("status") == "NEW" and response.get("type") == "MARKET":
+                        # Futures market orders are acknowledged before they fill
+                        filled = order["quantity"]
+                    self.positions[order["symbol"]] += filled if order["side"] == "BUY" else -filled
+                    self.orders_sent += 1
+            return responses
@@ -0,0 +1,239 @@
+"""
+Paper-trading broker for offline testing of the live stack
+
+PaperBroker implements BrokerInterface on top of simulated fills, so
+LiveExecutor, LiveMLStrategy and LiveRuntime can run end to end against
+replayed bars without touching Binance. Prices come from the bars passed
+to update_price() (or streamed through stream()); orders go through the
+same lot-size checks as the exchange using SYMBOL_CONFIG, pay configurable
+slippage and commission, and wait a configurable simulated round trip.
+Every call is timed so throughput and latency can be benchmarked.
+"""
+import itertools
+import math
+import random
+import time
+import pandas as pd
+from .async_broker import BinanceAPIError
+from .binance_broker import BrokerInterface
+from .live_runtime import LatencyRecorder
+from .symbol_config import SYMBOL_CONFIG
+
+
+class PaperBroker(BrokerInterface):
+    """
+    Simulated broker with Binance-like responses
+
+    Args:
+        initial_balance: Starting quote balance (USDT)
+        use_futures: Allow short positions (futures); spot sells are limited to holdings
+        latency: Simulated round trip in seconds, or (min, max) for a uniform draw
+        slippage: Fraction of price paid on market orders (0.0005 = 5 bps)
+        commission: Fraction of notional charged per fill
+        symbol_config: Per-symbol min_qty / step_size / precision rules
+        seed: Seed for the latency draw
+    """
+
+    def __init__(self, initial_balance=100000.0, use_futures=False, latency=0.0, slippage=0.0,
+                 commission=0.0, symbol_config=None, seed=None):
+        self.balance = float(initial_balance)
+        self.use_futures = use_futures
+        self.latency = latency
+        self.slippage = slippage
+        self.commission = commission
+        self.symbol_config = symbol_config if symbol_config is not None else SYMBOL_CONFIG
+        self.prices = {}
+        self.positions = {}
+        self.entry_prices = {}
+        self.leverage = {}
+        self.open_orders = []
+        self.fills = []
+        self.timings = LatencyRecorder()
+        self._rng = random.Random(seed)
+        self._order_ids = itertools.count(1)
+
+    # ------------------------------------------------------------------ prices
+    def update_price(self, symbol, price):
+        """Set the current price of a symbol and fill resting limit orders it crosses"""
+        self.prices[symbol] = float(price)
+        still_open = []
+        for order in self.open_orders:
+            crossed = (price <= order["price"]) if order["side"] == "BUY" else (price >= order["price"])
+            if order["symbol"] == symbol and crossed:
+                self._fill(order, order["price"])
+            else:
+                still_open.append(order)
+        self.open_orders = still_open
+
+    async def stream(self, source, symbol, price_field="close"):
+        """
+        Wrap a bar source so every bar updates the broker price before it is emitted
+
+        Usage:
+            runtime = LiveRuntime(broker.stream(ReplaySource(df), "BTCUSDT"), strategy)
+        """
+        async for bar in source:
+            self.update_price(symbol, bar[price_field])
+            yield bar
+
+    # ------------------------------------------------------------------ orders
+    def _wait(self):
+        delay = self._rng.uniform(*self.latency) if isinstance(self.latency, (tuple, list)) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _check_quantity(self, symbol, quantity):
+        """Apply the exchange LOT_SIZE filter: quantity >= min_qty and a multiple of step_size"""
+        rules = self.symbol_config.get(symbol, {})
+        step = rules.get("step_size")
+        if step:
+            steps = quantity / step
+            if not math.isclose(steps, round(steps), rel_tol=0, abs_tol=1e-9):
+                raise BinanceAPIError(400, {"code": -1013, "msg": "Filter failure: LOT_SIZE"})
+        if quantity <= 0 or quantity < rules.get("min_qty", 0):
+            raise BinanceAPIError(400, {"code": -1013, "msg": "Filter failure: LOT_SIZE"})
+        return round(quantity, rules.get("precision", 6))
+
+    def _fill(self, order, price):
+        symbol, qty = order["symbol"], order["quantity"]
+        signed = qty if order["side"] == "BUY" else -qty
+        fee = abs(qty * price) * self.commission
+
+        position = self.positions.get(symbol, 0.0)
+        new_position = position + signed
+        if position == 0 or (position > 0) == (signed > 0):
+            # Opening or adding: volume-weighted entry price
+            self.entry_prices[symbol] = (self.entry_prices.get(symbol, 0.0) * abs(position)
+                                         + price * qty) / abs(new_position)
+        elif new_position == 0:
+            self.entry_prices.pop(symbol, None)
+        elif (new_position > 0) != (position > 0):
+            # Flipped through zero: the remainder opens at the fill price
+            self.entry_prices[symbol] = price
+        self.positions[symbol] = new_position
+        self.balance -= signed * price + fee
+
+        order.update(status="FILLED", executedQty=str(qty), avgPrice=str(price),
+                     updateTime=int(time.time() * 1000))
+        self.fills.append({
+            "time": pd.Timestamp.now(), "orderId": order["orderId"], "symbol": symbol,
+            "side": order["side"], "quantity": qty, "price": price, "commission": fee
+        })
+        return order
+
+    def _order(self, side, symbol, quantity, price=None, is_futures=None):
+        t0 = time.perf_counter()
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        self._wait()
+        if symbol not in self.prices:
+            raise BinanceAPIError(400, {"code": -1121, "msg": "Invalid symbol."})
+        quantity = self._check_quantity(symbol, float(quantity))
+
+        market = self.prices[symbol]
+        if price is None:
+            fill_price = market * (1 + self.slippage) if side == "BUY" else market * (1 - self.slippage)
+        else:
+            fill_price = float(price)
+        if not is_futures:
+            if side == "BUY" and quantity * fill_price * (1 + self.commission) > self.balance:
+                raise BinanceAPIError(400, {"code": -2010, "msg": "Account has insufficient balance."})
+            if side == "SELL" and quantity > self.positions.get(symbol, 0.0) + 1e-12:
+                raise BinanceAPIError(400, {"code": -2010, "msg": "Account has insufficient balance."})
+
+        order = {
+            "orderId": next(self._order_ids),
+            "symbol": symbol,
+            "side": side,
+            "type": "MARKET" if price is None else "LIMIT",
+            "quantity": quantity,
+            "origQty": str(quantity),
+            "executedQty": "0",
+            "status": "NEW",
+        }
+        if price is None:
+            self._fill(order, fill_price)
+        else:
+            order["price"] = fill_price
+            marketable = fill_price >= market if side == "BUY" else fill_price <= market
+            if marketable:
+                self._fill(order, market)
+            else:
+                self.open_orders.append(order)
+        self.timings.record("order", time.perf_counter() - t0)
+        return order
+
+    def buy(self, symbol, quantity, price=None, is_futures=None):
+        return self._order("BUY", symbol, quantity, price, is_futures)
+
+    def sell(self, symbol, quantity, price=None, is_futures=None):
+        return self._order("SELL", symbol, quantity, price, is_futures)
+
+    # ------------------------------------------------------------------ account
+    def equity(self):
+        """Balance plus positions marked at the current prices"""
+        return self.balance + sum(qty * self.prices.get(s, 0.0) for s, qty in self.positions.items())
+
+    def get_balance(self, asset="USDT", is_futures=None):
+        t0 = time.perf_counter()
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        self._wait()
+        if asset == "USDT":
+            free = self.balance
+        else:
+            free = self.positions.get(f"{asset}USDT", 0.0)
+        self.timings.record("balance", time.perf_counter() - t0)
+        if is_futures:
+            return str(free)
+        return {"asset": asset, "free": str(free), "locked": "0.0"}
+
+    def get_position(self, symbol):
+        t0 = time.perf_counter()
+        self._wait()
+        qty = self.positions.get(symbol, 0.0)
+        self.timings.record("position", time.perf_counter() - t0)
+        if qty == 0:
+            return None
+        mark = self.prices.get(symbol, 0.0)
+        entry = self.entry_prices.get(symbol, mark)
+        return {
+            "symbol": symbol,
+            "positionAmt": str(qty),
+            "entryPrice": str(entry),
+            "markPrice": str(mark),
+            "unRealizedProfit": str(qty * (mark - entry)),
+            "leverage": str(self.leverage.get(symbol, 1))
+        }
+
+    def get_account_info(self, is_futures=None):
+        is_futures = is_futures if is_futures is not None else self.use_futures
+        if is_futures:
+            return {
+                "totalWalletBalance": str(self.balance),
+                "totalMarginBalance": str(self.equity()),
+                "positions": [self.get_position(s) for s, q in self.positions.items() if q != 0]
+            }
+        return {
+            "balances": [{"asset": "USDT", "free": str(self.balance), "locked": "0.0"}] + [
+                {"asset": s[:-4], "free": str(q), "locked": "0.0"}
+                for s, q in self.positions.items() if s.endswith("USDT")
+            ]
+        }
+
+    def set_leverage(self, symbol, leverage):
+        self.leverage[symbol] = int(leverage)
+        return {"symbol": symbol, "leverage": self.leverage[symbol]}
+
+    def get_available_symbols(self, is_futures=False):
+        return list(self.symbol_config)
+
+    # ------------------------------------------------------------------ reports
+    def trades(self):
+        """Fills as a DataFrame"""
+        return pd.DataFrame(self.fills, columns=["time", "orderId", "symbol", "side", "quantity", "price", "commission"])
+
+    def metrics(self):
+        """
+        Returns:
+            DataFrame of call latencies per operation (see LatencyRecorder.summary)
+        """
+        return self.timings.summary()
@@ -1,4 +1,6 @@
 # Symbol-specific trade unit configuration for Binance
+import math
+
 SYMBOL_CONFIG = {
     "BTCUSDT": {
         "min_qty": 0.0001,
@@ -38,6 +40,24 @@ SYMBOL_CONFIG = {
     }
 }
 
-def round_quantity(symbol, quantity):
-    precision = SYMBOL_CONFIG.get(symbol, {}).get("precision", 6)
-    return round(quantity, precision)
\ No newline at end of file
+_exchange_info = None
+
+def round_quantity(symbol, quantity, exchange_info=None):
+    """
+    Floor a quantity to the symbol's lot step size (0 below the min quantity)
+
+    Uses exchange_info, or a shared ExchangeInfoCache served from its cache
+    file (SYMBOL_CONFIG when offline); symbols without cached filters are
+    rounded to SYMBOL_CONFIG precision.
+    """
+    global _exchange_info
+    if exchange_info is None:
+        if _exchange_info is None:
+            from .exchange_info import ExchangeInfoCache
+            _exchange_info = ExchangeInfoCache()
+        exchange_info = _exchange_info
+    rounded = exchange_info.round_quantities([symbol], [quantity])[0]
+    if math.isnan(rounded):
+        precision = SYMBOL_CONFIG.get(symbol, {}).get("precision", 6)
+        return round(quantity, precision)
+    return float(rounded)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from .async_broker import as_sync_broker
 
 class TradeExecutor(ABC):
     @abstractmethod
@@ -33,7 +34,8 @@ class BacktestExecutor(TradeExecutor):
 
 class LiveExecutor(TradeExecutor):
     def __init__(self, broker, default_symbol):
-        self.broker = broker
+        # Async brokers (AsyncBinanceBroker) are driven through a blocking SyncBroker
+        self.broker = as_sync_broker(broker)
         self.symbol = default_symbol
 
     def buy(self, symbol, quantity):
@@ -3,9 +3,12 @@ Forecast module initialization
 """
 from .models import MODEL_REGISTRY, BaseModel
 from .factory import load_model, create_model
-from .features import generate_features
+from .features import generate_features, generate_features_chunked
+from .live_features import LiveFeatureEngine
+from .model_registry import ModelRegistry
 from .trainer import train_model
 from .pipeline import FactorPipeline
+from .cross_section import CrossSectionalPipeline, compute_universe_features, cross_sectional_normalize
 
 __all__ = [
     'MODEL_REGISTRY',
@@ -13,6 +16,12 @@ __all__ = [
     'load_model', 
     'create_model',
     'generate_features',
+    'generate_features_chunked',
+    'LiveFeatureEngine',
+    'ModelRegistry',
     'train_model',
-    'FactorPipeline'
+    'FactorPipeline',
+    'CrossSectionalPipeline',
+    'compute_universe_features',
+    'cross_sectional_normalize'
 ]
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Cross-sectional factor pipeline over a universe of symbols
+
+Features are computed per symbol in worker processes (one task per chunk
+of symbols), stacked into one long (datetime, symbol) frame, normalized
+across symbols on each date with vectorized groupby transforms, and used
+to train a single pooled model. Its scores are ranked per date into a
+signal panel that run_portfolio can backtest directly.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from Quantlib.backtest.engine import load_price_data
+from Quantlib.backtest.portfolio import equal_weight, load_panel, run_portfolio
+from .factory import create_model
+from .features import generate_features
+
+
+def _chunk_features(args):
+    """Worker: features and forward returns for a chunk of symbols"""
+    chunk, feature_config, horizon = args
+    frames = []
+    for symbol, source in chunk:
+        df = generate_features(load_price_data(source), feature_config)
+        df[f'fwd_return_{horizon}'] = df['close'].shift(-horizon) / df['close'] - 1
+        # The universe key replaces any symbol column of the source file
+        df = df.drop(columns='symbol', errors='ignore')
+        df.insert(0, 'symbol', symbol)
+        frames.append(df)
+    return frames
+
+
+def compute_universe_features(sources: Dict[str, Any], feature_config: Optional[Dict[str, Any]] = None,
+                              horizon: int = 1, n_jobs: Optional[int] = None,
+                              chunk_size: Optional[int] = None) -> pd.DataFrame:
+    """
+    Compute features for every symbol, in parallel
+
+    Args:
+        sources: Dict of symbol -> CSV path or DataFrame
+        feature_config: Passed to generate_features
+        horizon: Bars ahead for the fwd_return_<horizon> label column
+        n_jobs: Worker processes (None = CPU count, 1 = in-process)
+        chunk_size: Symbols per task (default: spread evenly over the workers)
+
+    Returns:
+        Long DataFrame with one row per (datetime, symbol), sorted by datetime
+    """
+    items = list(sources.items())
+    n_jobs = n_jobs or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(items) // n_jobs))
+    tasks = [(items[i:i + chunk_size], feature_config, horizon) for i in range(0, len(items), chunk_size)]
+
+    if n_jobs == 1 or len(tasks) == 1:
+        results = [_chunk_features(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as executor:
+            results = list(executor.map(_chunk_features, tasks))
+
+    panel = pd.concat([df for frames in results for df in frames], ignore_index=True)
+    return panel.sort_values(['datetime', 'symbol'], kind='stable').reset_index(drop=True)
+
+
+def cross_sectional_normalize(df: pd.DataFrame, features: List[str], method: str = 'rank',
+                              by: str = 'datetime', clip: Optional[float] = 3.0) -> pd.DataFrame:
+    """
+    Normalize factors across symbols on each date
+
+    Args:
+        df: Long frame with a `by` column and the feature columns
+        features: Columns to normalize
+        method: 'rank' (percentile rank centred on 0, in [-0.5, 0.5]) or
+            'zscore' (demeaned and divided by the cross-sectional std)
+        clip: Winsorize z-scores at +/- clip (None disables)
+
+    Returns:
+        DataFrame of normalized features aligned with df
+    """
+    grouped = df.groupby(by, sort=False)[features]
+    if method == 'rank':
+        return grouped.rank(pct=True) - 0.5
+    if method == 'zscore':
+        z = (df[features] - grouped.transform('mean')) / grouped.transform('std')
+        return z.clip(-clip, clip) if clip is not None else z
+    raise ValueError(f"Unknown normalization method: {method}")
+
+
+def _scores(model, X):
+    """Probability of the positive class when the model exposes it, otherwise the prediction"""
+    if hasattr(model, 'predict_proba'):
+        scores = np.asarray(model.predict_proba(X))
+        return scores[:, -1] if scores.ndim == 2 else scores
+    return np.asarray(model.predict(X), dtype=float)
+
+
+class CrossSectionalPipeline:
+    """
+    Pooled cross-sectional model over a symbol universe
+
+    Args:
+        sources: Dict of symbol -> CSV path or DataFrame
+        feature_set: Feature columns used by the model
+        model_type: Model type for create_model
+        horizon: Prediction horizon in bars
+        normalize: 'rank', 'zscore' or None
+        feature_config: Passed to generate_features
+        n_jobs: Worker processes for feature computation
+        model_kwargs: Extra arguments for create_model
+    """
+
+    def __init__(self, sources, feature_set, model_type="xgboost", horizon=1, normalize='rank',
+                 feature_config=None, n_jobs=None, model_kwargs=None):
+        self.sources = sources
+        self.feature_set = list(feature_set)
+        self.model_type = model_type
+        self.horizon = horizon
+        self.normalize = normalize
+        self.feature_config = feature_config
+        self.n_jobs = n_jobs
+        self.model_kwargs = model_kwargs or {}
+        self.data = None
+        self.model = None
+        self.train_end = None
+
+    @property
+    def label(self):
+        return f'fwd_return_{self.horizon}'
+
+    def build(self):
+        """
+        Compute, normalize and label the universe panel
+
+        The target is 1 when a symbol's forward return beats the
+        cross-sectional median of its date, so the model learns relative
+        rather than market-wide moves.
+        """
+        df = compute_universe_features(self.sources, self.feature_config, self.horizon, self.n_jobs)
+        if self.normalize:
+            df[self.feature_set] = cross_sectional_normalize(df, self.feature_set, self.normalize)
+        median = df.groupby('datetime')[self.label].transform('median')
+        df['target'] = (df[self.label] > median).astype(int)
+        df.loc[df[self.label].isna(), 'target'] = -1
+        self.data = df
+        return df
+
+    def train(self, train_end=None, save_path=None):
+        """
+        Fit one pooled model on every symbol's rows up to train_end
+
+        Args:
+            train_end: Last training timestamp (default: all labelled rows)
+            save_path: Optional path to save the model
+        """
+        if self.data is None:
+            self.build()
+        self.train_end = pd.Timestamp(train_end) if train_end is not None else None
+        rows = self.data['target'] >= 0
+        if self.train_end is not None:
+            # Labels look `horizon` bars ahead; drop the rows whose label ends after train_end
+            dates = np.sort(self.data['datetime'].unique())
+            cutoff = np.searchsorted(dates, np.datetime64(self.train_end), side='right') - self.horizon
+            last_labelled = dates[max(cutoff - 1, 0)]
+            rows &= self.data['datetime'] <= last_labelled
+        train = self.data[rows]
+        self.model = create_model(self.model_type, **self.model_kwargs)
+        self.model.fit(train[self.feature_set], train['target'])
+        if save_path:
+            os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
+            self.model.save(save_path)
+            print(f"Model trained and saved to {save_path}")
+        return self.model
+
+    def scores(self):
+        """Model scores as a (datetime x symbol) panel"""
+        scores = _scores(self.model, self.data[self.feature_set])
+        frame = self.data[['datetime', 'symbol']].assign(score=scores)
+        return frame.pivot(index='datetime', columns='symbol', values='score')
+
+    def signals(self, top=None, bottom=None):
+        """
+        Rank scores across symbols on each date into a signal panel
+
+        Args:
+            top: Go long the `top` best-scored symbols (default: the top half)
+            bottom: Go short the `bottom` worst-scored symbols (default: none)
+
+        Returns:
+            DataFrame (datetime x symbol) of +1 / -1 / 0
+        """
+        scores = self.scores()
+        rank_desc = scores.rank(axis=1, ascending=False, method='first')
+        rank_asc = scores.rank(axis=1, ascending=True, method='first')
+        if top is None:
+            top = scores.notna().sum(axis=1).to_numpy()[:, None] // 2
+        signals = np.where(rank_desc.to_numpy() <= top, 1.0, 0.0)
+        if bottom:
+            signals = np.where(rank_asc.to_numpy() <= bottom, -1.0, signals)
+        signals[scores.isna().to_numpy()] = 0.0
+        return pd.DataFrame(signals, index=scores.index, columns=scores.columns)
+
+    def backtest(self, top=None, bottom=None, cash=100000, commission=0.0, slippage=0.0, rebalance_every=1):
+        """
+        Equal-weight portfolio backtest of the signal panel (out of sample only
+        when the model was trained with train_end)
+
+        Returns:
+            tuple: (df, trades_df, performance_summary) from run_portfolio
+        """
+        signals = self.signals(top, bottom)
+        if self.train_end is not None:
+            signals = signals[signals.index > self.train_end]
+        panel = load_panel(self.sources)
+        if self.train_end is not None and len(signals):
+            panel = panel.slice(signals.index[0])
+        return run_portfolio(panel, equal_weight(signals), cash=cash, commission=commission,
+                             slippage=slippage, rebalance_every=rebalance_every)
+
@@ -1,6 +1,21 @@
+import os
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+DEFAULT_FEATURE_CONFIG = {
+    'returns': {'periods': [1, 5, 10]},
+    'sma': {'periods': [10, 30, 50]},
+    'volatility': {'periods': [10, 30]},
+    'rsi': {'periods': [14, 28]},
+    'volume': {'periods': [5, 10, 20]},
+    'momentum': {'periods': [5, 10, 20]},
+    'mfi': {
+        'periods': [14],
+        'overbought': 80.0,
+        'oversold': 20.0
+    }
+}
 
 class FeatureGenerator:
     """Feature generator for cryptocurrency data"""
@@ -111,7 +126,7 @@ class FeatureGenerator:
             
         return df
 
-def generate_features(df: pd.DataFrame, feature_config: Dict[str, Any] = None) -> pd.DataFrame:
+def generate_features(df: pd.DataFrame, feature_config: Dict[str, Any] = None, copy: bool = True) -> pd.DataFrame:
     """
     Generate features based on configuration
     
@@ -119,26 +134,16 @@ def generate_features(df: pd.DataFrame, feature_config: Dict[str, Any] = None) -
         df: DataFrame with OHLCV data
         feature_config: Dictionary specifying which features to generate and their parameters
                        If None, uses default configuration
+        copy: Work on a copy of df (False adds the columns to df in place)
     
     Returns:
         DataFrame with generated features
     """
     if feature_config is None:
-        feature_config = {
-            'returns': {'periods': [1, 5, 10]},
-            'sma': {'periods': [10, 30, 50]},
-            'volatility': {'periods': [10, 30]},
-            'rsi': {'periods': [14, 28]},
-            'volume': {'periods': [5, 10, 20]},
-            'momentum': {'periods': [5, 10, 20]},
-            'mfi': {
-                'periods': [14],
-                'overbought': 80.0,
-                'oversold': 20.0
-            }
-        }
-    
-    df = df.copy()
+        feature_config = DEFAULT_FEATURE_CONFIG
+    
+    if copy:
+        df = df.copy()
     generator = FeatureGenerator()
     
     # Generate features based on config
@@ -166,22 +171,91 @@ def generate_features(df: pd.DataFrame, feature_config: Dict[str, Any] = None) -
     df.dropna(inplace=True)
     return df
 
+def feature_warmup(feature_config: Dict[str, Any] = None) -> int:
+    """
+    Number of preceding bars a feature row depends on
+    
+    The longest window plus one bar for the diff/pct_change in front of it
+    (MFI signal changes diff the rolling result once more).
+    """
+    if feature_config is None:
+        feature_config = DEFAULT_FEATURE_CONFIG
+    periods = [p for params in feature_config.values() for p in params.get('periods', [])]
+    warmup = max(periods, default=0) + 1
+    if feature_config.get('mfi', {}).get('periods'):
+        warmup = max(warmup, max(feature_config['mfi']['periods']) + 2)
+    return warmup
+
+def _prepare_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Same column normalization as load_price_data, without the sort"""
+    chunk.columns = [col.strip().lower() for col in chunk.columns]
+    chunk['datetime'] = pd.to_datetime(chunk['datetime'])
+    return chunk
+
+def generate_features_chunked(source, output: str, feature_config: Dict[str, Any] = None,
+                              chunk_size: int = 100_000, name: Optional[str] = None) -> int:
+    """
+    Generate features out of core, chunk by chunk, writing each chunk to disk
+    
+    Each chunk is prefixed with the last feature_warmup() rows of the previous
+    one, so every rolling window sees the same history as in memory; the
+    output matches generate_features(load_price_data(source)) row for row
+    (up to floating-point rounding of the rolling sums).
+    
+    Args:
+        source: CSV path (read with chunksize) or an iterable of DataFrames,
+                in ascending time order
+        output: '.csv' file (appended chunk by chunk) or a ColumnStore directory
+                (much faster to write and read back than CSV)
+        feature_config: Feature configuration (default config if None)
+        chunk_size: Rows per chunk read from a CSV
+        name: Dataset name in the ColumnStore (default: source file name)
+    
+    Returns:
+        Number of feature rows written
+    """
+    from Quantlib.data.column_store import ColumnStore
+
+    warmup = feature_warmup(feature_config)
+    chunks = pd.read_csv(source, chunksize=chunk_size) if isinstance(source, str) else source
+    to_csv = output.endswith('.csv')
+    if to_csv:
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        if os.path.exists(output):
+            os.remove(output)
+    else:
+        store = ColumnStore(output)
+        name = name or (os.path.splitext(os.path.basename(source))[0] if isinstance(source, str) else 'features')
+        store.delete(name)
+
+    tail = None
+    offset = 0  # Row position of the chunk in the full input (keeps the in-memory index)
+    written = 0
+    for chunk in chunks:
+        chunk = _prepare_chunk(chunk)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        if not chunk['datetime'].is_monotonic_increasing or (
+                tail is not None and len(tail) and chunk['datetime'].iloc[0] < tail['datetime'].iloc[-1]):
+            raise ValueError("Chunked feature generation needs input sorted by ascending datetime")
+
+        frame = pd.concat([tail, chunk]) if tail is not None else chunk
+        tail = frame.iloc[-warmup:]
+        features = generate_features(frame, feature_config, copy=False)
+        features = features[features.index >= chunk.index[0]]
+
+        if len(features):
+            if to_csv:
+                features.to_csv(output, mode='a', header=written == 0, index=False)
+            else:
+                store.append(name, features.reset_index(drop=True))
+            written += len(features)
+    return written
+
 def list_available_features(feature_config: Dict[str, Any] = None) -> List[str]:
     """List all available features based on the configuration"""
     if feature_config is None:
-        feature_config = {
-            'returns': {'periods': [1, 5, 10]},
-            'sma': {'periods': [10, 30, 50]},
-            'volatility': {'periods': [10, 30]},
-            'rsi': {'periods': [14, 28]},
-            'volume': {'periods': [5, 10, 20]},
-            'momentum': {'periods': [5, 10, 20]},
-            'mfi': {
-                'periods': [14],
-                'overbought': 80.0,
-                'oversold': 20.0
-            }
-        }
+        feature_config = DEFAULT_FEATURE_CONFIG
     
     features = []
     
@@ -0,0 +1,226 @@
+"""
+Incremental feature computation for live bars
+
+LiveFeatureEngine produces the same features as generate_features, but one
+bar at a time: every rolling statistic keeps a running sum over a
+fixed-size NumPy ring buffer, so each update() is O(1) in the history
+length and O(number of features) overall.
+"""
+from typing import Any, Dict, Optional
+import math
+import numpy as np
+from .features import DEFAULT_FEATURE_CONFIG
+
+
+class _Ring:
+    """Fixed-size NumPy ring buffer of the last `size` values"""
+
+    def __init__(self, size):
+        self.values = np.full(size, np.nan)
+        self.size = size
+        self.count = 0
+
+    def push(self, x):
+        """Store x and return the value it overwrote (NaN while filling)"""
+        i = self.count % self.size
+        old = float(self.values[i])
+        self.values[i] = x
+        self.count += 1
+        return old
+
+    def ago(self, k):
+        """Value pushed k updates ago (0 = latest), NaN if not available"""
+        if k >= self.count or k >= self.size:
+            return math.nan
+        return float(self.values[(self.count - 1 - k) % self.size])
+
+
+class _RollingSum:
+    """Running sum (and sum of squares) over the last `window` values"""
+
+    def __init__(self, window):
+        self.window = window
+        self.ring = _Ring(window)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.valid = 0
+
+    def push(self, x):
+        old = self.ring.push(x)
+        if old == old:  # not NaN
+            self.total -= old
+            self.total_sq -= old * old
+            self.valid -= 1
+        if x == x:
+            self.total += x
+            self.total_sq += x * x
+            self.valid += 1
+
+    @property
+    def full(self):
+        return self.valid == self.window
+
+    def mean(self):
+        return self.total / self.window if self.full else math.nan
+
+    def sum(self):
+        return self.total if self.full else math.nan
+
+    def std(self):
+        """Sample standard deviation (ddof=1), as pandas rolling().std()"""
+        if not self.full or self.window < 2:
+            return math.nan
+        mean = self.total / self.window
+        return math.sqrt(max(self.total_sq - self.window * mean * mean, 0.0) / (self.window - 1))
+
+
+def _ratio(a, b):
+    """a / b with NumPy semantics for division by zero (inf or NaN, no exception)"""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        return math.nan if a == 0 or a != a else math.copysign(math.inf, a)
+
+
+class LiveFeatureEngine:
+    """
+    Compute generate_features-compatible features one bar at a time
+
+    Args:
+        feature_config: Same format as generate_features (default config if None)
+
+    The legacy names 'sma_ratio' and 'volatility' used by LiveMLStrategy are
+    aliases for the first configured SMA ratio and volatility period.
+    """
+
+    def __init__(self, feature_config: Optional[Dict[str, Any]] = None):
+        self.config = feature_config if feature_config is not None else DEFAULT_FEATURE_CONFIG
+        cfg = self.config
+
+        self.return_periods = list(cfg.get('returns', {}).get('periods', []))
+        self.sma_periods = list(cfg.get('sma', {}).get('periods', []))
+        self.vol_periods = list(cfg.get('volatility', {}).get('periods', []))
+        self.rsi_periods = list(cfg.get('rsi', {}).get('periods', []))
+        self.volume_periods = list(cfg.get('volume', {}).get('periods', []))
+        self.momentum_periods = list(cfg.get('momentum', {}).get('periods', []))
+        self.mfi_periods = list(cfg.get('mfi', {}).get('periods', [])) if 'mfi' in cfg else []
+        self.mfi_overbought = cfg.get('mfi', {}).get('overbought', 80.0)
+        self.mfi_oversold = cfg.get('mfi', {}).get('oversold', 20.0)
+
+        lookback = max(self.return_periods + self.momentum_periods + [1]) + 1
+        self.closes = _Ring(lookback)
+        self.sma = {p: _RollingSum(p) for p in self.sma_periods}
+        self.vol = {p: _RollingSum(p) for p in self.vol_periods}
+        self.gains = {p: _RollingSum(p) for p in self.rsi_periods}
+        self.losses = {p: _RollingSum(p) for p in self.rsi_periods}
+        self.volume = {p: _RollingSum(p) for p in self.volume_periods}
+        self.pos_flow = {p: _RollingSum(p) for p in self.mfi_periods}
+        self.neg_flow = {p: _RollingSum(p) for p in self.mfi_periods}
+        self.prev_tp = math.nan
+        self.prev_flags = {}
+
+        windows = (self.sma_periods + self.rsi_periods + self.volume_periods + self.mfi_periods
+                   + [p + 1 for p in self.vol_periods] + [lookback])
+        # Bars needed before every feature is defined
+        self.warmup_bars = max(windows)
+        self.n_bars = 0
+
+    def update(self, bar: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """
+        Add one closed bar
+
+        Args:
+            bar: Dict with 'close' and, depending on the config, 'high',
+                'low' and 'volume' (or 'Volume')
+
+        Returns:
+            Dict of feature values, or None until every feature is defined
+        """
+        close = float(bar['close'])
+        self.closes.push(close)
+        self.n_bars += 1
+        features = {}
+
+        for p in self.return_periods:
+            features[f'return_{p}'] = _ratio(close, self.closes.ago(p)) - 1
+
+        prev_close = self.closes.ago(1)
+        ret_1 = _ratio(close, prev_close) - 1
+
+        for p, acc in self.sma.items():
+            acc.push(close)
+            features[f'sma_{p}'] = acc.mean()
+        for short_p, long_p in zip(self.sma_periods[:-1], self.sma_periods[1:]):
+            features[f'sma_ratio_{short_p}_{long_p}'] = _ratio(features[f'sma_{short_p}'], features[f'sma_{long_p}'])
+
+        for p, acc in self.vol.items():
+            acc.push(ret_1)
+            features[f'volatility_{p}'] = acc.std()
+
+        if self.rsi_periods:
+            # Like delta.where(delta > 0, 0), the undefined first delta counts as 0
+            delta = close - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            for p in self.rsi_periods:
+                self.gains[p].push(gain)
+                self.losses[p].push(loss)
+                rs = _ratio(self.gains[p].mean(), self.losses[p].mean())
+                features[f'rsi_{p}'] = 100 - _ratio(100, 1 + rs)
+
+        if self.volume_periods or self.mfi_periods:
+            volume = float(bar['volume'] if 'volume' in bar else bar['Volume'])
+        for p, acc in self.volume.items():
+            acc.push(volume)
+            features[f'volume_sma_{p}'] = acc.mean()
+            features[f'volume_ratio_{p}'] = _ratio(volume, features[f'volume_sma_{p}'])
+
+        for p in self.momentum_periods:
+            features[f'momentum_{p}'] = close - self.closes.ago(p)
+
+        if self.mfi_periods:
+            tp = (float(bar['high']) + float(bar['low']) + close) / 3
+            raw_flow = tp * volume
+            change = tp - self.prev_tp
+            self.prev_tp = tp
+            for p in self.mfi_periods:
+                self.pos_flow[p].push(raw_flow if change > 0 else 0.0)
+                self.neg_flow[p].push(raw_flow if change < 0 else 0.0)
+                mfi = 100 - _ratio(100, 1 + _ratio(self.pos_flow[p].sum(), self.neg_flow[p].sum()))
+                overbought = int(mfi > self.mfi_overbought)
+                oversold = int(mfi < self.mfi_oversold)
+                prev_ob, prev_os = self.prev_flags.get(p, (math.nan, math.nan))
+                self.prev_flags[p] = (overbought, oversold)
+                features[f'mfi_{p}'] = mfi
+                features[f'mfi_{p}_overbought'] = overbought
+                features[f'mfi_{p}_oversold'] = oversold
+                features[f'mfi_{p}_overbought_change'] = overbought - prev_ob
+                features[f'mfi_{p}_oversold_change'] = oversold - prev_os
+
+        if len(self.sma_periods) > 1:
+            features['sma_ratio'] = features[f'sma_ratio_{self.sma_periods[0]}_{self.sma_periods[1]}']
+        if self.vol_periods:
+            features['volatility'] = features[f'volatility_{self.vol_periods[0]}']
+
+        if any(v != v for v in features.values()):
+            return None
+        return features
+
+    def warmup(self, bars):
+        """
+        Feed historical bars (DataFrame or iterable of dicts), oldest first
+
+        Returns:
+            Features of the last bar, or None if still warming up
+        """
+        if hasattr(bars, 'to_dict'):
+            bars = bars.to_dict('records')
+        features = None
+        for bar in bars:
+            features = self.update(bar)
+        return features
+
+    def __call__(self, bar):
+        """Feature function for LiveRuntime: bar merged with its features"""
+        features = self.update(bar)
+        return None if features is None else {**bar, **features}
@@ -0,0 +1,175 @@
+"""
+Live model registry with hot reloading
+
+A background thread watches the model file. When a new version appears
+(by modification time and size), it is loaded and validated against the
+feature schema in that thread. The validated model is then staged and
+swapped in at the start of the next predict() call, so a swap always
+happens between bars. Inference never waits on disk I/O, and a bad model
+file never replaces a working one.
+"""
+import glob
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+from .factory import load_model
+
+
+class ModelRegistry:
+    """
+    Hot-reloading model holder, usable wherever a Predictor is expected
+
+    Args:
+        model_type: Model type understood by load_model ("xgboost", "lstm", ...)
+        model_path: Model file, or a glob pattern (e.g. "models/xgb_*.pkl")
+            whose newest match is used
+        features: Feature schema the live pipeline provides
+        poll_interval: Seconds between checks for a new model file
+        sample_row: Row used to validate a candidate model (default: zeros)
+    """
+
+    def __init__(self, model_type: str, model_path: str, features: Optional[List[str]] = None,
+                 poll_interval: float = 5.0, sample_row: Optional[Dict[str, Any]] = None):
+        self.model_type = model_type
+        self.model_path = model_path
+        self.features = list(features) if features is not None else None
+        self.poll_interval = poll_interval
+        self.sample_row = sample_row
+        self.version = 0
+        self.history = []
+        self._model = None
+        self._staged = None
+        self._signature = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        path, signature = self._current_file()
+        if path is None:
+            raise FileNotFoundError(f"No model file matches {model_path}")
+        self._model = self._load(path)
+        self._signature = signature
+        self._record(path, signature)
+
+    # ------------------------------------------------------------------ watching
+    def _current_file(self):
+        """Newest matching file and its (path, mtime, size) signature"""
+        paths = glob.glob(self.model_path) if glob.has_magic(self.model_path) else [self.model_path]
+        paths = [p for p in paths if os.path.exists(p)]
+        if not paths:
+            return None, None
+        path = max(paths, key=os.path.getmtime)
+        st = os.stat(path)
+        return path, (path, st.st_mtime_ns, st.st_size)
+
+    def _load(self, path):
+        model = load_model(self.model_type, path)
+        self.validate(model)
+        return model
+
+    def validate(self, model):
+        """
+        Check a candidate model against the feature schema
+
+        Raises:
+            ValueError: If the model needs features the pipeline does not
+                provide or does not return one 0/1 signal for a sample row
+        """
+        required = getattr(model, 'feature_names', None)
+        if self.features is not None and required:
+            missing = set(required) - set(self.features)
+            if missing:
+                raise ValueError(f"Model requires features not in the live schema: {missing}")
+        if self.features is None:
+            return
+        row = self.sample_row if self.sample_row is not None else {f: 0.0 for f in self.features}
+        signal = np.asarray(model.predict(row, features=self.features)).ravel()
+        if len(signal) != 1 or signal[0] not in (0, 1):
+            raise ValueError(f"Model returned {signal!r} for a sample row, expected a single 0/1 signal")
+
+    def _record(self, path, signature):
+        self.version += 1
+        self.history.append({'version': self.version, 'path': path, 'mtime_ns': signature[1],
+                             'loaded_at': time.time()})
+
+    def check(self):
+        """
+        Load and stage the model file if it changed since the last check
+
+        Returns:
+            True if a new model was staged
+        """
+        path, signature = self._current_file()
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            model = self._load(path)
+        except Exception as e:
+            print(f"⚠️ Rejected model {path}:", e)
+            # Do not retry the same broken file on every poll
+            self._signature = signature
+            return False
+        with self._lock:
+            self._staged = (model, path, signature)
+        self._signature = signature
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                print("⚠️ Model watcher error:", e)
+
+    def start(self):
+        """Start the background watcher thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name='model-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------ serving
+    @property
+    def model(self):
+        """Model currently serving predictions"""
+        return self._model
+
+    def _swap(self):
+        if self._staged is None:
+            return
+        with self._lock:
+            staged, self._staged = self._staged, None
+        if staged is not None:
+            model, path, signature = staged
+            self._model = model
+            self._record(path, signature)
+            print(f"🔄 Model v{self.version} live: {path}")
+
+    def predict(self, row, features=None):
+        """
+        Predict with the current model, swapping in a staged version first
+
+        Args:
+            row: Dict of feature values or array-like
+            features: Feature names if row is a dict (default: the registry schema)
+        """
+        self._swap()
+        features = features if features is not None else self.features
+        if features is None:
+            return self._model.predict(row)
+        return self._model.predict(row, features=features)
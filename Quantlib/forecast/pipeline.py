@@ -1,70 +1,72 @@
-from Quantlib.forecast.features import generate_features
-from Quantlib.forecast.factory import load_model
-from Quantlib.backtest.engine import run_backtest
-from Quantlib.strategies.ml_signal_strategy import MLSignalStrategy
+from Quantlib.forecast.features import generate_features, DEFAULT_FEATURE_CONFIG
+from Quantlib.forecast.factory import create_model
+from Quantlib.backtest.engine import load_price_data
+from Quantlib.backtest.portfolio import load_panel, run_portfolio
 import pandas as pd
-import joblib
 import os
 
 
+def _with_aliases(df, feature_config=None):
+    """Add the 'sma_ratio' / 'volatility' names used by the live strategy (see LiveFeatureEngine)"""
+    cfg = feature_config if feature_config is not None else DEFAULT_FEATURE_CONFIG
+    sma = cfg.get('sma', {}).get('periods', [])
+    vol = cfg.get('volatility', {}).get('periods', [])
+    if len(sma) > 1 and 'sma_ratio' not in df.columns:
+        df['sma_ratio'] = df[f'sma_ratio_{sma[0]}_{sma[1]}']
+    if vol and 'volatility' not in df.columns:
+        df['volatility'] = df[f'volatility_{vol[0]}']
+    return df
+
+
 class FactorPipeline:
-    def __init__(self, df_path, feature_set, model_type="xgboost", model_save_path="models/auto_model.pkl"):
+    def __init__(self, df_path, feature_set, model_type="xgboost", model_save_path="models/auto_model.pkl", feature_config=None):
         self.df_path = df_path
         self.feature_set = feature_set
         self.model_type = model_type
         self.model_save_path = model_save_path
+        self.feature_config = feature_config
+        self.model = None
+
+    def _features(self):
+        df = generate_features(load_price_data(self.df_path), self.feature_config)
+        return _with_aliases(df, self.feature_config)
 
     def train(self):
-        df = pd.read_csv(self.df_path, parse_dates=["datetime"])
-        df = generate_features(df)
+        df = self._features()
         df["target"] = (df["close"].shift(-1) > df["close"]).astype(int)
+        # The last bar has no next close to label it
+        df = df.iloc[:-1]
 
-        X = df[self.feature_set]
-        y = df["target"]
-
-        from xgboost import XGBClassifier
-        model = XGBClassifier(use_label_encoder=False, eval_metric="logloss")
-        model.fit(X, y)
+        self.model = create_model(self.model_type)
+        self.model.fit(df[self.feature_set], df["target"])
 
-        os.makedirs(os.path.dirname(self.model_save_path), exist_ok=True)
-        joblib.dump(model, self.model_save_path)
+        os.makedirs(os.path.dirname(self.model_save_path) or '.', exist_ok=True)
+        self.model.save(self.model_save_path)
         print(f"Model trained and saved to {self.model_save_path}")
 
-    def backtest(self):
-        class CustomMLStrategy(MLSignalStrategy):
-            def __init__(self):
-                super().__init__(use_ml=True, model_type=None)
-                from Quantlib.forecast.predictor.tree_predictor import TreePredictor
-                self.model = TreePredictor(self.model_save_path)
-                self.feature_set = self.params.feature_set
+    def backtest(self, cash=100000, commission=0.0, plot=True):
+        """
+        Backtest the model's long/flat signal on the pipeline's data
 
-            def next(self):
-                if not self.model or len(self) < 30:
-                    return
-                row = {f: self._get_feature(f) for f in self.feature_set}
-                signal = self.model.predict(row)
-                if not self.position and signal == 1:
-                    self.buy()
-                elif self.position and signal == 0:
-                    self.sell()
+        Features come from generate_features (the same as training) and the
+        model predicts every bar in one call; signals are executed one bar
+        later by run_portfolio.
 
-            def _get_feature(self, name):
-                if name == "return_1":
-                    return (self.data.close[-1] - self.data.close[-2]) / self.data.close[-2]
-                elif name == "sma_ratio":
-                    return sum(self.data.close.get(size=10)) / sum(self.data.close.get(size=30))
-                elif name == "volatility":
-                    return self.data.close.get(size=10).std()
-                else:
-                    raise ValueError(f"Unknown feature: {name}")
+        Returns:
+            tuple: (df, trades_df, performance_summary)
+        """
+        if self.model is None:
+            from Quantlib.forecast.factory import load_model
+            self.model = load_model(self.model_type, self.model_save_path)
 
-        from Quantlib.visualization.visualize import plot_equity_curve
+        df = self._features()
+        signal = pd.Series(self.model.predict(df[self.feature_set]), index=df['datetime'], dtype=float)
 
-        df, trades = run_backtest(
-            strategy_class=lambda: CustomMLStrategy(),
-            data_path=self.df_path,
-            cash=100000,
-            plot=False
-        )
+        symbol = 'asset'
+        panel = load_panel({symbol: self.df_path})
+        results, trades_df, summary = run_portfolio(panel, signal.to_frame(symbol), cash=cash, commission=commission)
 
-        plot_equity_curve(df["equity"])
+        if plot:
+            from Quantlib.visualization.visualize import plot_equity_curve
+            plot_equity_curve(results["equity"])
+        return results, trades_df, summary
@@ -9,6 +9,7 @@ from .bollinger_band import BollingerBand
 from .buy_and_hold import BuyAndHoldStrategy
 from .momentum_sma_strategy import MomentumSMAStrategy
 from .momentum_vol_rsi_strategy import MomentumVolRSIStrategy
+from .portfolio_strategy import TargetWeightStrategy
 
 __all__ = [
     'MLSignalStrategy',
@@ -18,5 +19,6 @@ __all__ = [
     'BollingerBand',
     'BuyAndHoldStrategy',
     'MomentumSMAStrategy',
-    'MomentumVolRSIStrategy'
+    'MomentumVolRSIStrategy',
+    'TargetWeightStrategy'
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Base strategy class that all strategies should inherit from
 """
+import time
 import backtrader as bt
 
 class BaseStrategy(bt.Strategy):
@@ -8,13 +9,32 @@ class BaseStrategy(bt.Strategy):
     
     params = (
         ('trade_size', 1.0),  # Default position size
+        ('profiler', None),   # BacktestProfiler passed in by run_backtest(profile=...)
     )
 
     def __init__(self):
         """Initialize strategy and register indicators"""
         self.order = None
+        profiler = self.params.profiler
+        if profiler is not None:
+            profiler.mark('strategy_init')
+            if profiler.time_next:
+                self._time_next(profiler)
         self.setup_indicators()
 
+    def _time_next(self, profiler):
+        """Record the duration of every next() call (shadows the method on this instance only)"""
+        inner = self.next
+        record = profiler.record_next
+        clock = time.perf_counter
+
+        def timed_next():
+            start = clock()
+            inner()
+            record(clock() - start)
+
+        self.next = timed_next
+
     def setup_indicators(self):
         """Setup technical indicators - override in child classes"""
         pass
@@ -23,15 +43,24 @@ class BaseStrategy(bt.Strategy):
         """Main strategy logic - must be implemented by child classes"""
         raise NotImplementedError("Strategies must implement next() method")
 
-    def execute_buy(self):
-        """Execute buy order with position sizing"""
-        if not self.position:
+    def execute_buy(self, data=None, trade_size=None):
+        """
+        Execute buy order with position sizing
+        
+        Args:
+            data: Feed to trade (default: the first feed)
+            trade_size: Fraction of available cash to use (default: params.trade_size);
+                portfolio strategies pass each asset's share here
+        """
+        data = data if data is not None else self.data
+        trade_size = trade_size if trade_size is not None else self.params.trade_size
+        if not self.getposition(data):
             cash = self.broker.getcash()  # Get available cash
-            price = self.data.close[0]  # Current price
-            trade_cash = cash * self.params.trade_size  # Calculate cash to use for trade
+            price = data.close[0]  # Current price
+            trade_cash = cash * trade_size  # Calculate cash to use for trade
             
             # Get commission and slippage info
-            comminfo = self.broker.getcommissioninfo(self.data0)
+            comminfo = self.broker.getcommissioninfo(data)
             commission_rate = comminfo.p.commission
             slippage = self.broker.p.slip_perc if hasattr(self.broker.p, 'slip_perc') else 0
             
@@ -44,13 +73,15 @@ class BaseStrategy(bt.Strategy):
             # size = trade_cash / (price * (1 + r))
             size = trade_cash / (price * (1 + total_cost_rate))
             
-            self.buy(size=size)
+            self.buy(data=data, size=size)
 
-    def execute_sell(self):
+    def execute_sell(self, data=None):
         """Execute sell order with position sizing"""
-        if self.position:
+        data = data if data is not None else self.data
+        position = self.getposition(data)
+        if position:
             # Sell entire position
-            self.sell(size=self.position.size)
+            self.sell(data=data, size=position.size)
 
     def notify_order(self, order):
         """Handle order status updates"""
@@ -48,11 +48,10 @@ def generate_features_for_backtest(df: pd.DataFrame, feature_config: Dict[str, A
         df[f'rsi_{period}'] = 100 - (100 / (1 + rs))
     
     # Volume
-    volume_col = 'Volume' if 'Volume' in df.columns else 'volume'
-    if volume_col in df.columns:
+    if 'volume' in df.columns:
         for period in feature_config.get('volume', {}).get('periods', []):
-            df[f'volume_sma_{period}'] = df[volume_col].rolling(window=period).mean()
-            df[f'volume_ratio_{period}'] = df[volume_col] / df[f'volume_sma_{period}']
+            df[f'volume_sma_{period}'] = df['volume'].rolling(window=period).mean()
+            df[f'volume_ratio_{period}'] = df['volume'] / df[f'volume_sma_{period}']
     
     # Momentum
     for period in feature_config.get('momentum', {}).get('periods', []):
@@ -115,7 +114,7 @@ class MLSignalStrategy(bt.Strategy):
                 'high': pd.Series([self.datas[0].high[-i] for i in range(self.params.lookback-1, -1, -1)]),
                 'low': pd.Series([self.datas[0].low[-i] for i in range(self.params.lookback-1, -1, -1)]),
                 'close': pd.Series([self.datas[0].close[-i] for i in range(self.params.lookback-1, -1, -1)]),
-                'Volume': pd.Series([self.datas[0].volume[-i] for i in range(self.params.lookback-1, -1, -1)])
+                'volume': pd.Series([self.datas[0].volume[-i] for i in range(self.params.lookback-1, -1, -1)])
             }
             df = pd.DataFrame(hist_data)
             
@@ -0,0 +1,58 @@
+"""
+Target-weight portfolio strategy for multi-feed backtests
+"""
+from .base_strategy import BaseStrategy
+
+
+class TargetWeightStrategy(BaseStrategy):
+    """
+    Rebalance every feed to a target fraction of portfolio value
+
+    Feeds are matched to weight columns by name (see run_portfolio_backtrader).
+    Sells are submitted before buys so freed cash funds the new positions.
+    The weights row stamped with bar t is read in next() at the close of t
+    and its orders fill at the open of t+1 (backtrader's default), so a
+    weight computed from the close of t is traded one bar later, as with
+    run_portfolio(lag=1), which fills at the close of t+1 instead. Order
+    sizes use the close of t, so the filled weights drift by the overnight
+    gap.
+    """
+    params = (
+        ('weights', None),          # DataFrame (datetime x symbol) of target weights
+        ('rebalance_every', 1),
+        ('trade_size', 1.0),        # Scales every weight (e.g. 0.98 keeps a cash buffer)
+    )
+
+    def setup_indicators(self):
+        self.bar_count = 0
+
+    def target_weights(self):
+        """Target weight per feed name for the current bar"""
+        weights = self.params.weights
+        row = weights.loc[:self.data.datetime.datetime(0)]
+        if row.empty:
+            return {}
+        return row.iloc[-1].to_dict()
+
+    def next(self):
+        self.bar_count += 1
+        if (self.bar_count - 1) % self.params.rebalance_every:
+            return
+        targets = self.target_weights()
+        if not targets:
+            return
+
+        value = self.broker.getvalue()
+        orders = []
+        for data in self.datas:
+            weight = targets.get(data._name, 0.0) * self.params.trade_size
+            price = data.close[0]
+            # Fractional sizes: order_target_percent would truncate to whole units
+            delta = weight * value / price - self.getposition(data).size
+            if abs(delta) * price > 1e-8 * value:
+                orders.append((delta * price, data, delta))
+        for _, data, delta in sorted(orders, key=lambda o: o[0]):
+            if delta > 0:
+                self.buy(data=data, size=delta)
+            else:
+                self.sell(data=data, size=-delta)
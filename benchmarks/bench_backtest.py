@@ -0,0 +1,33 @@
+"""
+run_backtest on the daily BTC file and on 1M synthetic minute bars
+"""
+import Quantlib.strategies as strategies
+from Quantlib.backtest.engine import run_backtest
+from .common import BTC_DAILY, backtest_workdir, minute_csv
+
+DAILY_STRATEGIES = ['SMACrossover', 'RSIReversion', 'MACDCrossover', 'BollingerBand',
+                    'BuyAndHoldStrategy', 'MomentumSMAStrategy', 'MomentumVolRSIStrategy']
+
+
+class BacktestDaily:
+    params = DAILY_STRATEGIES
+    param_names = ['strategy']
+
+    def time_run_backtest(self, strategy):
+        with backtest_workdir():
+            run_backtest(getattr(strategies, strategy), BTC_DAILY)
+
+
+class BacktestMinute:
+    params = ['SMACrossover', 'RSIReversion']
+    param_names = ['strategy']
+    number = 1
+    repeat = 1
+    timeout = 3600
+
+    def setup(self, strategy):
+        self.path = minute_csv(1_000_000)
+
+    def time_run_backtest(self, strategy):
+        with backtest_workdir():
+            run_backtest(getattr(strategies, strategy), self.path)
@@ -0,0 +1,32 @@
+"""
+generate_features in memory and out of core
+"""
+import os
+from Quantlib.forecast.features import generate_features, generate_features_chunked
+from .common import TMP_DIR, minute_bars, minute_csv
+
+
+class GenerateFeatures:
+    params = [10_000, 100_000, 1_000_000]
+    param_names = ['bars']
+
+    def setup(self, bars):
+        self.df = minute_bars(bars)
+
+    def time_generate_features(self, bars):
+        generate_features(self.df)
+
+    def peakmem_generate_features(self, bars):
+        generate_features(self.df)
+
+
+class GenerateFeaturesChunked:
+    number = 1
+    repeat = 1
+    timeout = 1800
+
+    def setup(self):
+        self.path = minute_csv(1_000_000)
+
+    def time_generate_features_chunked(self):
+        generate_features_chunked(self.path, os.path.join(TMP_DIR, 'features_store'), chunk_size=200_000)
@@ -0,0 +1,35 @@
+"""
+PerformanceAnalyzer metrics on long equity curves and trade logs
+"""
+import numpy as np
+import pandas as pd
+from Quantlib.backtest.metrics import PerformanceAnalyzer
+
+
+class Metrics:
+    params = [10_000, 1_000_000]
+    param_names = ['points']
+
+    def setup(self, points):
+        rng = np.random.default_rng(3)
+        self.equity = pd.Series(100000 * np.exp(np.cumsum(rng.normal(0, 0.001, points))))
+        self.returns = self.equity.pct_change().dropna()
+        n_trades = points // 10
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_trades)))
+        sizes = np.repeat(rng.uniform(0.1, 1.0, n_trades // 2 + 1), 2)[:n_trades]
+        self.trades = pd.DataFrame({
+            'datetime': pd.date_range('2015-01-01', periods=n_trades, freq='h'),
+            'type': np.where(np.arange(n_trades) % 2 == 0, 'BUY', 'SELL'),
+            'price': prices,
+            'size': sizes,
+            'commission': prices * sizes * 0.001,
+        })
+
+    def time_sharpe_ratio(self, points):
+        PerformanceAnalyzer.sharpe_ratio(self.returns)
+
+    def time_max_drawdown(self, points):
+        PerformanceAnalyzer.max_drawdown(self.equity)
+
+    def time_compute_equity_curve(self, points):
+        PerformanceAnalyzer.compute_equity_curve(self.trades, 100000)
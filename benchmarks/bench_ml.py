@@ -0,0 +1,64 @@
+"""
+MLSignalStrategy per-bar inference
+
+ThresholdModel isolates the strategy's own per-bar cost (window rebuild and
+feature generation); the xgboost variant adds a real model and is skipped
+when xgboost is not installed.
+"""
+import time
+import numpy as np
+import backtrader as bt
+from Quantlib.backtest.engine import load_price_data
+from Quantlib.strategies import MLSignalStrategy
+from .common import BTC_DAILY, backtest_workdir
+
+FEATURES = ['return_1', 'sma_ratio_10_30', 'volatility_10', 'rsi_14']
+
+
+class ThresholdModel:
+    """Long when the last return is positive"""
+
+    def predict(self, X):
+        return (X['return_1'].to_numpy() > 0).astype(int)
+
+
+def _xgboost_model(df):
+    try:
+        from Quantlib.forecast.features import generate_features
+        from Quantlib.forecast.factory import create_model
+        import xgboost  # noqa: F401
+    except ImportError:
+        raise NotImplementedError("xgboost is not installed")
+    features = generate_features(df)
+    target = (features['close'].shift(-1) > features['close']).astype(int)
+    model = create_model('xgboost')
+    model.fit(features[FEATURES], target)
+    return model
+
+
+class MLSignalInference:
+    params = ['threshold', 'xgboost']
+    param_names = ['model']
+    number = 1
+    repeat = 3
+
+    def setup(self, model):
+        self.df = load_price_data(BTC_DAILY)
+        self.model = ThresholdModel() if model == 'threshold' else _xgboost_model(self.df)
+
+    def _run(self):
+        cerebro = bt.Cerebro(stdstats=False)
+        cerebro.adddata(bt.feeds.PandasData(dataname=self.df, datetime='datetime', openinterest=-1))
+        cerebro.addstrategy(MLSignalStrategy, model=self.model, features=FEATURES)
+        with backtest_workdir():
+            cerebro.run()
+
+    def time_backtest(self, model):
+        self._run()
+
+    def track_us_per_bar(self, model):
+        start = time.perf_counter()
+        self._run()
+        return (time.perf_counter() - start) / len(self.df) * 1e6
+
+    track_us_per_bar.unit = 'us/bar'
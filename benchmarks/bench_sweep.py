@@ -0,0 +1,28 @@
+"""
+Parameter sweep throughput in backtests per second
+"""
+import time
+from Quantlib.backtest.engine import load_price_data, run_many
+from Quantlib.strategies import SMACrossover
+from .common import BTC_DAILY, backtest_workdir
+
+GRID = [(short, long) for short in (5, 10, 15, 20) for long in (30, 50)]
+
+
+class Sweep:
+    number = 1
+    repeat = 1
+    timeout = 1200
+
+    def setup(self):
+        self.df = load_price_data(BTC_DAILY)
+        self.specs = {f'sma_{s}_{l}': (SMACrossover, {'short_period': s, 'long_period': l}) for s, l in GRID}
+
+    def track_backtests_per_second(self):
+        start = time.perf_counter()
+        with backtest_workdir():
+            run_many(self.specs, self.df)
+        return len(self.specs) / (time.perf_counter() - start)
+
+    track_backtests_per_second.unit = 'backtests/s'
+    track_backtests_per_second.higher_is_better = True
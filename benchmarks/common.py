@@ -0,0 +1,51 @@
+"""
+Shared data and helpers for the benchmark suite
+"""
+import atexit
+import contextlib
+import functools
+import os
+import shutil
+import tempfile
+from Quantlib.data.synthetic import generate_ohlcv, write_dataset
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BTC_DAILY = os.path.join(REPO_ROOT, 'data', 'BTC-Daily.csv')
+
+TMP_DIR = tempfile.mkdtemp(prefix='quantlib-bench-')
+# Scratch CSVs and backtest workdirs; removed when the process exits (each asv worker too)
+atexit.register(shutil.rmtree, TMP_DIR, ignore_errors=True)
+
+
+def minute_bars(n_bars=1_000_000, seed=7):
+    """Synthetic 1-minute OHLCV bars (regime-switching GBM with jumps)"""
+    return generate_ohlcv(n_bars, timeframe='1m', seed=seed)
+
+
+@functools.lru_cache(maxsize=None)
+def minute_csv(n_bars=1_000_000):
+    """Path of a cached CSV of minute_bars(n_bars), written once per process"""
+    path = os.path.join(TMP_DIR, f'minute_{n_bars}.csv')
+    write_dataset(minute_bars(n_bars), path)
+    return path
+
+
+@contextlib.contextmanager
+def backtest_workdir():
+    """
+    Run inside a scratch directory with a data/ folder and silenced stdout
+
+    run_backtest writes data/trades_df.csv relative to the working directory
+    and the strategies log every fill; neither should touch the repo or the
+    terminal while timing.
+    """
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(dir=TMP_DIR)
+    os.makedirs(os.path.join(workdir, 'data'))
+    os.chdir(workdir)
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield workdir
+    finally:
+        os.chdir(cwd)
+
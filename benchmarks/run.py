@@ -0,0 +1,201 @@
+"""
+Run the benchmark suite without asv and track results per commit
+
+The benchmark modules follow asv conventions (classes with setup(),
+time_*/track_*/peakmem_* methods, params/param_names, number/repeat), so
+`asv run` works on them as well. This runner executes them in-process,
+writes benchmarks/results/<commit>.json and, with --compare, flags every
+benchmark that got worse than the reference commit by more than
+--threshold. It exits with status 1 on a regression, so it can gate CI.
+
+Usage:
+    python -m benchmarks.run                          # full suite
+    python -m benchmarks.run -b Metrics -b GenerateFeatures --repeat 1
+    python -m benchmarks.run --compare HEAD~1 --threshold 1.2
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+PREFIXES = ('time_', 'track_', 'peakmem_')
+
+
+def _git(*args):
+    try:
+        return subprocess.check_output(['git', *args], cwd=BENCH_DIR, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def current_commit():
+    """Short hash of HEAD, suffixed with -dirty when tracked files changed"""
+    commit = _git('rev-parse', '--short', 'HEAD') or 'unknown'
+    return commit + '-dirty' if _git('status', '--porcelain', '--untracked-files=no') else commit
+
+
+def _param_sets(cls):
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    names = getattr(cls, 'param_names', [])
+    if len(names) <= 1 and not (params and isinstance(params[0], (list, tuple))):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def discover(patterns=None):
+    """
+    Yield (name, cls, method_name, params) for every benchmark
+
+    Args:
+        patterns: Regexes matched against 'Class.method(params)'; all if empty
+    """
+    for module_info in sorted(pkgutil.iter_modules([BENCH_DIR]), key=lambda m: m.name):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'benchmarks.{module_info.name}')
+        for cls_name, cls in vars(module).items():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            for method in sorted(m for m in vars(cls) if m.startswith(PREFIXES)):
+                for params in _param_sets(cls):
+                    suffix = f"({', '.join(map(str, params))})" if params else ''
+                    name = f'{cls_name}.{method}{suffix}'
+                    if not patterns or any(re.search(p, name) for p in patterns):
+                        yield name, cls, method, params
+
+
+def run_one(cls, method, params, repeat=None):
+    """
+    Run one benchmark
+
+    Returns:
+        dict with value, unit and kind, or None when setup raised
+        NotImplementedError (asv's way of skipping a benchmark)
+    """
+    instance = cls()
+    number = getattr(cls, 'number', 1)
+    repeat = repeat or getattr(cls, 'repeat', 3)
+    func = getattr(instance, method)
+    try:
+        if hasattr(instance, 'setup'):
+            instance.setup(*params)
+    except NotImplementedError:
+        return None
+
+    try:
+        if method.startswith('time_'):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(number):
+                    func(*params)
+                samples.append((time.perf_counter() - start) / number)
+            return {'kind': 'time', 'value': statistics.median(samples), 'unit': 's',
+                    'samples': samples}
+        if method.startswith('peakmem_'):
+            tracemalloc.start()
+            try:
+                func(*params)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            return {'kind': 'peakmem', 'value': peak / 2 ** 20, 'unit': 'MB'}
+        value = func(*params)
+        return {'kind': 'track', 'value': float(value), 'unit': getattr(func, 'unit', ''),
+                'higher_is_better': getattr(func, 'higher_is_better', False)}
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*params)
+
+
+def load_results(ref):
+    """Results file of a commit (any git revision) or a path"""
+    if os.path.exists(ref):
+        path = ref
+    else:
+        commit = _git('rev-parse', '--short', ref) or ref
+        path = os.path.join(RESULTS_DIR, f'{commit}.json')
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, reference, threshold):
+    """
+    Ratio of each benchmark to the reference run (>1 means worse)
+
+    Returns:
+        list of (name, old, new, ratio, regressed)
+    """
+    rows = []
+    for name, new in results.items():
+        old = reference.get(name)
+        if old is None or not old['value'] or not new['value']:
+            continue
+        ratio = new['value'] / old['value']
+        if new.get('higher_is_better'):
+            ratio = 1 / ratio
+        rows.append((name, old['value'], new['value'], ratio, ratio > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-b', '--bench', action='append', help='Regex selecting benchmarks (repeatable)')
+    parser.add_argument('--repeat', type=int, help='Override the samples per time_ benchmark')
+    parser.add_argument('--compare', help='Git revision (or results file) to compare against')
+    parser.add_argument('--threshold', type=float, default=1.2, help='Ratio counted as a regression')
+    parser.add_argument('--no-save', action='store_true', help='Do not write the results file')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, cls, method, params in discover(args.bench):
+        start = time.perf_counter()
+        result = run_one(cls, method, params, args.repeat)
+        if result is None:
+            print(f"{name:<60} skipped")
+            continue
+        results[name] = result
+        print(f"{name:<60} {result['value']:>12.6g} {result['unit']:<12} ({time.perf_counter() - start:.1f}s)")
+
+    commit = current_commit()
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f'{commit}.json')
+        with open(path, 'w') as f:
+            json.dump({
+                'commit': commit,
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                            'processor': platform.processor(), 'cpus': os.cpu_count()},
+                'results': results,
+            }, f, indent=2)
+        print(f"\nResults saved to {path}")
+
+    if args.compare:
+        reference = load_results(args.compare)
+        rows = compare(results, reference['results'], args.threshold)
+        print(f"\nCompared with {reference['commit']} (threshold {args.threshold:.2f}x):")
+        for name, old, new, ratio, regressed in rows:
+            flag = '⚠️ REGRESSION' if regressed else ''
+            print(f"{name:<60} {old:>12.6g} -> {new:<12.6g} {ratio:6.2f}x {flag}")
+        if any(row[-1] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark the vectorized PerformanceAnalyzer.compute_equity_curve against
+the original row-by-row iterrows() implementation
+"""
+import time
+import numpy as np
+import pandas as pd
+
+from Quantlib.backtest.metrics import PerformanceAnalyzer
+
+
+def compute_equity_curve_loop(trade_history, initial_cash):
+    """Original iterrows() implementation, kept here as the baseline"""
+    df = trade_history.copy()
+    position = 0
+    cash = initial_cash
+    equity = []
+
+    for i, row in df.iterrows():
+        if row['type'] == 'BUY':
+            cost = row['price'] * row['size'] + row['commission']
+            position += row['size']
+            cash -= cost
+        elif row['type'] == 'SELL' and position > 0:
+            proceeds = row['price'] * row['size'] - row['commission']
+            position -= row['size']
+            cash += proceeds
+
+        position_value = position * row['price'] if position > 0 else 0
+        equity.append(cash + position_value)
+
+    df['equity'] = equity
+    return df
+
+
+def make_trades(n_trades, seed=42):
+    """Alternating long-only round trips on a random-walk price"""
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_trades)))
+    sizes = np.repeat(rng.uniform(0.1, 1.0, n_trades // 2 + 1), 2)[:n_trades]
+    return pd.DataFrame({
+        'datetime': pd.date_range('2015-01-01', periods=n_trades, freq='h'),
+        'type': np.where(np.arange(n_trades) % 2 == 0, 'BUY', 'SELL'),
+        'price': prices,
+        'size': sizes,
+        'commission': prices * sizes * 0.001
+    })
+
+
+def time_call(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    initial_cash = 100000
+    for n_trades in [1_000, 10_000, 100_000]:
+        trades = make_trades(n_trades)
+
+        loop_result = compute_equity_curve_loop(trades, initial_cash)['equity'].to_numpy()
+        vector_result = PerformanceAnalyzer.compute_equity_curve(trades, initial_cash)['equity'].to_numpy()
+        assert np.allclose(loop_result, vector_result), "Vectorized equity curve diverges from loop"
+
+        loop_time = time_call(compute_equity_curve_loop, trades, initial_cash)
+        vector_time = time_call(PerformanceAnalyzer.compute_equity_curve, trades, initial_cash)
+        print(f"{n_trades:>8} trades | loop: {loop_time * 1000:9.2f} ms | "
+              f"vectorized: {vector_time * 1000:7.2f} ms | speedup: {loop_time / vector_time:7.1f}x")
+
+    # Mark to market on a full bar series rather than only at trade rows
+    trades = make_trades(1_000)
+    bars = pd.Series(
+        trades['price'].to_numpy(),
+        index=pd.DatetimeIndex(trades['datetime'])
+    ).resample('15min').ffill()
+    curve = PerformanceAnalyzer.compute_equity_curve(trades, initial_cash, prices=bars)
+    print(f"\nMarked to market on {len(curve)} bars, final equity: ${curve['equity'].iloc[-1]:,.2f}")
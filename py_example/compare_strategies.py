@@ -7,7 +7,7 @@ from tabulate import tabulate
 import matplotlib.pyplot as plt
 
 from Quantlib.visualization.visualize import plot_equity_curve
-from Quantlib.backtest.engine import run_backtest
+from Quantlib.backtest.engine import run_many
 
 # Import all strategies
 from Quantlib.strategies.buy_and_hold import BuyAndHoldStrategy
@@ -76,39 +76,29 @@ strategies = {
     }
 }
 
-# Run backtests and collect results
+# Run all backtests against one preloaded feed. Metrics come from the broker's
+# marked-to-market equity, so they do not match run_backtest's (see run_many)
+print("Running backtests...")
+summaries = run_many(
+    strategies,
+    DATA_PATH,
+    cash=INITIAL_CASH,
+    commission_scheme=commission_scheme,
+    slippage_scheme=slippage_scheme
+)
+
+# Collect results
 results = {}
 equity_curves = {}
-
-print("Running backtests...")
-for name, strategy in strategies.items():
-    print(f"\nTesting {name} strategy...")
-    
-    # Add common parameters
-    params = {
-        **strategy["params"],
-        "commission_scheme": commission_scheme,
-        "slippage_scheme": slippage_scheme
-    }
-    
-    # Run backtest
-    df, trades_df, performance = run_backtest(
-        strategy_class=strategy["class"],
-        data_path=DATA_PATH,
-        cash=INITIAL_CASH,
-        plot=False,
-        kwargs=params
-    )
-    
-    # Store results
+for name, performance in summaries.items():
     results[name] = {
         "Total Return (%)": performance.total_return * 100,
         "Sharpe Ratio": performance.sharpe_ratio,
         "Max Drawdown (%)": performance.max_drawdown * 100,
         "Win Rate (%)": performance.win_rate * 100,
-        "Trades": len(trades_df)
+        "Trades": performance.total_trades
     }
-    equity_curves[name] = df["equity"]
+    equity_curves[name] = performance.equity_curve
 
 # Create performance comparison table
 df_results = pd.DataFrame(results).T
@@ -9,12 +9,11 @@ from Quantlib.visualization.visualize import (
 )
 
 from Quantlib.strategies.mfi_strategy import MFIStrategy
-from Quantlib.backtest.engine import run_backtest
+from Quantlib.backtest.engine import load_price_data, run_many
+from Quantlib.backtest.results_store import run_grid
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from itertools import product
 from tqdm import tqdm
 import os
 
@@ -40,44 +39,38 @@ periods = range(5, 31, 5)  # 5, 10, 15, 20, 25, 30
 oversold_levels = range(20, 41, 5)  # 20, 25, 30, 35, 40
 overbought_levels = range(60, 81, 5)  # 60, 65, 70, 75, 80
 
-# Store results
-results = []
-
-# Run optimization
-for period, oversold, overbought in tqdm(list(product(periods, oversold_levels, overbought_levels))):
-    # Skip invalid combinations
-    if oversold >= overbought:
-        continue
-        
-    # Run backtest with current parameters
-    df, trades_df, performance = run_backtest(
-        strategy_class=MFIStrategy,
-        data_path="data/BTC-Daily.csv",
-        cash=100000,
-        plot=False,
-        kwargs={
-            'trade_size': 0.5,  # Use 50% of portfolio per trade
-            'period': period,
-            'oversold': oversold,
-            'overbought': overbought,
-            'commission_scheme': commission_scheme,
-            'slippage_scheme': slippage_scheme
-        }
-    )
-    
-    # Store results
-    results.append({
-        'period': period,
-        'oversold': oversold,
-        'overbought': overbought,
-        'total_return': performance.total_return,
-        'sharpe_ratio': performance.sharpe_ratio,
-        'max_drawdown': performance.max_drawdown,
-        'total_trades': performance.total_trades
-    })
-
-# Convert results to DataFrame
-results_df = pd.DataFrame(results)
+# Worker split for running the grid from several processes or machines that
+# share save_dir, e.g. `python run_optimize_mfi.py 1 4`
+worker_index = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+# Run optimization; every finished trial is checkpointed, so re-running
+# after a crash skips the combinations that already completed
+progress_bar = tqdm()
+
+def update_progress(n_done, n_total):
+    progress_bar.total = n_total
+    progress_bar.update(1)
+
+results_df = run_grid(
+    MFIStrategy,
+    "data/BTC-Daily.csv",
+    grid={
+        'period': periods,
+        'oversold': oversold_levels,
+        'overbought': overbought_levels,
+    },
+    results_dir=os.path.join(save_dir, 'trials'),
+    constraint=lambda p: p['oversold'] < p['overbought'],  # Skip invalid combinations
+    fixed_params={'trade_size': 0.5},  # Use 50% of portfolio per trade
+    cash=100000,
+    commission_scheme=commission_scheme,
+    slippage_scheme=slippage_scheme,
+    worker_index=worker_index,
+    n_workers=n_workers,
+    progress=update_progress
+)
+progress_bar.close()
 
 # Find best parameters by different metrics
 best_return = results_df.loc[results_df['total_return'].idxmax()]
@@ -187,27 +180,30 @@ for metric in ['total_return', 'sharpe_ratio', 'max_drawdown']:
 
 print(f"Heatmaps have been saved in {save_dir} directory.")
 
-# Run final backtest with best Sharpe parameters and generate plots
-df, trades_df, performance = run_backtest(
-    strategy_class=MFIStrategy,
-    data_path="data/BTC-Daily.csv",
-    cash=100000,
-    plot=True,
-    kwargs={
+# Re-run the best Sharpe parameters through run_many, the path the grid was
+# scored with, so the report matches the optimization metrics
+performance = run_many(
+    {'best_sharpe': (MFIStrategy, {
         'trade_size': 0.5,
         'period': int(best_sharpe['period']),
         'oversold': int(best_sharpe['oversold']),
         'overbought': int(best_sharpe['overbought']),
-        'commission_scheme': commission_scheme,
-        'slippage_scheme': slippage_scheme
-    }
-)
+    })},
+    "data/BTC-Daily.csv",
+    cash=100000,
+    commission_scheme=commission_scheme,
+    slippage_scheme=slippage_scheme
+)['best_sharpe']
 
 # Print all performance metrics for best parameters
 print("\nDetailed Performance for Best Sharpe Parameters:")
 performance.print_all()
 
 # Generate plots
-plot_equity_curve(df["equity"])
-plot_drawdown(df["equity"])
-plot_signals(df, df.get("buy_signal"), df.get("sell_signal")) 
\ No newline at end of file
+prices = load_price_data("data/BTC-Daily.csv").set_index("datetime")
+trades = performance.trades
+buy_times = pd.to_datetime(trades.loc[trades["type"] == "buy", "datetime"])
+sell_times = pd.to_datetime(trades.loc[trades["type"] == "sell", "datetime"])
+plot_equity_curve(performance.equity_curve)
+plot_drawdown(performance.equity_curve)
+plot_signals(prices, prices["close"].where(prices.index.isin(buy_times)), prices["close"].where(prices.index.isin(sell_times)))
@@ -9,12 +9,9 @@ from Quantlib.visualization.visualize import (
 )
 
 from Quantlib.strategies.rsi_bollinger_strategy import RSIBollingerStrategy
-from Quantlib.backtest.engine import run_backtest
-import pandas as pd
-import numpy as np
+from Quantlib.backtest.results_store import run_grid
 import matplotlib.pyplot as plt
 import seaborn as sns
-from itertools import product
 from tqdm import tqdm
 import os
 
@@ -42,76 +39,44 @@ rsi_overbought_levels = range(60, 81, 5)  # 60, 65, 70, 75, 80
 bb_periods = range(10, 31, 5)  # 10, 15, 20, 25, 30
 bb_devfactors = [1.5, 2.0, 2.5, 3.0]  # Standard deviation multipliers
 
-# Store results
-results = []
+# Worker split for running the grid from several processes or machines that
+# share save_dir, e.g. `python run_optimize_rsi_bollinger.py 1 4`
+worker_index = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
 
-# Calculate total combinations for progress bar
-total_combinations = len(list(product(
-    rsi_periods, 
-    rsi_oversold_levels, 
-    rsi_overbought_levels,
-    bb_periods,
-    bb_devfactors
-)))
-
-# Test each parameter combination
+# Test each parameter combination; every finished trial is checkpointed, so
+# re-running after a crash skips the combinations that already completed
 print("\nOptimizing RSI + Bollinger Bands parameters...")
-progress_bar = tqdm(total=total_combinations, desc="Testing combinations")
-
-for rsi_period, oversold, overbought, bb_period, bb_dev in product(
-    rsi_periods, 
-    rsi_oversold_levels, 
-    rsi_overbought_levels,
-    bb_periods,
-    bb_devfactors
-):
-    # Skip invalid RSI level combinations
-    if oversold >= overbought:
-        progress_bar.update(1)
-        continue
-        
-    try:
-        # Run backtest with current parameters
-        df, trades_df, performance = run_backtest(
-            strategy_class=RSIBollingerStrategy,
-            data_path="data/BTC-Daily.csv",
-            cash=100000,
-            plot=False,
-            kwargs={
-                'rsi_period': rsi_period,
-                'rsi_oversold': oversold,
-                'rsi_overbought': overbought,
-                'bb_period': bb_period,
-                'bb_devfactor': bb_dev,
-                'commission_scheme': commission_scheme,
-                'slippage_scheme': slippage_scheme,
-                'trade_size': 0.5  # Use 50% of portfolio per trade
-            }
-        )
-        
-        # Store results
-        results.append({
-            'rsi_period': rsi_period,
-            'rsi_oversold': oversold,
-            'rsi_overbought': overbought,
-            'bb_period': bb_period,
-            'bb_devfactor': bb_dev,
-            'total_return': performance.total_return,
-            'sharpe_ratio': performance.sharpe_ratio,
-            'max_drawdown': performance.max_drawdown,
-            'total_trades': performance.total_trades,
-            'win_rate': performance.win_rate
-        })
-        
-    except Exception as e:
-        print(f"\nError with parameters (RSI Period={rsi_period}, Oversold={oversold}, Overbought={overbought}, BB Period={bb_period}, BB Dev={bb_dev}): {str(e)}")
-    
+progress_bar = tqdm(desc="Testing combinations")
+
+def update_progress(n_done, n_total):
+    progress_bar.total = n_total
     progress_bar.update(1)
 
-progress_bar.close()
+results_df = run_grid(
+    RSIBollingerStrategy,
+    "data/BTC-Daily.csv",
+    grid={
+        'rsi_period': rsi_periods,
+        'rsi_oversold': rsi_oversold_levels,
+        'rsi_overbought': rsi_overbought_levels,
+        'bb_period': bb_periods,
+        'bb_devfactor': bb_devfactors,
+    },
+    results_dir=os.path.join(save_dir, 'trials'),
+    constraint=lambda p: p['rsi_oversold'] < p['rsi_overbought'],  # Skip invalid RSI level combinations
+    fixed_params={'trade_size': 0.5},  # Use 50% of portfolio per trade
+    cash=100000,
+    commission_scheme=commission_scheme,
+    slippage_scheme=slippage_scheme,
+    worker_index=worker_index,
+    n_workers=n_workers,
+    progress=update_progress
+)
 
-# Convert results to DataFrame
-results_df = pd.DataFrame(results)
+progress_bar.close()
+results_df = results_df[['rsi_period', 'rsi_oversold', 'rsi_overbought', 'bb_period', 'bb_devfactor',
+                         'total_return', 'sharpe_ratio', 'max_drawdown', 'total_trades', 'win_rate']]
 
 # Save full results to CSV
 results_df.to_csv(os.path.join(save_dir, 'rsi_bollinger_optimization_results.csv'), index=False)
@@ -0,0 +1,60 @@
+"""
+Optimize RSI + Bollinger Bands parameters with successive halving
+
+Samples configurations from the same ranges as run_optimize_rsi_bollinger.py,
+but screens them on a short window first and only runs the survivors on the
+full history. Re-running the script resumes from the stored trials.
+"""
+import os
+
+from Quantlib.backtest.optimizer import successive_halving
+from Quantlib.strategies.rsi_bollinger_strategy import RSIBollingerStrategy
+
+save_dir = 'data/optimization_rsi_bollinger'
+os.makedirs(save_dir, exist_ok=True)
+
+commission_scheme = {
+    'commission': 0.002,  # 0.2% trading fee
+    'margin': None,  # No margin trading
+    'mult': 1.0,  # No leverage
+}
+
+slippage_scheme = {
+    'slip_perc': 0.001,  # 0.1% slippage
+    'slip_fixed': 0.0,  # No fixed slippage
+    'slip_open': True,  # Apply slippage on open orders
+}
+
+space = {
+    'rsi_period': range(5, 31, 5),
+    'rsi_oversold': range(20, 41, 5),
+    'rsi_overbought': range(60, 81, 5),
+    'bb_period': range(10, 31, 5),
+    'bb_devfactor': [1.5, 2.0, 2.5, 3.0],
+}
+
+if __name__ == "__main__":
+    best_params, results_df = successive_halving(
+        RSIBollingerStrategy,
+        "data/BTC-Daily.csv",
+        space,
+        objective='sharpe_ratio',
+        n_trials=81,
+        eta=3,
+        min_fraction=0.1,
+        constraint=lambda p: p['rsi_oversold'] < p['rsi_overbought'],
+        fixed_params={'trade_size': 0.5},
+        cash=100000,
+        commission_scheme=commission_scheme,
+        slippage_scheme=slippage_scheme,
+        n_jobs=-1,
+        results_dir=os.path.join(save_dir, 'halving_trials'),
+        seed=42
+    )
+
+    results_df.to_csv(os.path.join(save_dir, 'rsi_bollinger_halving_results.csv'), index=False)
+
+    print("\nBest Parameters by Sharpe Ratio (full history):")
+    for key, value in best_params.items():
+        print(f"{key:15}: {value}")
+    print(results_df[results_df['fraction'] == 1.0].head(10))
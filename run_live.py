@@ -1,15 +1,29 @@
-import time
-import pandas as pd
-from binance import ThreadedWebsocketManager
+import asyncio
 from Quantlib.execution.binance_broker import BinanceBroker
-from Quantlib.execution.trade_executor import LiveExecutor
-from Quantlib.forecast.predictor.tree_predictor import TreePredictor
+from Quantlib.execution.order_manager import OrderManager
+from Quantlib.forecast.model_registry import ModelRegistry
+from Quantlib.forecast.live_features import LiveFeatureEngine
 from Quantlib.execution.live_ml_strategy import LiveMLStrategy
+from Quantlib.execution.live_runtime import LiveRuntime, PollingCSVSource, WebsocketKlineSource
+from Quantlib.execution.multi_symbol import MultiSymbolRuntime, MultiplexKlineSource
+from Quantlib.execution.symbol_config import SYMBOL_CONFIG
 
-def run_live(api_key, api_secret, model_path, symbol="BTCUSDT", features=["sma_ratio", "volatility"], qty=0.001, interval=60, use_websocket=False):
+def warm_feature_engine(broker, symbol, feature_config=None, interval='1m'):
+    """Incremental feature engine warmed up with the symbol's recent closed klines"""
+    feature_engine = LiveFeatureEngine(feature_config)
+    klines = broker.client.futures_klines(symbol=symbol, interval=interval, limit=feature_engine.warmup_bars + 1)
+    feature_engine.warmup([
+        {"open": float(k[1]), "high": float(k[2]), "low": float(k[3]), "close": float(k[4]), "volume": float(k[5])}
+        for k in klines[:-1]  # The last kline is still open
+    ])
+    return feature_engine
+
+def run_live(api_key, api_secret, model_path, symbol="BTCUSDT", features=["sma_ratio", "volatility"], qty=0.001, interval=60, use_websocket=False, feature_config=None, model_type="xgboost", reload_interval=5.0):
     broker = BinanceBroker(api_key, api_secret, use_futures=True)
-    executor = LiveExecutor(broker, default_symbol=symbol)
-    model = TreePredictor(model_path)
+    # Trades towards the signal's target position from a local position cache
+    executor = OrderManager(broker)
+    # Retrained models written to model_path go live between bars
+    model = ModelRegistry(model_type, model_path, features=features, poll_interval=reload_interval).start()
 
     strategy = LiveMLStrategy(
         executor=executor,
@@ -21,32 +35,59 @@ def run_live(api_key, api_secret, model_path, symbol="BTCUSDT", features=["sma_r
 
     print("🚀 Live trading started on symbol:", symbol)
     if use_websocket:
-        def handle_socket(msg):
-            try:
-                k = msg['k']
-                data_row = {
-                    "datetime": k["t"],
-                    "close": float(k["c"]),
-                    # Simulated feature values (replace with actual feature calc)
-                    "sma_ratio": 1.01,
-                    "volatility": 0.015
-                }
-                strategy.on_new_tick(data_row)
-            except Exception as e:
-                print("⚠️ WebSocket error:", e)
-
-        twm = ThreadedWebsocketManager(api_key=api_key, api_secret=api_secret)
-        twm.start()
-        twm.start_kline_socket(callback=handle_socket, symbol=symbol.lower(), interval='1m')
-        while True:
-            time.sleep(1)
+        source = WebsocketKlineSource(api_key, api_secret, symbol, interval='1m')
 
+        feature_engine = warm_feature_engine(broker, symbol, feature_config)
+        runtime = LiveRuntime(source, strategy, feature_fn=feature_engine, drop_stale=True)
     else:
-        while True:
-            try:
-                df = pd.read_csv("data/BTCUSDT.csv")
-                latest_row = df.iloc[-1].to_dict()
-                strategy.on_new_tick(latest_row)
-            except Exception as e:
-                print("⚠️ Polling error:", e)
-            time.sleep(interval)
\ No newline at end of file
+        source = PollingCSVSource("data/BTCUSDT.csv", interval=interval)
+        runtime = LiveRuntime(source, strategy, drop_stale=True)
+
+    try:
+        asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(runtime.latency.summary())
+
+
+def run_live_multi(api_key, api_secret, model_paths, symbols=None, features=["sma_ratio", "volatility"], qty=None, feature_config=None, model_type="xgboost", reload_interval=5.0):
+    """
+    Trade several symbols over one multiplexed websocket, one pipeline per symbol
+
+    Args:
+        model_paths: Model path shared by every symbol, or dict of symbol -> path
+        symbols: Symbols to trade (default: every symbol in SYMBOL_CONFIG)
+        qty: Order size per symbol as a number or dict (default: each symbol's min_qty)
+    """
+    symbols = list(symbols or SYMBOL_CONFIG)
+    broker = BinanceBroker(api_key, api_secret, use_futures=True)
+    exchange_info = broker.get_exchange_info()
+
+    # One manager for every symbol: signals that arrive while an order batch
+    # is in flight go out together in the next submit_orders call
+    executor = OrderManager(broker, exchange_info=exchange_info)
+
+    strategies, feature_fns, models = {}, {}, {}
+    for symbol in symbols:
+        path = model_paths[symbol] if isinstance(model_paths, dict) else model_paths
+        size = qty.get(symbol) if isinstance(qty, dict) else qty
+        if path not in models:
+            models[path] = ModelRegistry(model_type, path, features=features, poll_interval=reload_interval).start()
+        strategies[symbol] = LiveMLStrategy(
+            executor=executor,
+            model=models[path],
+            symbol=symbol,
+            qty=size if size is not None else SYMBOL_CONFIG.get(symbol, {}).get("min_qty", 0.001),
+            features=features
+        )
+        feature_fns[symbol] = warm_feature_engine(broker, symbol, feature_config)
+
+    print("🚀 Live trading started on symbols:", ", ".join(symbols))
+    runtime = MultiSymbolRuntime(MultiplexKlineSource(api_key, api_secret, symbols), strategies, feature_fns=feature_fns, drop_stale=True)
+    try:
+        asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(runtime.summary())
@@ -15,6 +15,7 @@ setup(
         "xgboost",
         "torch",
         "python-binance",
+        "aiohttp",
         "nbformat"
     ],
     include_package_data=True,